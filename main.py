@@ -16,13 +16,13 @@ SRS Flow:
 import sys
 import os
 import tkinter as tk
+from tkinter import messagebox
 
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
 from src.core.system import System
-from src.interfaces.control_panel import SafeHomeControlPanel
-from src.interfaces.web_interface import WebInterface
+from src.virtual_devices import device_errors, safehome_sensor_test_gui
 
 
 def main():
@@ -30,13 +30,20 @@ def main():
     print("SafeHome System")
     print("=" * 60)
 
-    system = System()
-    print(f"[OK] System created (State: {system.status})")
-
     # Root is hidden; only Control Panel and Web Interface windows are shown.
     root = tk.Tk()
     root.withdraw()
 
+    # The core is headless; this runner shows device errors as dialogs and
+    # lets the sensor tester window open on the shared root.
+    device_errors.set_reporter(
+        lambda title, message: messagebox.showerror(title, message, parent=root)
+    )
+    safehome_sensor_test_gui.install(root)
+
+    system = System()
+    print(f"[OK] System created (State: {system.status})")
+
     windows = []
     shutting_down = {"value": False}
 
@@ -55,11 +62,16 @@ def main():
                 win.destroy()
         root.quit()
 
+    # Each interface is imported just before it is built, so the Control
+    # Panel is on screen before the web pages and their imports are loaded.
     try:
+        from src.interfaces.control_panel import SafeHomeControlPanel
+
         control_panel = SafeHomeControlPanel(root, system)
         control_panel.title("SafeHome Control Panel")
         control_panel.protocol("WM_DELETE_WINDOW", quit_all)
         windows.append(control_panel)
+        control_panel.update_idletasks()
         print("[OK] Control Panel created (OFF state - press 1 to start)")
     except Exception as e:  # pragma: no cover
         print(f"[ERROR] Control Panel: {e}")
@@ -68,6 +80,8 @@ def main():
         traceback.print_exc()
 
     try:
+        from src.interfaces.web_interface import WebInterface
+
         system.turn_on()
         web_interface = WebInterface(system, root)
         web_interface.title("SafeHome Web Interface")
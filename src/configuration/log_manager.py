@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional, Sequence
 
 from .log import Log
 from .storage_manager import StorageManager
@@ -39,6 +39,34 @@ class LogManager:
             logs = [log for log in logs if log.event_type == event_type]
         return logs
 
+    def get_logs_page(
+        self,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = 100,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Log]:
+        """Retrieve one page of logs (newest first), filtered in the database.
+
+        Pass ``after_id`` to fetch only entries newer than one already shown,
+        or ``before_id`` to page back through older history.
+        """
+        rows = self._storage_manager.query_logs(
+            after_id=after_id,
+            before_id=before_id,
+            limit=limit,
+            event_types=list(event_types) if event_types else None,
+            since=since.isoformat() if since else None,
+            until=until.isoformat() if until else None,
+        )
+        return [Log.from_dict(row) for row in rows]
+
+    def get_event_types(self) -> List[str]:
+        """Event types present in the log."""
+        return self._storage_manager.get_log_event_types()
+
     def get_logs_by_date_range(
         self, start_date: datetime, end_date: datetime
     ) -> List[Log]:
@@ -50,4 +50,8 @@ CREATE TABLE IF NOT EXISTS logs (
     severity TEXT DEFAULT 'INFO',
     user TEXT
 );
+
+-- Log filters page by log_id within an event type or a time range
+CREATE INDEX IF NOT EXISTS idx_logs_event_type ON logs (event_type, log_id);
+CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp);
 """
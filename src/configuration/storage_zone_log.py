@@ -3,7 +3,7 @@
 from __future__ import annotations
 import json
 from datetime import datetime
-from typing import Any, Dict, List, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .storage_manager import StorageManager
@@ -59,6 +59,51 @@ class StorageZoneLogQueries:
         )
         return rows or []
 
+    def query_logs(
+        self: "StorageManager",
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = 100,
+        event_types: Optional[Sequence[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Page through logs by ``log_id`` cursor, newest first.
+
+        ``after_id`` returns the oldest ``limit`` rows newer than it (so
+        repeated calls catch up without gaps); otherwise the newest rows
+        older than ``before_id``. ``since``/``until`` are ISO timestamps
+        (``since`` inclusive, ``until`` exclusive).
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if after_id is not None:
+            clauses.append("log_id > ?")
+            params.append(after_id)
+        if before_id is not None:
+            clauses.append("log_id < ?")
+            params.append(before_id)
+        if event_types:
+            clauses.append(f"event_type IN ({', '.join('?' * len(event_types))})")
+            params.extend(event_types)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "ASC" if after_id is not None else "DESC"
+        rows = self.execute_query(
+            f"""SELECT log_id, timestamp, event_type, description, severity, user FROM logs {where} ORDER BY log_id {order} LIMIT ?""",
+            (*params, limit),
+        ) or []
+        return rows[::-1] if after_id is not None else rows
+
+    def get_log_event_types(self: "StorageManager") -> List[str]:
+        rows = self.execute_query("SELECT DISTINCT event_type FROM logs ORDER BY event_type")
+        return [row["event_type"] for row in rows or []]
+
     def save_log(self: "StorageManager", log: Dict[str, Any]) -> bool:
         timestamp = log.get("timestamp")
         if isinstance(timestamp, datetime):
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import threading
-from typing import Dict, List, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
 
 from ..devices.cameras.safehome_camera import SafeHomeCamera
 
 
 class CameraControllerBase:
-    """Holds shared state for all controller mixins."""
+    """Holds shared state for all controller mixins.
+
+    The camera registries are copy-on-write: ``_lock`` only serializes adding
+    and removing cameras, which swap in new list/dict objects, so lookups
+    and iteration read the current registry without taking any lock.
+    """
 
     CONTROL_ZOOM_IN = 1
     CONTROL_ZOOM_OUT = 2
@@ -19,6 +26,11 @@ class CameraControllerBase:
     MIN_COORD = 0
     MAX_COORD = 1000
 
+    # Frame rendering pool shared by every controller in the process
+    RENDER_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+    _render_pool: Optional[ThreadPoolExecutor] = None
+    _render_pool_lock = threading.Lock()
+
     def __init__(self) -> None:
         self.next_camera_id: int = 1
         self.total_camera_number: int = 0
@@ -42,32 +54,45 @@ class CameraControllerBase:
     # ------------------------------------------------------------------
 
     def _register_camera(self, camera: SafeHomeCamera) -> None:
-        self._camera_list.append(camera)
-        self._cameras[camera.get_id()] = camera
+        self._cameras = {**self._cameras, camera.get_id(): camera}
+        self._camera_list = [*self._camera_list, camera]
         self.total_camera_number = len(self._camera_list)
 
     def _remove_camera(self, camera_id: int) -> SafeHomeCamera | None:
-        camera = self._cameras.pop(camera_id, None)
+        camera = self._cameras.get(camera_id)
         if camera is None:
             return None
         self._camera_list = [
             cam for cam in self._camera_list if cam.get_id() != camera_id
         ]
+        self._cameras = {
+            cid: cam for cid, cam in self._cameras.items() if cid != camera_id
+        }
         self.total_camera_number = len(self._camera_list)
         return camera
 
     def _rebuild_indexes(self) -> None:
-        self._cameras = {}
+        cameras = {}
         max_id = 0
         for camera in self._camera_list:
             if not hasattr(camera, "get_id"):
                 continue
             camera_id = camera.get_id()
-            self._cameras[camera_id] = camera
+            cameras[camera_id] = camera
             max_id = max(max_id, camera_id)
+        self._cameras = cameras
         self.total_camera_number = len(self._camera_list)
         self.next_camera_id = max(max_id + 1, self.next_camera_id)
 
+    @classmethod
+    def _get_render_pool(cls) -> ThreadPoolExecutor:
+        with cls._render_pool_lock:
+            if CameraControllerBase._render_pool is None:
+                CameraControllerBase._render_pool = ThreadPoolExecutor(
+                    max_workers=cls.RENDER_WORKERS, thread_name_prefix="camera-render"
+                )
+            return CameraControllerBase._render_pool
+
     def _is_valid_location(self, x_coord: int, y_coord: int) -> bool:
         return self._coord_in_bounds(x_coord) and self._coord_in_bounds(y_coord)
 
@@ -3,38 +3,106 @@ Display and thumbnail helpers for CameraController.
 """
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from concurrent.futures import as_completed
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 from .camera_controller_base import CameraControllerBase
 
 
 class CameraControllerDisplayMixin(CameraControllerBase):
-    """Fetch frames from underlying devices."""
+    """Fetch frames from underlying devices.
+
+    Cameras are looked up in the copy-on-write registry without locking and
+    each device synchronizes its own rendering, so views of different
+    cameras are produced concurrently on the shared render pool.
+    """
 
     def display_single_view(self, camera_id: int) -> Optional[Any]:
-        with self._lock:
-            camera = self._cameras.get(camera_id)
-            if camera is None:
-                return None
-            if hasattr(camera, "is_enabled") and not camera.is_enabled():
-                return None
-            try:
-                return camera.display_view()
-            except Exception as exc:  # pragma: no cover - logging path
-                print(f"Error displaying view from camera {camera_id}: {exc}")
-                return None
-
-    def display_thumbnail_view(self) -> List[Tuple[int, Optional[Any]]]:
-        with self._lock:
-            thumbnails: List[Tuple[int, Optional[Any]]] = []
-            for camera in self.camera_list:
-                if not hasattr(camera, "is_enabled") or not camera.is_enabled():
-                    continue
-                camera_id = camera.get_id()
-                try:
-                    view = camera.display_view()
-                except Exception:
-                    view = None
-                thumbnails.append((camera_id, view))
-            return thumbnails
+        camera = self._viewable_camera(camera_id)
+        if camera is None:
+            return None
+        try:
+            return camera.display_view()
+        except Exception as exc:  # pragma: no cover - logging path
+            print(f"Error displaying view from camera {camera_id}: {exc}")
+            return None
+
+    def display_single_thumbnail(
+        self, camera_id: int, size: Tuple[int, int]
+    ) -> Optional[Any]:
+        camera = self._viewable_camera(camera_id)
+        if camera is None:
+            return None
+        try:
+            return camera.display_thumbnail(size)
+        except Exception as exc:  # pragma: no cover - logging path
+            print(f"Error rendering thumbnail from camera {camera_id}: {exc}")
+            return None
+
+    def display_thumbnail_view(
+        self, size: Optional[Tuple[int, int]] = None
+    ) -> List[Tuple[int, Optional[Any]]]:
+        """Render every enabled camera, in camera list order."""
+        order = [camera.get_id() for camera in self._enabled_cameras()]
+        views = dict(self.iter_views(order, size))
+        return [(camera_id, views.get(camera_id)) for camera_id in order]
+
+    def iter_views(
+        self,
+        camera_ids: Optional[Iterable[int]] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Tuple[int, Optional[Any]]]:
+        """Yield ``(camera_id, view)`` for enabled cameras as each render finishes.
+
+        ``camera_ids`` limits the cameras (default: all enabled); with ``size``
+        thumbnails are rendered instead of full views. Failed renders yield None.
+        """
+        if camera_ids is None:
+            cameras = self._enabled_cameras()
+        else:
+            registry = self._cameras
+            cameras = [
+                camera
+                for camera in (registry.get(cid) for cid in camera_ids)
+                if camera is not None and self._is_viewable(camera)
+            ]
+        if len(cameras) <= 1:
+            for camera in cameras:
+                yield camera.get_id(), self._render(camera, size)
+            return
+        pool = self._get_render_pool()
+        futures = {
+            pool.submit(self._render, camera, size): camera.get_id() for camera in cameras
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _viewable_camera(self, camera_id: int):
+        camera = self._cameras.get(camera_id)
+        if camera is None or not self._is_viewable(camera):
+            return None
+        return camera
+
+    def _enabled_cameras(self) -> List[Any]:
+        return [
+            camera
+            for camera in self.camera_list
+            if hasattr(camera, "is_enabled") and camera.is_enabled()
+        ]
+
+    @staticmethod
+    def _is_viewable(camera) -> bool:
+        return not hasattr(camera, "is_enabled") or camera.is_enabled()
 
+    @staticmethod
+    def _render(camera, size: Optional[Tuple[int, int]]) -> Optional[Any]:
+        try:
+            if size is not None:
+                return camera.display_thumbnail(size)
+            return camera.display_view()
+        except Exception:
+            return None
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from ..devices.cameras.safehome_camera_info import CameraInfo
 from .camera_controller_base import CameraControllerBase
 
 
@@ -12,29 +13,22 @@ class CameraControllerInfoMixin(CameraControllerBase):
     """Info queries plus lifecycle hooks."""
 
     def get_all_camera_info(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            camera_info_list = []
-            for camera in self.camera_list:
-                info = {
-                    "id": camera.get_id(),
-                    "location": camera.get_location(),
-                    "enabled": camera.is_enabled(),
-                    "pan": camera.get_pan_angle(),
-                    "zoom": camera.get_zoom_level(),
-                    "has_password": camera.has_password(),
-                }
-                camera_info_list.append(info)
-            return camera_info_list
+        return [info.as_dict() for info in self.get_camera_snapshots()]
+
+    def get_camera_snapshots(self) -> List[CameraInfo]:
+        """Immutable state of every camera, without blocking on busy cameras."""
+        return [CameraInfo.from_camera(camera) for camera in self.camera_list]
 
     def cleanup(self) -> None:
         with self._lock:
-            for camera in list(self._cameras.values()):
-                if hasattr(camera, "cleanup"):
-                    camera.cleanup()
-            self._cameras.clear()
-            self._camera_list.clear()
+            cameras = list(self._cameras.values())
+            self._cameras = {}
+            self._camera_list = []
             self.total_camera_number = 0
             self.next_camera_id = 1
+        for camera in cameras:
+            if hasattr(camera, "cleanup"):
+                camera.cleanup()
 
     def __del__(self) -> None:
         try:
@@ -34,16 +34,14 @@ class CameraControllerRegistryMixin(CameraControllerBase):
             return True
 
     def get_camera_by_id(self, camera_id: int) -> SafeHomeCamera:
-        with self._lock:
-            if camera_id not in self._cameras:
-                raise CameraNotFoundError(f"Camera with ID {camera_id} not found")
-            return self._cameras[camera_id]
+        camera = self._cameras.get(camera_id)
+        if camera is None:
+            raise CameraNotFoundError(f"Camera with ID {camera_id} not found")
+        return camera
 
     def get_all_cameras(self) -> List[SafeHomeCamera]:
-        with self._lock:
-            return list(self.camera_list)
+        return list(self.camera_list)
 
     def get_total_camera_number(self) -> int:
-        with self._lock:
-            return self.total_camera_number
+        return self.total_camera_number
 
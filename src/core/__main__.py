@@ -0,0 +1,5 @@
+"""Entry point for ``python -m src.core`` (headless System)."""
+
+from .headless import main
+
+raise SystemExit(main())
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict
+from typing import Callable, Dict, FrozenSet
 
 
 def build_command_map(
@@ -30,6 +30,8 @@ def build_command_map(
         "turn_off": lifecycle_handler.turn_off,
         "reset_system": lifecycle_handler.reset,
         "get_status": lifecycle_handler.get_status,
+        "subscribe_status_events": lifecycle_handler.subscribe_status,
+        "unsubscribe_status_events": lifecycle_handler.unsubscribe_status,
         # Security
         "arm_system": security_handler.arm_system,
         "disarm_system": security_handler.disarm_system,
@@ -58,6 +60,18 @@ def build_command_map(
         "get_cameras": camera_handler.get_cameras,
         "get_camera": camera_handler.get_camera,
         "get_camera_view": camera_handler.get_camera_view,
+        "get_camera_thumbnail": camera_handler.get_camera_thumbnail,
+        "get_camera_thumbnails": camera_handler.get_camera_thumbnails,
+        "get_camera_jpeg": camera_handler.get_camera_jpeg,
+        "stream_camera_mjpeg": camera_handler.stream_camera_mjpeg,
+        "subscribe_camera_frames": camera_handler.subscribe_camera_frames,
+        "unsubscribe_camera_frames": camera_handler.unsubscribe_camera_frames,
+        "start_camera_recording": camera_handler.start_camera_recording,
+        "stop_camera_recording": camera_handler.stop_camera_recording,
+        "get_recording_status": camera_handler.get_recording_status,
+        "start_motion_detection": camera_handler.start_motion_detection,
+        "stop_motion_detection": camera_handler.stop_motion_detection,
+        "set_motion_regions": camera_handler.set_motion_regions,
         "camera_pan": camera_handler.camera_pan,
         "pan_camera": camera_handler.camera_pan,
         "camera_zoom": camera_handler.camera_zoom,
@@ -75,5 +89,19 @@ def build_command_map(
         "reset_system_settings": settings_handler.reset_settings,
         "get_intrusion_log": log_handler.get_intrusion_log,
         "get_intrusion_logs": log_handler.get_intrusion_log,
+        "get_log_event_types": log_handler.get_log_event_types,
     }
 
+
+
+def state_commands(command_map: Dict[str, Callable], *stateless_handlers) -> FrozenSet[str]:
+    """Commands that read or change mode, alarm or login state.
+
+    Every command except those bound to ``stateless_handlers`` (cameras and
+    logs, which guard their own data) counts as one.
+    """
+    return frozenset(
+        name
+        for name, handler in command_map.items()
+        if not any(getattr(handler, "__self__", None) is owner for owner in stateless_handlers)
+    )
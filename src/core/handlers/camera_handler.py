@@ -22,6 +22,50 @@ class CameraHandler:
     def get_camera_view(self, camera_id="", **_) -> Dict[str, Any]:
         return self._camera_service.get_camera_view(camera_id)
 
+    def get_camera_thumbnail(self, camera_id="", size=None, **_) -> Dict[str, Any]:
+        return self._camera_service.get_camera_thumbnail(camera_id, size)
+
+    def get_camera_thumbnails(self, size=None, **_) -> Dict[str, Any]:
+        return self._camera_service.get_camera_thumbnails(size)
+
+    def get_camera_jpeg(self, camera_id="", quality=None, **_) -> Dict[str, Any]:
+        return self._camera_service.get_camera_jpeg(camera_id, quality)
+
+    def stream_camera_mjpeg(
+        self, camera_id="", fps=10.0, quality=None, max_frames=None, **_
+    ) -> Dict[str, Any]:
+        return self._camera_service.stream_camera_mjpeg(
+            camera_id, fps=fps, quality=quality, max_frames=max_frames
+        )
+
+    def subscribe_camera_frames(self, camera_id="", fps=10.0, callback=None, **_) -> Dict[str, Any]:
+        return self._camera_service.subscribe_frames(camera_id=camera_id, fps=fps, callback=callback)
+
+    def unsubscribe_camera_frames(self, subscription=None, **_) -> Dict[str, Any]:
+        return self._camera_service.unsubscribe_frames(subscription=subscription)
+
+    def start_camera_recording(
+        self, output_dir="recordings", seconds=10.0, fps=2.0, post_roll=5.0, **_
+    ) -> Dict[str, Any]:
+        return self._camera_service.start_recording(
+            output_dir=output_dir, seconds=seconds, fps=fps, post_roll=post_roll
+        )
+
+    def stop_camera_recording(self, **_) -> Dict[str, Any]:
+        return self._camera_service.stop_recording()
+
+    def get_recording_status(self, **_) -> Dict[str, Any]:
+        return self._camera_service.recording_status()
+
+    def start_motion_detection(self, fps=4.0, **_) -> Dict[str, Any]:
+        return self._camera_service.start_motion_detection(fps=fps)
+
+    def stop_motion_detection(self, **_) -> Dict[str, Any]:
+        return self._camera_service.stop_motion_detection()
+
+    def set_motion_regions(self, camera_id="", regions=None, **_) -> Dict[str, Any]:
+        return self._camera_service.set_motion_regions(camera_id=camera_id, regions=regions)
+
     def camera_pan(self, camera_id="", direction="", **_) -> Dict[str, Any]:
         return self._camera_service.pan_camera(camera_id=camera_id, direction=direction)
 
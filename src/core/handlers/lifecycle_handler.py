@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List
 
 
 class LifecycleHandler:
@@ -23,6 +23,9 @@ class LifecycleHandler:
         self._camera_service = camera_service
         self._auth_service = auth_service
         self._mode_service = mode_service
+        self._status_subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        mode_service.add_change_listener(self._publish_status)
+        alarm_service.add_state_listener(self._publish_status)
 
     def turn_on(self, **_) -> Dict[str, Any]:
         success = bool(self._system.turn_on())
@@ -40,19 +43,52 @@ class LifecycleHandler:
         active_sensors = sum(1 for s in sensor_states if s.get("armed"))
         camera_states = self._camera_service.camera_info()
         enabled_cameras = sum(1 for c in camera_states if c.get("enabled"))
-        data = {
-            "state": self._alarm_service.state,
-            "mode": self._mode_service.current_mode,
-            "armed": self._mode_service.current_mode
-            != self._system.MODE_DISARMED,
-            "user": self._auth_service.current_user,
-            "verified": self._auth_service.is_verified,
-            "alarm_active": self._alarm_service.state == "ALARM",
-            "sensor_count": len(sensor_states),
-            "active_sensors": active_sensors,
-            "camera_count": len(camera_states),
-            "enabled_cameras": enabled_cameras,
-        }
+        data = self.status_snapshot()
+        data.update(
+            user=self._auth_service.current_user,
+            verified=self._auth_service.is_verified,
+            sensor_count=len(sensor_states),
+            active_sensors=active_sensors,
+            camera_count=len(camera_states),
+            enabled_cameras=enabled_cameras,
+        )
         return {"success": True, "data": data}
 
+    def status_snapshot(self) -> Dict[str, Any]:
+        """Mode and alarm state only; unlike ``get_status`` this never walks the devices."""
+        mode = self._mode_service.current_mode
+        state = self._alarm_service.state
+        return {
+            "state": state,
+            "mode": mode,
+            "armed": mode != self._system.MODE_DISARMED,
+            "alarm_active": state == "ALARM",
+        }
+
+    def subscribe_status(self, callback=None, **_) -> Dict[str, Any]:
+        """Call ``callback(status_snapshot())`` after every mode or alarm change.
+
+        The callback runs on the thread that made the change. The current
+        snapshot is returned as ``data`` so subscribers start in sync.
+        """
+        if not callable(callback):
+            return {"success": False, "message": "callback required"}
+        if callback not in self._status_subscribers:
+            self._status_subscribers.append(callback)
+        return {"success": True, "data": self.status_snapshot()}
+
+    def unsubscribe_status(self, callback=None, **_) -> Dict[str, Any]:
+        if callback in self._status_subscribers:
+            self._status_subscribers.remove(callback)
+            return {"success": True}
+        return {"success": False, "message": "Not subscribed"}
 
+    def _publish_status(self, _event: Dict[str, Any]) -> None:
+        if not self._status_subscribers:
+            return
+        snapshot = self.status_snapshot()
+        for callback in list(self._status_subscribers):
+            try:
+                callback(dict(snapshot))
+            except Exception as exc:  # pragma: no cover - a UI must not block arming
+                print(f"Status subscriber failed: {exc}")
@@ -2,30 +2,94 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
 
+from ...configuration.log import Log
 from ...configuration.log_manager import LogManager
 
 
 class LogHandler:
-    """Returns intrusion logs."""
+    """Returns intrusion logs.
+
+    Logs are read in pages keyed by ``log_id``: a view passes ``after_id``
+    (the newest id it shows) to fetch only new entries and ``before_id``
+    (the oldest) to page back; event type and date filters run in SQL.
+    """
+
+    PAGE_SIZE = 100
+    MAX_PAGE_SIZE = 1000
 
     def __init__(self, log_manager: LogManager):
         self._log_manager = log_manager
 
-    def get_intrusion_log(self, **_) -> Dict[str, Any]:
-        logs = self._log_manager.get_logs(limit=100)
-        log_data = [
-            {
-                "timestamp": (
-                    log.timestamp.strftime("%Y-%m-%d %H:%M:%S") if log.timestamp else ""
-                ),
-                "event": log.event_type,
-                "detail": log.description,
-                "severity": log.severity,
-            }
-            for log in logs
-        ]
-        return {"success": True, "data": log_data}
+    def get_intrusion_log(
+        self,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int = PAGE_SIZE,
+        event_type: Any = None,
+        since: Any = None,
+        until: Any = None,
+        **_,
+    ) -> Dict[str, Any]:
+        try:
+            start = self._parse_date(since)
+            end = self._parse_date(until, end_of_day=True)
+        except ValueError as exc:
+            return {"success": False, "message": f"Invalid date: {exc}"}
+        try:
+            limit = max(1, min(int(limit), self.MAX_PAGE_SIZE))
+            after_id = None if after_id is None else int(after_id)
+            before_id = None if before_id is None else int(before_id)
+        except (TypeError, ValueError):
+            return {"success": False, "message": "limit, after_id and before_id must be whole numbers"}
+        event_types = [event_type] if isinstance(event_type, str) else event_type
+        # One extra row tells whether another page exists in that direction
+        logs = self._log_manager.get_logs_page(
+            after_id=after_id,
+            before_id=before_id,
+            limit=limit + 1,
+            event_types=event_types,
+            since=start,
+            until=end,
+        )
+        has_more = len(logs) > limit
+        if has_more:
+            logs = logs[1:] if after_id is not None else logs[:-1]
+        return {
+            "success": True,
+            "data": [self._format(log) for log in logs],
+            "has_more": has_more,
+        }
+
+    def get_log_event_types(self, **_) -> Dict[str, Any]:
+        return {"success": True, "data": self._log_manager.get_event_types()}
 
+    @staticmethod
+    def _format(log: Log) -> Dict[str, Any]:
+        return {
+            "log_id": log.log_id,
+            "timestamp": (
+                log.timestamp.strftime("%Y-%m-%d %H:%M:%S") if log.timestamp else ""
+            ),
+            "event": log.event_type,
+            "detail": log.description,
+            "severity": log.severity,
+        }
 
+    @staticmethod
+    def _parse_date(value: Any, end_of_day: bool = False) -> Optional[datetime]:
+        """``None``, a datetime/date or an ISO string; whole days end exclusive."""
+        if value in (None, ""):
+            return None
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            day = datetime(value.year, value.month, value.day)
+            return day + timedelta(days=1) if end_of_day else day
+        text = str(value).strip()
+        parsed = datetime.fromisoformat(text)
+        if end_of_day and len(text) == 10:  # YYYY-MM-DD covers the whole day
+            parsed += timedelta(days=1)
+        return parsed
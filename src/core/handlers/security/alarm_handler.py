@@ -28,10 +28,13 @@ class AlarmCommandHandler:
         self._auth = auth_service
         self._logger = logger
 
-    def trigger(self, sensor_id="") -> Dict[str, Any]:
+    def trigger(self, sensor_id="", zone_id=None, description=None, **_) -> Dict[str, Any]:
+        """Raise the alarm; ``description``/``zone_id`` describe non-sensor sources."""
         sensor_info = "Unknown"
         sensor = self._sensors.get_sensor(sensor_id)
-        if sensor:
+        if description:
+            sensor_info = f"{sensor_id} ({description})"
+        elif sensor:
             status = sensor.get_status()
             sensor_info = (
                 f"{status.get('id', sensor_id)} "
@@ -40,11 +43,21 @@ class AlarmCommandHandler:
 
         zone_info = "Unknown"
         for zone in self._zones.get_zones():
-            if sensor_id in zone.get("sensors", []):
+            if zone_id is not None and zone.get("id") == zone_id:
                 zone_info = zone["name"]
                 break
+            if zone_id is None and sensor_id in zone.get("sensors", []):
+                zone_info = zone["name"]
+                zone_id = zone.get("id")
+                break
 
-        return self._alarm.trigger(sensor_info, zone_info, self._auth.current_user)
+        return self._alarm.trigger(
+            sensor_info,
+            zone_info,
+            self._auth.current_user,
+            sensor_id=sensor_id or None,
+            zone_id=zone_id,
+        )
 
     def clear(self, **_) -> Dict[str, Any]:
         return self._alarm.clear()
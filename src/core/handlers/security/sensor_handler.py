@@ -43,6 +43,11 @@ class SensorCommandHandler:
 
     def poll_sensors(self):
         armed_mode = self._modes.current_mode != self._modes.MODE_DISARMED
-        return self._sensors.poll_armed_sensors(armed_mode)
+        result = self._sensors.poll_armed_sensors(armed_mode)
+        if armed_mode and not result.get("intrusion_detected"):
+            motion = self._cameras.poll_motion()
+            if motion.get("intrusion_detected"):
+                return motion
+        return result
 
 
@@ -85,7 +85,11 @@ class SecurityHandler:
     def poll_sensors(self, **_) -> Dict[str, Any]:
         result = self._sensor_handler.poll_sensors()
         if result.get("intrusion_detected"):
-            alarm = self._alarm_handler.trigger(sensor_id=result.get("sensor_id"))
+            alarm = self._alarm_handler.trigger(
+                sensor_id=result.get("sensor_id"),
+                zone_id=result.get("zone_id"),
+                description=result.get("description"),
+            )
             return {**result, "alarm": alarm}
         return result
 
@@ -0,0 +1,89 @@
+"""Headless SafeHome: a ``System`` with no Tk, for servers and worker processes.
+
+``python -m src.core`` boots a System, runs the given commands through
+``handle_request`` and prints the answers as JSON. With ``--check`` it also
+fails when a Tk module was imported along the way, which is what CI runs to
+keep ``src/core``, ``src/devices`` and ``src/controllers`` GUI-free.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+TK_MODULES = ("tkinter", "_tkinter", "PIL.ImageTk")
+DEFAULT_COMMANDS = ("turn_on", "get_status")
+
+
+def build_system(db_path: str = ":memory:"):
+    """Create a fresh System backed by ``db_path`` (in-memory by default).
+
+    Device errors go to the default printing reporter and the sensor tester
+    window is never opened, since no GUI runner installed either.
+    """
+    from ..configuration.storage_manager import StorageManager
+    from .system import System
+
+    StorageManager._instance = None  # the storage singleton is keyed on first use
+    return System(db_path)
+
+
+def loaded_tk_modules() -> List[str]:
+    """Return the Tk modules imported in this process so far."""
+    return sorted(name for name in TK_MODULES if name in sys.modules)
+
+
+def parse_command(text: str) -> Tuple[str, Dict[str, Any]]:
+    """Split ``"arm_system mode=AWAY"`` into a command name and keyword arguments.
+
+    Values are read as JSON when they parse (numbers, booleans, lists) and
+    kept as strings otherwise.
+    """
+    name, *pairs = shlex.split(text)
+    kwargs = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"expected key=value, got {pair!r}")
+        try:
+            kwargs[key] = json.loads(value)
+        except ValueError:
+            kwargs[key] = value
+    return name, kwargs
+
+
+def run(system, commands) -> List[Dict[str, Any]]:
+    """Send each command string to ``system``; return the answers in order."""
+    results = []
+    for text in commands:
+        name, kwargs = parse_command(text)
+        results.append({"command": name, "result": system.handle_request("headless", name, **kwargs)})
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run SafeHome without a GUI")
+    parser.add_argument("--db", default=":memory:", help="SQLite database path")
+    parser.add_argument(
+        "--command",
+        action="append",
+        dest="commands",
+        help='command to send, e.g. "arm_system mode=AWAY" (repeatable; '
+        f"default: {', '.join(DEFAULT_COMMANDS)})",
+    )
+    parser.add_argument("--check", action="store_true", help="fail if any Tk module was imported")
+    args = parser.parse_args(argv)
+
+    system = build_system(args.db)
+    try:
+        results = run(system, args.commands or DEFAULT_COMMANDS)
+    finally:
+        system.turn_off()
+    tk_modules = loaded_tk_modules()
+    print(json.dumps({"results": results, "tk_modules": tk_modules}, indent=2, default=str))
+    if args.check and (tk_modules or not all(r["result"].get("success") for r in results)):
+        return 1
+    return 0
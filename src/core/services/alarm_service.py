@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from ..logging.system_logger import SystemLogger
 
@@ -13,26 +13,76 @@ class AlarmService:
         self._delay_time = delay_time
         self._monitor_phone = monitor_phone
         self._state = "OFF"
+        self._trigger_listeners: List[Callable[[Dict], None]] = []
+        self._state_listeners: List[Callable[[Dict], None]] = []
 
     # ------------------------------------------------------------------ #
     def turn_on(self):
-        self._state = "READY"
+        self._set_state("READY")
 
     def turn_off(self):
-        self._state = "OFF"
+        self._set_state("OFF")
 
     def panic(self):
-        self._state = "ALARM"
+        self._set_state("ALARM")
         self._logger.add_event("PANIC", f"Emergency call to {self._monitor_phone}")
         return {"success": True, "message": f"Calling {self._monitor_phone}"}
 
-    def trigger(self, sensor_info: str, zone_info: str, user: Optional[str]) -> Dict:
-        self._state = "ALARM"
+    def add_trigger_listener(self, listener: Callable[[Dict], None]) -> None:
+        """Call ``listener(event)`` whenever an intrusion alarm is triggered."""
+        if listener not in self._trigger_listeners:
+            self._trigger_listeners.append(listener)
+
+    def remove_trigger_listener(self, listener: Callable[[Dict], None]) -> None:
+        if listener in self._trigger_listeners:
+            self._trigger_listeners.remove(listener)
+
+    def add_state_listener(self, listener: Callable[[Dict], None]) -> None:
+        """Call ``listener(status_payload())`` whenever the alarm state changes."""
+        if listener not in self._state_listeners:
+            self._state_listeners.append(listener)
+
+    def remove_state_listener(self, listener: Callable[[Dict], None]) -> None:
+        if listener in self._state_listeners:
+            self._state_listeners.remove(listener)
+
+    def _set_state(self, state: str) -> None:
+        changed = state != self._state
+        self._state = state
+        if not changed:
+            return
+        event = self.status_payload()
+        for listener in list(self._state_listeners):
+            try:
+                listener(event)
+            except Exception as exc:  # pragma: no cover - never block the alarm
+                print(f"Alarm listener failed: {exc}")
+
+    def trigger(
+        self,
+        sensor_info: str,
+        zone_info: str,
+        user: Optional[str],
+        sensor_id: Optional[str] = None,
+        zone_id: Optional[int] = None,
+    ) -> Dict:
+        self._set_state("ALARM")
         self._logger.add_event(
             "INTRUSION",
             f"Sensor: {sensor_info}, Zone: {zone_info}",
             user=user,
         )
+        event = {
+            "sensor_id": sensor_id,
+            "sensor": sensor_info,
+            "zone_id": zone_id,
+            "zone": zone_info,
+        }
+        for listener in list(self._trigger_listeners):
+            try:
+                listener(event)
+            except Exception as exc:  # pragma: no cover - never block the alarm
+                print(f"Alarm listener failed: {exc}")
         return {
             "success": True,
             "alarm": True,
@@ -43,7 +93,7 @@ class AlarmService:
         }
 
     def clear(self):
-        self._state = "READY"
+        self._set_state("READY")
         return {"success": True}
 
     def status_payload(self):
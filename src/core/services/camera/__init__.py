@@ -4,10 +4,24 @@ from .camera_query import CameraQueryService
 from .camera_control import CameraControlService
 from .camera_security import CameraSecurityService
 from .camera_init import CameraInitService
+from .camera_stream import CameraFrameHub, FrameSubscription
+from .camera_encoding import MJPEG_CONTENT_TYPE, FrameEncoder, mjpeg_stream
+from .camera_recorder import CameraRecorder, FrameRingBuffer
+from .camera_motion import MotionDetector, MotionMonitor, MotionRegion
 
 __all__ = [
     "CameraQueryService",
     "CameraControlService",
     "CameraSecurityService",
     "CameraInitService",
+    "CameraFrameHub",
+    "FrameSubscription",
+    "FrameEncoder",
+    "MJPEG_CONTENT_TYPE",
+    "mjpeg_stream",
+    "CameraRecorder",
+    "FrameRingBuffer",
+    "MotionDetector",
+    "MotionMonitor",
+    "MotionRegion",
 ]
@@ -0,0 +1,100 @@
+"""Encoded (JPEG / MJPEG) camera output for remote viewers."""
+
+from __future__ import annotations
+
+import io
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+MJPEG_BOUNDARY = "frame"
+MJPEG_CONTENT_TYPE = f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}"
+
+
+class FrameEncoder:
+    """JPEG-encodes rendered frames once and reuses the bytes across viewers.
+
+    Rendered frames are shared objects that stay the same until the view
+    changes, so the last encoding per (camera, quality) is kept together with
+    the frame it came from and served again while that frame is current.
+    At most ``MAX_ENTRIES`` encodings are kept, least recently used first out,
+    so cameras that stop being viewed (or go away) do not hold memory.
+    """
+
+    DEFAULT_QUALITY = 80
+    MAX_ENTRIES = 64
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._locks: Dict[int, threading.Lock] = {}
+        self._cache: "OrderedDict[Tuple[int, int], Tuple[Any, bytes]]" = OrderedDict()
+        self._max_entries = max(1, max_entries)
+
+    def encode(self, camera_id: int, frame: Any, quality: Optional[int] = None) -> bytes:
+        quality = self.normalize_quality(quality)
+        key = (camera_id, quality)
+        with self._camera_lock(camera_id):
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] is frame:
+                    self._cache.move_to_end(key)
+                    return cached[1]
+            data = self._to_jpeg(frame, quality)
+            with self._lock:
+                self._cache[key] = (frame, data)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
+            return data
+
+    @classmethod
+    def normalize_quality(cls, quality: Optional[int]) -> int:
+        if quality is None:
+            return cls.DEFAULT_QUALITY
+        return max(1, min(95, int(quality)))
+
+    def _camera_lock(self, camera_id: int) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(camera_id, threading.Lock())
+
+    @staticmethod
+    def _to_jpeg(frame: Any, quality: int) -> bytes:
+        buffer = io.BytesIO()
+        image = frame if frame.mode == "RGB" else frame.convert("RGB")
+        image.save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+
+def mjpeg_part(jpeg: bytes, boundary: str = MJPEG_BOUNDARY) -> bytes:
+    """Wrap one JPEG as a part of a multipart/x-mixed-replace response."""
+    header = (
+        f"--{boundary}\r\n"
+        "Content-Type: image/jpeg\r\n"
+        f"Content-Length: {len(jpeg)}\r\n\r\n"
+    ).encode("ascii")
+    return header + jpeg + b"\r\n"
+
+
+def mjpeg_stream(
+    subscription,
+    encode: Callable[[Any], bytes],
+    max_frames: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[bytes]:
+    """Yield MJPEG parts for each new frame of a polled frame subscription.
+
+    The subscription is closed when the consumer stops iterating (or after
+    ``max_frames`` parts).
+    """
+    sent = 0
+    try:
+        while subscription.active and (max_frames is None or sent < max_frames):
+            frame = subscription.poll()
+            if frame is None:
+                sleep(subscription.interval)
+                continue
+            yield mjpeg_part(encode(frame))
+            sent += 1
+    finally:
+        subscription.close()
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class CameraInitService:
     """Handles camera initialization from configuration."""
 
-    def __init__(self, controller, camera_lookup: Dict[str, int], camera_labels: Dict[int, str]):
+    def __init__(
+        self,
+        controller,
+        camera_lookup: Dict[str, int],
+        camera_labels: Dict[int, str],
+        camera_zones: Optional[Dict[int, int]] = None,
+    ):
         self._controller = controller
         self._lookup = camera_lookup
         self._labels = camera_labels
+        self._zones = camera_zones if camera_zones is not None else {}
 
     def initialize(self, camera_data: List[Dict]):
         for cam in camera_data:
@@ -26,6 +33,8 @@ class CameraInitService:
             label = cam.get("location", cam_name)
             self._lookup[cam_name] = controller_id
             self._labels[controller_id] = label
+            if cam.get("zone") is not None:
+                self._zones[controller_id] = cam["zone"]
             camera = self._controller.get_camera_by_id(controller_id)
             if camera:
                 camera.enable()
@@ -0,0 +1,197 @@
+"""Camera-based motion detection by differencing successive frames."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # numpy and PIL are imported when the first frame is analysed
+    import numpy as np
+
+Box = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class MotionRegion:
+    """Part of a camera view watched for motion.
+
+    ``box`` is ``(left, top, right, bottom)`` as fractions of the frame. A
+    pixel counts as changed when its grey level moved by more than
+    ``pixel_threshold``; the region reports motion when more than
+    ``area_threshold`` of its pixels changed.
+    """
+
+    name: str = "full"
+    box: Box = (0.0, 0.0, 1.0, 1.0)
+    pixel_threshold: int = 25
+    area_threshold: float = 0.02
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MotionRegion":
+        return cls(
+            name=str(data.get("name", cls.name)),
+            box=tuple(float(v) for v in data.get("box", cls.box)),
+            pixel_threshold=int(data.get("pixel_threshold", cls.pixel_threshold)),
+            area_threshold=float(data.get("area_threshold", cls.area_threshold)),
+        )
+
+
+class MotionDetector:
+    """Compares each camera's frame with its previous one, per region.
+
+    Frames are reduced to ``size`` greyscale arrays first, so the diff costs
+    the same whatever the camera resolution. Handing over the same frame
+    object again (an unchanged view) is free and never reports motion.
+    """
+
+    ANALYSIS_SIZE: Tuple[int, int] = (64, 48)
+
+    def __init__(self, size: Tuple[int, int] = ANALYSIS_SIZE):
+        self.size = (int(size[0]), int(size[1]))
+        self._lock = threading.Lock()
+        self._regions: Dict[int, Tuple[MotionRegion, ...]] = {}
+        self._masks: Dict[int, List[Tuple[MotionRegion, Tuple[slice, slice]]]] = {}
+        self._previous: Dict[int, Tuple[Any, np.ndarray]] = {}
+
+    def set_regions(self, camera_id: int, regions: Iterable[MotionRegion]) -> None:
+        regions = tuple(regions)
+        with self._lock:
+            if regions:
+                self._regions[camera_id] = regions
+            else:
+                self._regions.pop(camera_id, None)
+            self._masks.pop(camera_id, None)
+
+    def regions(self, camera_id: int) -> Tuple[MotionRegion, ...]:
+        return self._regions.get(camera_id, (MotionRegion(),))
+
+    def reset(self, camera_id: Optional[int] = None) -> None:
+        """Forget the previous frame (e.g. after a PTZ move) so it is not diffed."""
+        with self._lock:
+            if camera_id is None:
+                self._previous.clear()
+            else:
+                self._previous.pop(camera_id, None)
+
+    def process(self, camera_id: int, frame: Any) -> List[str]:
+        """Return the names of the regions where ``frame`` differs from the last one."""
+        import numpy as np
+
+        with self._lock:
+            previous = self._previous.get(camera_id)
+        if frame is None or (previous is not None and previous[0] is frame):
+            return []
+        current = self.to_gray(frame)
+        with self._lock:
+            self._previous[camera_id] = (frame, current)
+        if previous is None or previous[1].shape != current.shape:
+            return []
+        changed = np.abs(current - previous[1])
+        return [
+            region.name
+            for region, (rows, cols) in self._region_slices(camera_id)
+            if np.count_nonzero(changed[rows, cols] > region.pixel_threshold)
+            > region.area_threshold * changed[rows, cols].size
+        ]
+
+    def to_gray(self, frame: Any) -> np.ndarray:
+        import numpy as np
+        from PIL import Image
+
+        image = frame if frame.size == self.size else frame.resize(self.size, Image.BILINEAR)
+        if image.mode != "L":
+            image = image.convert("L")
+        return np.asarray(image, dtype=np.int16)
+
+    def _region_slices(self, camera_id: int):
+        masks = self._masks.get(camera_id)
+        if masks is None:
+            width, height = self.size
+            masks = []
+            for region in self.regions(camera_id):
+                left, top, right, bottom = region.box
+                rows = slice(int(top * height), max(int(top * height) + 1, int(bottom * height)))
+                cols = slice(int(left * width), max(int(left * width) + 1, int(right * width)))
+                masks.append((region, (rows, cols)))
+            with self._lock:
+                self._masks[camera_id] = masks
+        return masks
+
+
+class MotionMonitor:
+    """Samples every enabled camera at ``fps`` and queues motion events.
+
+    Thumbnails at the detector's analysis size are requested from the
+    controller, so the cameras render straight to the small size (and skip
+    the time overlay). Events are collected until ``poll`` hands them to the
+    sensor polling path.
+    """
+
+    DEFAULT_FPS = 4.0
+    MAX_EVENTS = 32
+
+    def __init__(
+        self,
+        controller,
+        detector: MotionDetector,
+        fps: float = DEFAULT_FPS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._controller = controller
+        self.detector = detector
+        self.fps = max(0.1, float(fps))
+        self._clock = clock
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_EVENTS)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="camera-motion", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def sample(self) -> List[Dict[str, Any]]:
+        """Analyse one frame of every enabled camera; returns the new events."""
+        now = self._clock()
+        events = []
+        for camera_id, frame in self._controller.iter_views(size=self.detector.size):
+            regions = self.detector.process(camera_id, frame)
+            if regions:
+                events.append({"camera_id": camera_id, "regions": regions, "time": now})
+        if events:
+            with self._lock:
+                self._events.extend(events)
+        return events
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Pop the oldest pending motion event, if any."""
+        with self._lock:
+            return self._events.popleft() if self._events else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+    def _run(self) -> None:
+        interval = 1.0 / self.fps
+        while not self._stop.wait(interval):
+            try:
+                self.sample()
+            except Exception as exc:  # pragma: no cover - keep detecting
+                print(f"Camera motion detection failed: {exc}")
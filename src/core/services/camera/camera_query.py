@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.controllers.camera_controller import CameraController
 
@@ -10,6 +10,8 @@ from src.controllers.camera_controller import CameraController
 class CameraQueryService:
     """Provides camera list/detail/view operations."""
 
+    THUMBNAIL_SIZE: Tuple[int, int] = (200, 150)
+
     def __init__(self, controller: CameraController, labels: Dict[int, str]):
         self._controller = controller
         self._labels = labels
@@ -55,6 +57,43 @@ class CameraQueryService:
             return {"success": False, "message": "Camera not available"}
         return {"success": True, "view": view}
 
+    def get_camera_thumbnail(self, cam_id: int, size=None):
+        thumbnail = self._controller.display_single_thumbnail(cam_id, self.thumbnail_size(size))
+        if thumbnail is None:
+            return {"success": False, "message": "Camera not available"}
+        return {"success": True, "thumbnail": thumbnail}
+
+    def attach_thumbnails(self, entries: Dict[str, Dict], size=None) -> Dict[str, Dict]:
+        """Add a ``thumbnail`` to each thumbnail-page entry; locked or disabled cameras get None."""
+        viewable = {
+            int(name.lstrip("C")): name
+            for name, entry in entries.items()
+            if entry.get("enabled") and not entry.get("locked")
+        }
+        for entry in entries.values():
+            entry["thumbnail"] = None
+        for cam_id, thumbnail in self._controller.iter_views(viewable, self.thumbnail_size(size)):
+            entries[viewable[cam_id]]["thumbnail"] = thumbnail
+        return entries
+
+    def thumbnail_size(self, size=None) -> Tuple[int, int]:
+        """Normalize ``size`` (an edge length or a (width, height) pair).
+
+        Anything else from the caller (``"big"``, a 3-tuple, ...) falls back
+        to ``THUMBNAIL_SIZE`` rather than failing the request.
+        """
+        if not size:
+            return self.THUMBNAIL_SIZE
+        if isinstance(size, (int, float, str)):
+            size = (size, size)
+        try:
+            width, height = (int(value) for value in size)
+        except (TypeError, ValueError):
+            return self.THUMBNAIL_SIZE
+        if width <= 0 or height <= 0:
+            return self.THUMBNAIL_SIZE
+        return width, height
+
     def camera_info(self):
         return self._controller.get_all_camera_info()
 
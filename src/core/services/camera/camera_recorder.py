@@ -0,0 +1,258 @@
+"""Motion/alarm-triggered recording of camera frames."""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .camera_encoding import mjpeg_part
+
+Frame = Tuple[float, bytes]
+
+
+class FrameRingBuffer:
+    """Recent encoded frames of one camera, capped by age and total bytes."""
+
+    def __init__(self, byte_budget: int, seconds: float):
+        self.byte_budget = byte_budget
+        self.seconds = seconds
+        self.size = 0
+        self._frames: Deque[Frame] = deque()
+
+    def append(self, timestamp: float, data: bytes) -> None:
+        self._frames.append((timestamp, data))
+        self.size += len(data)
+        horizon = timestamp - self.seconds
+        while self._frames and (
+            self.size > self.byte_budget or self._frames[0][0] < horizon
+        ):
+            _, dropped = self._frames.popleft()
+            self.size -= len(dropped)
+
+    def snapshot(self) -> List[Frame]:
+        return list(self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+@dataclass
+class Clip:
+    """Pre-roll plus post-roll frames recorded for one alarm on one camera."""
+
+    camera_id: int
+    started: float
+    ends: float
+    reason: Dict[str, Any]
+    frames: List[Frame] = field(default_factory=list)
+    post_roll_bytes: int = 0
+
+
+class CameraRecorder:
+    """Keeps a ring buffer per camera and writes clips around alarms.
+
+    ``capture`` samples every enabled camera (driven by a background thread at
+    ``fps`` once ``start`` is called, or by hand in tests) and buffers a
+    frame only when the view changed. ``on_alarm`` turns the buffered
+    pre-roll of the cameras covering the alarm's zone into clips that keep
+    collecting frames for ``post_roll`` seconds; finished clips are written
+    as ``.mjpeg`` segments plus a ``.json`` index by a writer thread.
+
+    ``byte_budget`` caps both the pre-roll buffer of each camera and the
+    post-roll of each clip; a clip whose post-roll fills up is written early.
+    Camera views only change when their overlay clock ticks (once per
+    ``DeviceCamera.TICK_SECONDS``) or when they are panned or zoomed, so an
+    ``fps`` above the tick rate only catches pan/zoom changes sooner; it
+    never records more than one frame per view.
+    """
+
+    DEFAULT_SECONDS = 10.0
+    DEFAULT_FPS = 2.0
+    DEFAULT_POST_ROLL = 5.0
+    DEFAULT_BYTE_BUDGET = 4 * 1024 * 1024  # per camera
+
+    def __init__(
+        self,
+        controller,
+        encode: Callable[[int, Any], bytes],
+        camera_zones: Dict[int, Any],
+        output_dir: Path,
+        seconds: float = DEFAULT_SECONDS,
+        fps: float = DEFAULT_FPS,
+        post_roll: float = DEFAULT_POST_ROLL,
+        byte_budget: int = DEFAULT_BYTE_BUDGET,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._controller = controller
+        self._encode = encode
+        self._camera_zones = camera_zones
+        self.output_dir = Path(output_dir)
+        self.seconds = float(seconds)
+        self.fps = max(0.1, float(fps))
+        self.post_roll = float(post_roll)
+        self.byte_budget = int(byte_budget)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buffers: Dict[int, FrameRingBuffer] = {}
+        self._last_frames: Dict[int, Any] = {}
+        self._clips: List[Clip] = []
+        self._writes: "queue.Queue[Optional[Clip]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.written: List[Path] = []
+
+    # ------------------------------------------------------------------ #
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="camera-recorder", daemon=True),
+            threading.Thread(target=self._write_loop, name="camera-writer", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, flush clips still in post-roll and wait for the writer.
+
+        The capture thread is joined first so a sample in progress can still
+        finish its clips; alarms arriving once stopping has begun are ignored.
+        """
+        self._stop.set()
+        capture, writer = self._threads or (None, None)
+        if capture is not None:
+            capture.join(timeout=5)
+        with self._lock:
+            pending, self._clips = self._clips, []
+        for clip in pending:
+            self._writes.put(clip)
+        if writer is not None:
+            self._writes.put(None)
+            writer.join(timeout=5)
+            self._threads = []
+        else:
+            self.drain()
+
+    def capture(self) -> None:
+        """Sample every enabled camera once."""
+        now = self._clock()
+        for camera_id, frame in self._controller.iter_views():
+            if frame is None or frame is self._last_frames.get(camera_id):
+                continue
+            self._last_frames[camera_id] = frame
+            data = self._encode(camera_id, frame)
+            with self._lock:
+                buffer = self._buffers.get(camera_id)
+                if buffer is None:
+                    buffer = self._buffers[camera_id] = FrameRingBuffer(
+                        self.byte_budget, self.seconds
+                    )
+                buffer.append(now, data)
+                for clip in self._clips:
+                    if clip.camera_id != camera_id:
+                        continue
+                    if clip.post_roll_bytes + len(data) > self.byte_budget:
+                        clip.ends = now  # post-roll is full; write what it has
+                    else:
+                        clip.frames.append((now, data))
+                        clip.post_roll_bytes += len(data)
+        self._finish_clips(now)
+
+    def on_alarm(self, event: Dict[str, Any]) -> List[int]:
+        """Start clips for the cameras covering the alarm's zone; returns their ids."""
+        zone_id = event.get("zone_id")
+        now = self._clock()
+        cameras = self.cameras_for_zone(zone_id)
+        with self._lock:
+            if self._stop.is_set():
+                return []
+            for camera_id in cameras:
+                buffer = self._buffers.get(camera_id)
+                pre_roll = buffer.snapshot() if buffer is not None else []
+                self._clips.append(
+                    Clip(camera_id, now, now + self.post_roll, dict(event), pre_roll)
+                )
+        return cameras
+
+    def cameras_for_zone(self, zone_id: Any) -> List[int]:
+        if zone_id is None:
+            return []
+        return sorted(cid for cid, zone in self._camera_zones.items() if zone == zone_id)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "recording": bool(self._threads),
+                "seconds": self.seconds,
+                "fps": self.fps,
+                "byte_budget": self.byte_budget,
+                "buffers": {
+                    f"C{cid}": {"frames": len(buf), "bytes": buf.size}
+                    for cid, buf in self._buffers.items()
+                },
+                "active_clips": len(self._clips),
+                "written": [str(path) for path in self.written],
+            }
+
+    def drain(self) -> None:
+        """Write every queued clip on the calling thread (used without a writer thread)."""
+        while True:
+            try:
+                clip = self._writes.get_nowait()
+            except queue.Empty:
+                return
+            if clip is not None:
+                self._write(clip)
+
+    # ------------------------------------------------------------------ #
+    def _finish_clips(self, now: float) -> None:
+        with self._lock:
+            done = [clip for clip in self._clips if clip.ends <= now]
+            self._clips = [clip for clip in self._clips if clip.ends > now]
+        for clip in done:
+            self._writes.put(clip)
+
+    def _capture_loop(self) -> None:
+        interval = 1.0 / self.fps
+        while not self._stop.wait(interval):
+            try:
+                self.capture()
+            except Exception as exc:  # pragma: no cover - keep recording alive
+                print(f"Camera recorder capture failed: {exc}")
+
+    def _write_loop(self) -> None:
+        while True:
+            clip = self._writes.get()
+            if clip is None:
+                return
+            try:
+                self._write(clip)
+            except OSError as exc:  # pragma: no cover - disk errors are reported only
+                print(f"Camera recorder could not write clip: {exc}")
+
+    def _write(self, clip: Clip) -> Path:
+        directory = self.output_dir / f"camera{clip.camera_id}"
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(clip.started))
+        base = directory / f"{stamp}-{int(clip.started * 1000) % 1000:03d}"
+        segment = base.with_suffix(".mjpeg")
+        with open(segment, "wb") as handle:
+            for _, data in clip.frames:
+                handle.write(mjpeg_part(data))
+        index = {
+            "camera_id": clip.camera_id,
+            "alarm_at": clip.started,
+            "reason": clip.reason,
+            "frames": [timestamp for timestamp, _ in clip.frames],
+        }
+        base.with_suffix(".json").write_text(json.dumps(index, indent=2), encoding="utf-8")
+        with self._lock:
+            self.written.append(segment)
+        return segment
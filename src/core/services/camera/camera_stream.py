@@ -0,0 +1,177 @@
+"""Frame subscriptions for live camera views."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+FrameCallback = Callable[[int, Any], None]
+
+
+class FrameSubscription:
+    """One client's registration for a camera's frames at a target FPS.
+
+    Frames are delivered to ``callback`` from the hub's dispatcher thread, or
+    fetched with ``poll`` by clients that run their own timer (e.g. Tk).
+    """
+
+    def __init__(self, hub: "CameraFrameHub", camera_id: int, fps: float,
+                 callback: Optional[FrameCallback]):
+        self.camera_id = camera_id
+        self.fps = fps
+        self.callback = callback
+        self.interval = 1.0 / fps
+        self.next_due = 0.0
+        self.seen = 0
+        self.active = True
+        self._hub = hub
+
+    def poll(self) -> Optional[Any]:
+        """Return the camera's newest frame if this subscriber has not seen it."""
+        return self._hub.poll(self) if self.active else None
+
+    def reset(self) -> None:
+        """Make the next ``poll`` return the current frame again."""
+        self.seen = 0
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+
+class _CameraFeed:
+    """Latest frame of one camera, shared by all of its subscribers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.frame: Any = None
+        self.generation = 0
+
+
+class CameraFrameHub:
+    """Shares one render per camera between frame subscribers.
+
+    Cameras return the same frame object until their view changes, so the hub
+    fetches each camera at most once per dispatch and only hands a frame to a
+    subscriber when its identity changed since that subscriber's last frame.
+    """
+
+    MAX_FPS = 30.0
+
+    def __init__(self, controller, clock: Callable[[], float] = time.monotonic):
+        self._controller = controller
+        self._clock = clock
+        self._lock = threading.Condition()
+        self._subscriptions: List[FrameSubscription] = []
+        self._feeds: Dict[int, _CameraFeed] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def subscribe(self, camera_id: int, fps: float = 10.0,
+                  callback: Optional[FrameCallback] = None) -> FrameSubscription:
+        fps = max(0.1, min(float(fps), self.MAX_FPS))
+        subscription = FrameSubscription(self, camera_id, fps, callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._feeds.setdefault(camera_id, _CameraFeed())
+            if callback is not None:
+                self._ensure_thread()
+            self._lock.notify()
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription) -> None:
+        with self._lock:
+            subscription.active = False
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if not any(s.camera_id == subscription.camera_id for s in self._subscriptions):
+                self._feeds.pop(subscription.camera_id, None)
+
+    def notify(self, camera_id: int) -> None:
+        """Deliver a camera's next frame right away (e.g. after a PTZ move)."""
+        with self._lock:
+            for subscription in self._subscriptions:
+                if subscription.camera_id == camera_id:
+                    subscription.next_due = 0.0
+            self._lock.notify()
+
+    def poll(self, subscription: FrameSubscription) -> Optional[Any]:
+        feed = self._feeds.get(subscription.camera_id)
+        if feed is None:
+            return None
+        frame, generation = self._fetch(subscription.camera_id, feed)
+        if generation == subscription.seen:
+            return None
+        subscription.seen = generation
+        return frame
+
+    def pump(self) -> float:
+        """Deliver frames to every due callback subscriber.
+
+        Returns the seconds until the next subscriber is due.
+        """
+        now = self._clock()
+        with self._lock:
+            due = [s for s in self._subscriptions if s.callback and s.next_due <= now]
+        deliveries = []
+        fetched: Dict[int, tuple] = {}
+        for subscription in due:
+            feed = self._feeds.get(subscription.camera_id)
+            if feed is None:
+                continue
+            subscription.next_due = now + subscription.interval
+            if subscription.camera_id not in fetched:
+                fetched[subscription.camera_id] = self._fetch(subscription.camera_id, feed)
+            frame, generation = fetched[subscription.camera_id]
+            if generation != subscription.seen:
+                subscription.seen = generation
+                deliveries.append((subscription, frame))
+        for subscription, frame in deliveries:
+            if subscription.active:
+                try:
+                    subscription.callback(subscription.camera_id, frame)
+                except Exception as exc:  # pragma: no cover - subscriber bug
+                    print(f"Frame subscriber for camera {subscription.camera_id} failed: {exc}")
+        with self._lock:
+            pending = [s.next_due for s in self._subscriptions if s.callback]
+        return max(0.0, min(pending) - self._clock()) if pending else 1.0
+
+    def close(self) -> None:
+        with self._lock:
+            self._running = False
+            self._subscriptions = []
+            self._feeds = {}
+            self._lock.notify()
+
+    # ------------------------------------------------------------------ #
+    def _fetch(self, camera_id: int, feed: _CameraFeed):
+        """Fetch the camera's frame, bumping the generation if it changed."""
+        with feed.lock:
+            frame = self._controller.display_single_view(camera_id)
+            if frame is not None and frame is not feed.frame:
+                feed.frame = frame
+                feed.generation += 1
+            return feed.frame, feed.generation
+
+    def _ensure_thread(self) -> None:
+        self._running = True
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="camera-frames", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+            delay = self.pump()
+            with self._lock:
+                if not self._running:
+                    return
+                if not any(s.callback for s in self._subscriptions):
+                    self._lock.wait()
+                else:
+                    self._lock.wait(timeout=delay)
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Dict, List, Optional
 
 from ...controllers.camera_controller import CameraController
 from ...devices.cameras.safehome_camera import SafeHomeCamera
 from ..logging.system_logger import SystemLogger
-from .camera import CameraQueryService, CameraControlService, CameraSecurityService, CameraInitService
+from .camera import (
+    MJPEG_CONTENT_TYPE,
+    CameraControlService,
+    CameraFrameHub,
+    CameraRecorder,
+    CameraInitService,
+    CameraQueryService,
+    CameraSecurityService,
+    FrameEncoder,
+    FrameSubscription,
+    MotionDetector,
+    MotionMonitor,
+    MotionRegion,
+    mjpeg_stream,
+)
 
 
 class CameraService:
@@ -17,10 +32,18 @@ class CameraService:
         self._controller = controller
         self._camera_lookup: Dict[str, int] = {}
         self._camera_labels: Dict[int, str] = {}
-        self._init = CameraInitService(controller, self._camera_lookup, self._camera_labels)
+        self._camera_zones: Dict[int, int] = {}
+        self._init = CameraInitService(
+            controller, self._camera_lookup, self._camera_labels, self._camera_zones
+        )
         self._query = CameraQueryService(controller, self._camera_labels)
         self._control = CameraControlService(controller)
         self._security = CameraSecurityService(controller, self._camera_labels)
+        self._frames = CameraFrameHub(controller)
+        self._encoder = FrameEncoder()
+        self._recorder: Optional[CameraRecorder] = None
+        self._motion = MotionMonitor(controller, MotionDetector())
+        self._motion_enabled = False
 
     def initialize_defaults(self, camera_data: List[Dict]):
         self._init.initialize(camera_data)
@@ -39,20 +62,178 @@ class CameraService:
         cam_id = self._normalize(camera_id)
         return self._query.get_camera_view(cam_id) if cam_id else {"success": False, "message": "Invalid camera ID"}
 
+    def get_camera_thumbnail(self, camera_id: str, size=None):
+        cam_id = self._normalize(camera_id)
+        return self._query.get_camera_thumbnail(cam_id, size) if cam_id else self._invalid_id()
+
+    def get_camera_thumbnails(self, size=None):
+        """Thumbnail-page metadata plus a rendered thumbnail for every viewable camera."""
+        result = self._security.thumbnails()
+        self._query.attach_thumbnails(result["data"], size)
+        return result
+
+    def get_camera_jpeg(self, camera_id: str, quality=None):
+        """Current view as JPEG bytes; encoded once per rendered frame and quality."""
+        cam_id = self._normalize(camera_id)
+        if cam_id is None:
+            return self._invalid_id()
+        result = self._query.get_camera_view(cam_id)
+        if not result.get("success"):
+            return result
+        jpeg = self._encoder.encode(cam_id, result["view"], quality)
+        return {"success": True, "jpeg": jpeg, "content_type": "image/jpeg"}
+
+    def stream_camera_mjpeg(self, camera_id: str, fps=10.0, quality=None, max_frames=None):
+        """Generator of multipart/x-mixed-replace parts for an HTTP frontend.
+
+        The frame subscription is opened on the first ``next()`` and closed
+        when iteration ends or the generator is closed, so a stream that is
+        dropped without being iterated holds nothing in the frame hub.
+        """
+        cam_id = self._normalize(camera_id)
+        if cam_id is None:
+            return self._invalid_id()
+        if self._safe_get_camera(cam_id) is None:
+            return {"success": False, "message": "Camera not found"}
+        stream = self._mjpeg_parts(cam_id, fps, quality, max_frames)
+        return {"success": True, "stream": stream, "content_type": MJPEG_CONTENT_TYPE}
+
+    def _mjpeg_parts(self, cam_id: int, fps, quality, max_frames):
+        subscription = self._frames.subscribe(cam_id, fps)
+        yield from mjpeg_stream(
+            subscription,
+            lambda frame: self._encoder.encode(cam_id, frame, quality),
+            max_frames=max_frames,
+        )
+
+    def subscribe_frames(self, camera_id="", fps=10.0, callback=None, **_):
+        """Register for a camera's frames; new frames arrive only when the view changes.
+
+        With ``callback(camera_id, frame)`` frames are pushed from a shared
+        dispatcher thread at most ``fps`` times a second; without one, call
+        ``poll()`` on the returned subscription.
+        """
+        cam_id = self._normalize(camera_id)
+        if cam_id is None:
+            return self._invalid_id()
+        if self._safe_get_camera(cam_id) is None:
+            return {"success": False, "message": "Camera not found"}
+        return {"success": True, "subscription": self._frames.subscribe(cam_id, fps, callback)}
+
+    def unsubscribe_frames(self, subscription: Optional[FrameSubscription] = None, **_):
+        if subscription is None:
+            return {"success": False, "message": "No subscription"}
+        self._frames.unsubscribe(subscription)
+        return {"success": True}
+
+    def start_recording(
+        self,
+        output_dir="recordings",
+        seconds=CameraRecorder.DEFAULT_SECONDS,
+        fps=CameraRecorder.DEFAULT_FPS,
+        post_roll=CameraRecorder.DEFAULT_POST_ROLL,
+        byte_budget=CameraRecorder.DEFAULT_BYTE_BUDGET,
+        **_,
+    ):
+        """Keep the last ``seconds`` of every camera so alarms can save a clip."""
+        if self._recorder is not None:
+            return {"success": False, "message": "Recording already running"}
+        self._recorder = CameraRecorder(
+            self._controller,
+            lambda cam_id, frame: self._encoder.encode(cam_id, frame),
+            self._camera_zones,
+            Path(output_dir),
+            seconds=seconds,
+            fps=fps,
+            post_roll=post_roll,
+            byte_budget=byte_budget,
+        )
+        self._recorder.start()
+        return {"success": True, "status": self._recorder.status()}
+
+    def stop_recording(self, **_):
+        if self._recorder is None:
+            return {"success": False, "message": "Recording is not running"}
+        recorder, self._recorder = self._recorder, None
+        recorder.stop()
+        return {"success": True, "status": recorder.status()}
+
+    def recording_status(self, **_):
+        if self._recorder is None:
+            return {"success": True, "status": {"recording": False}}
+        return {"success": True, "status": self._recorder.status()}
+
+    def on_alarm(self, event: Dict) -> None:
+        """Alarm listener: save pre/post-roll clips of the cameras in the alarm's zone."""
+        if self._recorder is not None:
+            self._recorder.on_alarm(event)
+
+    def start_motion_detection(self, fps=MotionMonitor.DEFAULT_FPS, **_):
+        """Watch every enabled camera for motion, sampling ``fps`` times a second."""
+        if self._motion.running:
+            self._motion.stop()
+        self._motion.fps = max(0.1, float(fps))
+        self._motion.detector.reset()
+        self._motion.clear()
+        self._motion.start()
+        self._motion_enabled = True
+        return {"success": True, "fps": self._motion.fps}
+
+    def stop_motion_detection(self, **_):
+        self._motion.stop()
+        self._motion.clear()
+        self._motion_enabled = False
+        return {"success": True}
+
+    def set_motion_regions(self, camera_id="", regions=None, **_):
+        """Replace a camera's watched regions (dicts of ``MotionRegion`` fields)."""
+        cam_id = self._normalize(camera_id)
+        if cam_id is None:
+            return self._invalid_id()
+        try:
+            parsed = [MotionRegion.from_dict(region) for region in regions or []]
+        except (TypeError, ValueError):
+            return {"success": False, "message": "Invalid motion region"}
+        self._motion.detector.set_regions(cam_id, parsed)
+        return {"success": True}
+
+    def poll_motion(self, sample: bool = False) -> Dict:
+        """Next camera motion event in the shape returned by sensor polling.
+
+        With ``sample`` the cameras are analysed once right now instead of
+        relying on the background sampler.
+        """
+        if not self._motion_enabled:
+            return {"success": True, "intrusion_detected": False}
+        if sample:
+            self._motion.sample()
+        event = self._motion.poll()
+        if event is None:
+            return {"success": True, "intrusion_detected": False}
+        cam_id = event["camera_id"]
+        return {
+            "success": True,
+            "intrusion_detected": True,
+            "sensor_id": f"C{cam_id}",
+            "zone_id": self._camera_zones.get(cam_id),
+            "description": f"Camera motion @ {self._camera_labels.get(cam_id, f'C{cam_id}')}",
+            "regions": event["regions"],
+        }
+
     def pan_camera(self, camera_id="", direction="", **_):
         cam_id = self._normalize(camera_id)
-        return self._control.pan(cam_id, direction) if cam_id else self._invalid_id()
+        return self._changed(cam_id, self._control.pan(cam_id, direction)) if cam_id else self._invalid_id()
 
     def zoom_camera(self, camera_id="", direction="", **_):
         cam_id = self._normalize(camera_id)
-        return self._control.zoom(cam_id, direction) if cam_id else self._invalid_id()
+        return self._changed(cam_id, self._control.zoom(cam_id, direction)) if cam_id else self._invalid_id()
 
     def tilt_camera(self, camera_id="", direction="", **_):
         cam_id = self._normalize(camera_id)
         if cam_id is None:
             return self._invalid_id()
         cam = self._safe_get_camera(cam_id)
-        return self._control.tilt(cam, direction) if cam else {"success": False, "message": "Camera not found"}
+        return self._changed(cam_id, self._control.tilt(cam, direction)) if cam else {"success": False, "message": "Camera not found"}
 
     def enable_camera(self, camera_id="", **_):
         cam_id = self._normalize(camera_id)
@@ -84,6 +265,10 @@ class CameraService:
     def labels(self) -> Dict[int, str]:
         return self._camera_labels
 
+    @property
+    def zones(self) -> Dict[int, int]:
+        return self._camera_zones
+
     def _normalize(self, camera_id) -> Optional[int]:
         if isinstance(camera_id, int):
             return camera_id
@@ -105,5 +290,12 @@ class CameraService:
         cam_id = self._normalize(camera_id)
         return ("Invalid camera ID", None) if cam_id is None else (cam_id, self._safe_get_camera(cam_id))
 
+    def _changed(self, cam_id: int, result):
+        """Push the new view to frame subscribers after a successful PTZ move."""
+        if result.get("success"):
+            self._motion.detector.reset(cam_id)
+            self._frames.notify(cam_id)
+        return result
+
     def _invalid_id(self):
         return {"success": False, "message": "Invalid camera ID"}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from ...configuration import ConfigurationManager
 from ..logging.system_logger import SystemLogger
@@ -24,6 +24,7 @@ class ModeService:
         self._logger = logger
         self._mode_configs: Dict[str, List[str]] = {}
         self._current_mode = self.MODE_DISARMED
+        self._change_listeners: List[Callable[[Dict], None]] = []
 
     # ------------------------------------------------------------------ #
     def bootstrap_defaults(self, defaults: Dict[str, List[str]]):
@@ -38,6 +39,25 @@ class ModeService:
             mode_name = mode.mode_name.upper()
             self._mode_configs[mode_name] = mode.sensor_ids[:]
 
+    # ------------------------------------------------------------------ #
+    def add_change_listener(self, listener: Callable[[Dict], None]) -> None:
+        """Call ``listener({"mode", "armed"})`` after every arm or disarm."""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[Dict], None]) -> None:
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _set_mode(self, mode: str) -> None:
+        self._current_mode = mode
+        event = {"mode": mode, "armed": mode != self.MODE_DISARMED}
+        for listener in list(self._change_listeners):
+            try:
+                listener(event)
+            except Exception as exc:  # pragma: no cover - never block arming
+                print(f"Mode listener failed: {exc}")
+
     # ------------------------------------------------------------------ #
     def arm_system(self, mode="AWAY", user=None) -> Dict:
         door_open = self._sensor_service.door_or_window_open()
@@ -48,15 +68,15 @@ class ModeService:
         for sensor_id in self._sensor_service.sensor_ids:
             self._sensor_service.set_sensor_armed(sensor_id, sensor_id in active_sensors)
 
-        self._current_mode = mode
+        self._set_mode(mode)
         self._logger.add_event("ARM", f"System armed: {mode}", user=user)
         return {"success": True, "mode": mode}
 
     def disarm_system(self, zone_service: ZoneService, *, log_event: bool = True) -> Dict:
-        self._current_mode = self.MODE_DISARMED
         self._sensor_service.disarm_all()
         for zone in zone_service.get_zones():
             zone["armed"] = False
+        self._set_mode(self.MODE_DISARMED)
         if log_event:
             self._logger.add_event("DISARM", "System disarmed")
         return {"success": True}
@@ -71,7 +91,7 @@ class ModeService:
     ) -> Dict:
         if not mode or sensors is None:
             return {"success": False, "message": "Mode and sensors required"}
-        invalid = [sid for sid in sensors if sid not in self._sensor_service.sensor_ids]
+        invalid = [sid for sid in sensors if not self._sensor_service.has_sensor(sid)]
         if invalid:
             return {
                 "success": False,
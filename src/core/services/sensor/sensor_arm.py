@@ -40,10 +40,7 @@ class SensorArmService:
         if not armed_mode:
             return {"success": True, "intrusion_detected": False}
 
-        for sensor_id in self._registry.lookup.keys():
-            sensor = self._registry.get_sensor(sensor_id)
-            if not sensor:
-                continue
+        for sensor_id, sensor in self._registry.sensors.items():
             status = sensor.get_status()
             if not status.get("armed"):
                 continue
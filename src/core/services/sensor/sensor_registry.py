@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from src.devices.sensors.motion_sensor import MotionSensor
 from src.devices.sensors.sensor_controller import SensorController
@@ -10,60 +11,127 @@ from src.devices.sensors.window_door_sensor import WindowDoorSensor
 
 
 class SensorRegistry:
-    """Responsible for bootstrapping sensors and maintaining lookup maps."""
+    """Responsible for bootstrapping sensors and maintaining lookup maps.
+
+    ``sensors`` resolves friendly ids straight to sensor objects so hot paths
+    (status, arm, poll) skip the controller-id indirection. ``ids`` is an
+    immutable snapshot rebuilt only after a sensor is added or removed.
+    Sensors report state changes through change listeners, which collect
+    their ids in ``dirty``; sensors forward changes of an attached device the
+    same way. Only sensors without listener support are kept in ``volatile``.
+    """
 
     def __init__(self, controller: SensorController):
         self._controller = controller
         self.lookup: Dict[str, int] = {}
         self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.sensors: Dict[str, Union[WindowDoorSensor, MotionSensor]] = {}
         self.instances: List[Union[WindowDoorSensor, MotionSensor]] = []
+        self.dirty: Set[str] = set()
+        self.volatile: Set[str] = set()
+        self._listeners: Dict[str, Callable[[Any], None]] = {}
+        self._ids: Optional[Tuple[str, ...]] = None
 
     def initialize(
         self,
         sensor_data: List[Dict[str, Any]],
         sensor_coords: Dict[str, Tuple[int, int]],
     ):
-        sensors: List[Union[WindowDoorSensor, MotionSensor]] = []
         for entry in sensor_data:
             sensor_id = entry.get("id")
             if not sensor_id:
                 continue
-            coords = sensor_coords.get(sensor_id, (0, 0))
-            sensor_type = (
-                SensorController.SENSOR_TYPE_MOTION
-                if entry.get("type") == "MOTION"
-                else SensorController.SENSOR_TYPE_WINDOW_DOOR
-            )
-            if not self._controller.addSensor(coords[0], coords[1], sensor_type):
-                continue
-            controller_id = self._controller.nextSensorID - 1
-            sensor_obj = self._controller.getSensor(controller_id)
-            display_name = entry.get("name") or entry.get("location") or sensor_id
-            category = entry.get("type", "").lower()
-            extra = {"label": entry.get("location")}
-            if hasattr(sensor_obj, "set_metadata"):
-                sensor_obj.set_metadata(
-                    friendly_id=sensor_id,
-                    location_name=display_name,
-                    category=category,
-                    extra=extra,
-                )
-            else:
-                setattr(sensor_obj, "friendly_id", sensor_id)
-                setattr(sensor_obj, "location_name", display_name)
-            self.lookup[sensor_id] = controller_id
-            self.metadata[sensor_id] = entry
-            if entry.get("armed"):
-                sensor_obj.arm()
-            else:
-                sensor_obj.disarm()
-            sensors.append(sensor_obj)
-        self.instances = sensors
+            self.add_sensor(entry, sensor_coords.get(sensor_id, (0, 0)))
 
-    def get_sensor(self, sensor_id: str):
-        internal_id = self.lookup.get(sensor_id)
-        if internal_id is None:
+    def add_sensor(
+        self, entry: Dict[str, Any], coords: Tuple[int, int] = (0, 0)
+    ) -> Optional[Union[WindowDoorSensor, MotionSensor]]:
+        """Create a sensor through the controller and register it by friendly id."""
+        sensor_id = entry.get("id")
+        if not sensor_id:
+            return None
+        sensor_type = (
+            SensorController.SENSOR_TYPE_MOTION
+            if entry.get("type") == "MOTION"
+            else SensorController.SENSOR_TYPE_WINDOW_DOOR
+        )
+        if not self._controller.addSensor(coords[0], coords[1], sensor_type):
             return None
-        return self._controller.getSensor(internal_id)
+        controller_id = self._controller.nextSensorID - 1
+        sensor_obj = self._controller.getSensor(controller_id)
+        display_name = entry.get("name") or entry.get("location") or sensor_id
+        category = entry.get("type", "").lower()
+        extra = {"label": entry.get("location")}
+        if hasattr(sensor_obj, "set_metadata"):
+            sensor_obj.set_metadata(
+                friendly_id=sensor_id,
+                location_name=display_name,
+                category=category,
+                extra=extra,
+            )
+        else:
+            setattr(sensor_obj, "friendly_id", sensor_id)
+            setattr(sensor_obj, "location_name", display_name)
+        if entry.get("armed"):
+            sensor_obj.arm()
+        else:
+            sensor_obj.disarm()
+        if sensor_id in self.sensors:
+            self.remove_sensor(sensor_id)
+        self.lookup[sensor_id] = controller_id
+        self.metadata[sensor_id] = entry
+        self.sensors[sensor_id] = sensor_obj
+        self.instances.append(sensor_obj)
+        self._watch(sensor_id, sensor_obj)
+        self.dirty.add(sensor_id)
+        self._ids = None
+        return sensor_obj
 
+    def remove_sensor(self, sensor_id: str) -> bool:
+        """Drop a sensor from every map and from the underlying controller."""
+        sensor_obj = self.sensors.pop(sensor_id, None)
+        if sensor_obj is None:
+            return False
+        controller_id = self.lookup.pop(sensor_id)
+        self.metadata.pop(sensor_id, None)
+        listener = self._listeners.pop(sensor_id, None)
+        if listener is not None:
+            sensor_obj.remove_change_listener(listener)
+        self.dirty.discard(sensor_id)
+        self.volatile.discard(sensor_id)
+        if sensor_obj in self.instances:
+            self.instances.remove(sensor_obj)
+        self._controller.removeSensor(controller_id)
+        self._ids = None
+        return True
+
+    def mark_dirty(self, sensor_id: str):
+        if sensor_id in self.sensors:
+            self.dirty.add(sensor_id)
+
+    def take_dirty(self) -> Set[str]:
+        """Return and reset the ids changed since the previous call."""
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def _watch(self, sensor_id: str, sensor_obj):
+        if not hasattr(sensor_obj, "add_change_listener"):
+            self.volatile.add(sensor_id)
+            return
+        listener = partial(self._on_sensor_change, sensor_id)
+        sensor_obj.add_change_listener(listener)
+        self._listeners[sensor_id] = listener
+        self._on_sensor_change(sensor_id, sensor_obj)
+
+    def _on_sensor_change(self, sensor_id: str, sensor_obj):
+        self.dirty.add(sensor_id)
+
+    def get_sensor(self, sensor_id: str):
+        return self.sensors.get(sensor_id)
 
+    @property
+    def ids(self) -> Tuple[str, ...]:
+        """Registered friendly ids in insertion order (cached until add/remove)."""
+        if self._ids is None:
+            self._ids = tuple(self.sensors)
+        return self._ids
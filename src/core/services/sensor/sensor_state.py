@@ -2,48 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from .sensor_registry import SensorRegistry
 
 
 class SensorStateService:
-    """Produces sensor summaries for UI consumption."""
+    """Produces sensor summaries for UI consumption.
+
+    Status dicts are cached in id order and only the entries of sensors the
+    registry reports as dirty (or volatile) are rebuilt on each read; the
+    order itself is re-sorted only when sensors are added or removed.
+    Returned entries are shared snapshots and must be treated as read-only.
+    """
 
     def __init__(self, registry: SensorRegistry):
         self._registry = registry
+        self._ids: Optional[Tuple[str, ...]] = None
+        self._positions: Dict[str, int] = {}
+        self._statuses: List[Dict[str, Any]] = []
+        self._devices: List[Tuple[str, Dict[str, Any]]] = []
 
     def collect_statuses(self) -> List[Dict[str, Any]]:
-        statuses: List[Dict[str, Any]] = []
-        for sensor_id in sorted(self._registry.lookup.keys()):
-            sensor = self._registry.get_sensor(sensor_id)
-            if not sensor:
-                continue
-            status = sensor.get_status()
-            status.setdefault("id", sensor_id)
-            if "name" not in status:
-                try:
-                    status["name"] = sensor.get_location()
-                except Exception:  # pragma: no cover
-                    status["name"] = sensor_id
-            statuses.append(status)
-        return statuses
+        self._refresh()
+        return list(self._statuses)
 
     def devices_payload(
         self,
         camera_info: List[Dict[str, Any]],
         camera_labels: Dict[int, str],
     ) -> Dict[str, Dict[str, Any]]:
-        devices: Dict[str, Dict[str, Any]] = {}
-        for status in self.collect_statuses():
-            dev_id = status.get("id", "Unknown")
-            devices[dev_id] = {
-                "type": status.get("type", "sensor"),
-                "armed": status.get("armed", False),
-                "location": status.get("location", "Unknown"),
-                "status": status.get("status", "closed"),
-                "name": status.get("name", dev_id),
-            }
+        self._refresh()
+        devices: Dict[str, Dict[str, Any]] = dict(self._devices)
 
         for cam in camera_info:
             cam_id = cam.get("id", "Unknown")
@@ -59,4 +49,59 @@ class SensorStateService:
             }
         return devices
 
+    # ------------------------------------------------------------------ #
+    def _refresh(self):
+        registry = self._registry
+        changed = registry.take_dirty()
+        if registry.ids is not self._ids:
+            self._rebuild(registry.ids)
+            return
+        for sensor_id in changed | registry.volatile:
+            position = self._positions.get(sensor_id)
+            sensor = registry.get_sensor(sensor_id)
+            if position is None or not sensor:
+                continue
+            status = self._build_status(sensor_id, sensor)
+            self._statuses[position] = status
+            self._devices[position] = (
+                status.get("id", "Unknown"),
+                self._build_device(status),
+            )
+
+    def _rebuild(self, ids: Tuple[str, ...]):
+        self._ids = ids
+        self._positions = {}
+        self._statuses = []
+        self._devices = []
+        for sensor_id in sorted(ids):
+            sensor = self._registry.get_sensor(sensor_id)
+            if not sensor:
+                continue
+            status = self._build_status(sensor_id, sensor)
+            self._positions[sensor_id] = len(self._statuses)
+            self._statuses.append(status)
+            self._devices.append(
+                (status.get("id", "Unknown"), self._build_device(status))
+            )
+
+    @staticmethod
+    def _build_status(sensor_id: str, sensor) -> Dict[str, Any]:
+        status = sensor.get_status()
+        status.setdefault("id", sensor_id)
+        if "name" not in status:
+            try:
+                status["name"] = sensor.get_location()
+            except Exception:  # pragma: no cover
+                status["name"] = sensor_id
+        return status
 
+    @staticmethod
+    def _build_device(status: Dict[str, Any]) -> Dict[str, Any]:
+        dev_id = status.get("id", "Unknown")
+        return {
+            "type": status.get("type", "sensor"),
+            "armed": status.get("armed", False),
+            "location": status.get("location", "Unknown"),
+            "status": status.get("status", "closed"),
+            "name": status.get("name", dev_id),
+        }
@@ -38,6 +38,17 @@ class SensorService:
     def get_sensor(self, sensor_id: str):
         return self._registry.get_sensor(sensor_id)
 
+    def has_sensor(self, sensor_id: str) -> bool:
+        return sensor_id in self._registry.sensors
+
+    def add_sensor(
+        self, entry: Dict[str, Any], coords: Tuple[int, int] = (0, 0)
+    ) -> Optional[Union[WindowDoorSensor, MotionSensor]]:
+        return self._registry.add_sensor(entry, coords)
+
+    def remove_sensor(self, sensor_id: str) -> bool:
+        return self._registry.remove_sensor(sensor_id)
+
     def set_sensor_armed(self, sensor_id: str, armed: bool) -> bool:
         return self._arm.set_sensor_armed(sensor_id, armed)
 
@@ -58,8 +69,8 @@ class SensorService:
         return self._arm.poll_armed_sensors(armed_mode)
 
     @property
-    def sensor_ids(self) -> List[str]:
-        return list(self._registry.lookup.keys())
+    def sensor_ids(self) -> Tuple[str, ...]:
+        return self._registry.ids
 
     @property
     def metadata(self) -> Dict[str, Dict[str, Any]]:
@@ -3,10 +3,11 @@ SafeHome System - Central controller (SDS: System class)
 All UI components communicate ONLY through handle_request().
 """
 
+import threading
 from typing import Any, Dict
 
 from ..configuration import ConfigurationManager, LogManager, LoginManager, StorageManager
-from .command_registry import build_command_map
+from .command_registry import build_command_map, state_commands
 from .configuration.system_initializer import SystemInitializer
 from .handlers.camera_handler import CameraHandler
 from .handlers.lifecycle_handler import LifecycleHandler
@@ -29,6 +30,11 @@ class System(SystemLegacyMixin, SystemLifecycleMixin):
     MODE_DISARMED = ModeService.MODE_DISARMED
 
     def __init__(self, db_path: str = "safehome.db"):
+        # Requests arrive from the Tk thread and from each interface's dispatcher
+        # workers. Mode, alarm and login state is shared by most handlers, so
+        # commands touching it run one at a time; camera and log commands only
+        # need the camera and storage locks and are left to run alongside them.
+        self._state_lock = threading.RLock()
         self._storage = StorageManager.get_instance(db_path)
         self._storage.connect()
         self._config_manager = ConfigurationManager(self._storage)
@@ -53,6 +59,7 @@ class System(SystemLegacyMixin, SystemLifecycleMixin):
             self.auth_service, self.lifecycle_handler, self.security_handler,
             self.mode_handler, self.camera_handler, self.settings_handler, self.log_handler,
         )
+        self._state_commands = state_commands(self._command_map, self.camera_handler, self.log_handler)
         self._doors_windows_open = False
         setup_legacy_attrs(self)
 
@@ -76,4 +83,9 @@ class System(SystemLegacyMixin, SystemLifecycleMixin):
 
     def handle_request(self, source: str, command: str, **kw) -> Dict[str, Any]:
         handler = self._command_map.get(command)
-        return handler(**kw) if handler else {"success": False, "message": f"Unknown command: {command}"}
+        if handler is None:
+            return {"success": False, "message": f"Unknown command: {command}"}
+        if command not in self._state_commands:
+            return handler(**kw)
+        with self._state_lock:
+            return handler(**kw)
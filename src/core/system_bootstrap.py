@@ -40,6 +40,7 @@ def create_services(storage, config_manager, login_manager, log_manager, logger)
     alarm_service = AlarmService(
         logger, settings.alarm_delay_time, settings.monitoring_service_phone
     )
+    alarm_service.add_trigger_listener(camera_service.on_alarm)
     auth_service = AuthService(
         login_manager,
         logger,
@@ -68,12 +68,16 @@ MODE_CONFIGS: Dict[str, List[str]] = {
     "GUEST": ["S1", "S2", "S5", "S6", "S1_blue", "S2_blue"],  # Same as HOME
 }
 
+# "zone" is the SAFETY_ZONES id a camera watches (alarm recordings use it);
+# x/y place the camera on the floor plan in 0-1000 units of its width/height.
+# An optional "floor" entry (sensors too) puts a device on another floor.
 CAMERAS: List[Dict] = [
-    {"id": "C1", "location": "Front Entry", "x": 220, "y": 185},
-    {"id": "C2", "location": "Living Room", "x": 438, "y": 609},
-    {"id": "C3", "location": "Back Patio", "x": 775, "y": 827},
+    {"id": "C1", "location": "Front Entry", "x": 220, "y": 185, "zone": 1},
+    {"id": "C2", "location": "Living Room", "x": 438, "y": 609, "zone": 3},
+    {"id": "C3", "location": "Back Patio", "x": 775, "y": 827, "zone": 2},
 ]
 
+# Floor plan positions in floorplan.png pixels (607x373)
 SENSOR_COORDS: Dict[str, Tuple[int, int]] = {
     "S1": (26, 101),
     "S2": (84, 28),
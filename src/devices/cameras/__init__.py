@@ -2,5 +2,6 @@
 
 from .device_camera import DeviceCamera
 from .safehome_camera import SafeHomeCamera
+from .safehome_camera_info import CameraInfo
 
-__all__ = ["DeviceCamera", "SafeHomeCamera"]
+__all__ = ["CameraInfo", "DeviceCamera", "SafeHomeCamera"]
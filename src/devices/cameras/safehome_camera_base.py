@@ -3,24 +3,27 @@ Base utilities shared across SafeHomeCamera mixins.
 """
 from __future__ import annotations
 
-import os
 import threading
-from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional
 
 from ...virtual_devices.device_camera import DeviceCamera
+from .safehome_camera_info import CameraInfo
 
 
 class SafeHomeCameraBase:
-    """Shared state and helpers for SafeHomeCamera mixins."""
+    """Shared state and helpers for SafeHomeCamera mixins.
+
+    ``_lock`` serializes mutations only. Every mutator republishes the
+    immutable ``CameraInfo`` snapshot, so getters and ``info()`` never wait
+    on a camera that is busy rendering or moving.
+    """
 
     MIN_ZOOM = 1
     MAX_ZOOM = 9
     MIN_PAN = -5
     MAX_PAN = 5
     _ASSET_DIR = Path(__file__).resolve().parents[2] / "resources" / "images"
-    _DEVICE_ASSET_LOCK = threading.RLock()
 
     def __init__(self, camera_id: int, x_coord: int, y_coord: int) -> None:
         self.camera_id: int = camera_id
@@ -37,27 +40,26 @@ class SafeHomeCameraBase:
         self._asset_dir: Path = self._ASSET_DIR
 
         self._initialize_device(camera_id)
+        self._publish()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _publish(self) -> None:
+        """Replace the info snapshot; mutators call this while holding ``_lock``."""
+        self._info = CameraInfo(
+            camera_id=self.camera_id,
+            location=(self.location[0], self.location[1]),
+            enabled=self.enabled,
+            pan=self.pan_angle,
+            tilt=self.tilt_angle,
+            zoom=self.zoom_level,
+            has_password=self._has_password,
+        )
+
     def _initialize_device(self, camera_id: int) -> None:
         """Configure the underlying virtual device."""
-        with self._DEVICE_ASSET_LOCK:
-            with self._temporary_asset_directory():
-                self._device.set_id(camera_id)
-
-    @contextmanager
-    def _temporary_asset_directory(self):
-        """
-        Temporarily switch the working directory to the virtual_device assets
-        directory so that DeviceCamera can discover camera images.
-        """
-        original_cwd = Path.cwd()
-        try:
-            os.chdir(self._asset_dir)
-            yield
-        finally:
-            os.chdir(original_cwd)
-
+        if hasattr(self._device, "asset_dir"):
+            self._device.asset_dir = self._asset_dir
+        self._device.set_id(camera_id)
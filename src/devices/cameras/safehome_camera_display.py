@@ -8,13 +8,26 @@ from .safehome_camera_base import SafeHomeCameraBase
 
 
 class SafeHomeCameraDisplayMixin(SafeHomeCameraBase):
-    """Expose display_view logic."""
+    """Expose display_view logic.
+
+    Rendering is synchronized by the device itself, so the camera lock is
+    not held while a frame is produced.
+    """
 
     def display_view(self):
-        with self._lock:
-            if not self.enabled:
-                raise CameraDisabledError(
-                    f"Camera {self.camera_id} is disabled. Enable it first."
-                )
-            return self._device.get_view()
+        self._check_enabled()
+        return self._device.get_view()
+
+    def display_thumbnail(self, size):
+        """Return the current view scaled to ``size`` (width, height)."""
+        self._check_enabled()
+        if hasattr(self._device, "get_thumbnail"):
+            return self._device.get_thumbnail(size)
+        view = self._device.get_view()
+        return view.resize(tuple(size)) if hasattr(view, "resize") else view
 
+    def _check_enabled(self) -> None:
+        if not self.enabled:
+            raise CameraDisabledError(
+                f"Camera {self.camera_id} is disabled. Enable it first."
+            )
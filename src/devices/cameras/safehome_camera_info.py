@@ -0,0 +1,48 @@
+"""
+Immutable state snapshot for SafeHomeCamera.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CameraInfo:
+    """Consistent, read-only view of a camera's state at one point in time."""
+
+    camera_id: int
+    location: Tuple[int, int]
+    enabled: bool
+    pan: int
+    tilt: Optional[int]
+    zoom: int
+    has_password: bool
+
+    @classmethod
+    def from_camera(cls, camera: Any) -> "CameraInfo":
+        """Build a snapshot through the camera's getters (works for any camera-like object)."""
+        snapshot = camera.info() if hasattr(camera, "info") else None
+        if isinstance(snapshot, cls):
+            return snapshot
+        get_tilt = getattr(camera, "get_tilt_angle", None)
+        return cls(
+            camera_id=camera.get_id(),
+            location=tuple(camera.get_location()),
+            enabled=camera.is_enabled(),
+            pan=camera.get_pan_angle(),
+            tilt=get_tilt() if callable(get_tilt) else None,
+            zoom=camera.get_zoom_level(),
+            has_password=camera.has_password(),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Controller info payload (``CameraController.get_all_camera_info`` entry)."""
+        return {
+            "id": self.camera_id,
+            "location": list(self.location),
+            "enabled": self.enabled,
+            "pan": self.pan,
+            "zoom": self.zoom,
+            "has_password": self.has_password,
+        }
@@ -4,6 +4,7 @@ Lifecycle helpers for SafeHomeCamera.
 from __future__ import annotations
 
 from .safehome_camera_base import SafeHomeCameraBase
+from .safehome_camera_info import CameraInfo
 
 
 class SafeHomeCameraLifecycleMixin(SafeHomeCameraBase):
@@ -12,28 +13,31 @@ class SafeHomeCameraLifecycleMixin(SafeHomeCameraBase):
     def enable(self) -> bool:
         with self._lock:
             self.enabled = True
+            self._publish()
             return True
 
     def disable(self) -> bool:
         with self._lock:
             self.enabled = False
+            self._publish()
             return True
 
+    def info(self) -> CameraInfo:
+        """Snapshot of the camera state as of the last mutation."""
+        return self._info
+
+    # Getters read single attributes, which never needs the mutation lock
     def is_enabled(self) -> bool:
-        with self._lock:
-            return self.enabled
+        return self.enabled
 
     def get_id(self) -> int:
-        with self._lock:
-            return self.camera_id
+        return self.camera_id
 
     def get_pan_angle(self) -> int:
-        with self._lock:
-            return self.pan_angle
+        return self.pan_angle
 
     def get_zoom_level(self) -> int:
-        with self._lock:
-            return self.zoom_level
+        return self.zoom_level
 
     def get_zoom_setting(self) -> int:
         return self.get_zoom_level()
@@ -19,6 +19,7 @@ class SafeHomeCameraLocationMixin(SafeHomeCameraBase):
                     "Location must be a list of [x, y] coordinates"
                 )
             self.location = new_location.copy()
+            self._publish()
 
     def set_id(self, new_id: int) -> bool:
         with self._lock:
@@ -26,9 +27,10 @@ class SafeHomeCameraLocationMixin(SafeHomeCameraBase):
                 raise CameraValidationError("Camera ID must be positive")
             self.camera_id = new_id
             self._initialize_device(new_id)
+            self._publish()
             return True
 
     def get_location(self) -> List[int]:
-        with self._lock:
-            return self.location.copy()
+        # set_location swaps in a new list, so copying the current one is safe
+        return self.location.copy()
 
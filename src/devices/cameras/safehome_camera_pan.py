@@ -15,6 +15,7 @@ class SafeHomeCameraPanMixin(SafeHomeCameraBase):
                 return False
             if self._device.pan_left():
                 self.pan_angle -= 1
+                self._publish()
                 return True
             return False
 
@@ -24,6 +25,7 @@ class SafeHomeCameraPanMixin(SafeHomeCameraBase):
                 return False
             if self._device.pan_right():
                 self.pan_angle += 1
+                self._publish()
                 return True
             return False
 
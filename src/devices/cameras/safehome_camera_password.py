@@ -19,20 +19,20 @@ class SafeHomeCameraPasswordMixin(SafeHomeCameraBase):
                 raise CameraPasswordError("Password cannot be empty")
             self.password = password
             self._has_password = True
+            self._publish()
             return True
 
     def get_password(self) -> Optional[str]:
-        with self._lock:
-            return self.password
+        return self.password
 
     def has_password(self) -> bool:
-        with self._lock:
-            return self._has_password
+        return self._has_password
 
     def clear_password(self) -> bool:
         with self._lock:
             self.password = None
             self._has_password = False
+            self._publish()
             return True
 
     def delete_password(self) -> bool:
@@ -41,7 +41,6 @@ class SafeHomeCameraPasswordMixin(SafeHomeCameraBase):
 
     def verify_password(self, password: str) -> bool:
         """Check if provided password unlocks the camera."""
-        with self._lock:
-            if not self._has_password:
-                return True
-            return self.password == password
+        if not self._has_password:
+            return True
+        return self.password == password
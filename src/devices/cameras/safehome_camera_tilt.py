@@ -20,10 +20,12 @@ class SafeHomeCameraTiltMixin(SafeHomeCameraBase):
                 new_tilt = self.tilt_angle + 1
                 if self._device.set_tilt(new_tilt):
                     self.tilt_angle = new_tilt
+                    self._publish()
                     return True
             else:
                 # Fallback: manage tilt directly if device doesn't support it
                 self.tilt_angle += 1
+                self._publish()
                 return True
             return False
 
@@ -35,14 +37,15 @@ class SafeHomeCameraTiltMixin(SafeHomeCameraBase):
                 new_tilt = self.tilt_angle - 1
                 if self._device.set_tilt(new_tilt):
                     self.tilt_angle = new_tilt
+                    self._publish()
                     return True
             else:
                 # Fallback: manage tilt directly if device doesn't support it
                 self.tilt_angle -= 1
+                self._publish()
                 return True
             return False
 
     def get_tilt_angle(self) -> int:
-        with self._lock:
-            return self.tilt_angle
+        return self.tilt_angle
 
@@ -15,6 +15,7 @@ class SafeHomeCameraZoomMixin(SafeHomeCameraBase):
                 return False
             if self._device.zoom_in():
                 self.zoom_level += 1
+                self._publish()
                 return True
             return False
 
@@ -24,6 +25,7 @@ class SafeHomeCameraZoomMixin(SafeHomeCameraBase):
                 return False
             if self._device.zoom_out():
                 self.zoom_level -= 1
+                self._publish()
                 return True
             return False
 
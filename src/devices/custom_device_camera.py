@@ -2,8 +2,6 @@
 
 import os
 import threading
-import time
-from PIL import Image, ImageDraw, ImageFont
 from ..virtual_devices.device_camera import DeviceCamera as BaseDeviceCamera
 from .custom_camera_features import (
     CameraPasswordMixin,
@@ -20,7 +18,7 @@ class CustomDeviceCamera(
     """Custom camera device with password protection and location features."""
 
     def __init__(self, location: str, camera_id: int):
-        threading.Thread.__init__(self, daemon=True)
+        self._init_clock()
         self.camera_id = camera_id
         self.time = 0
         self.pan = 0
@@ -31,14 +29,15 @@ class CustomDeviceCamera(
         self.center_height = 0
         self._running = True
         self._lock = threading.Lock()
-        self.font = ImageFont.load_default()
+        self.font = None
         self._enabled = True
         self._password = None
         self._location = location
         self.set_id(camera_id)
-        self.start()
 
     def set_id(self, id_: int):
+        from PIL import Image
+
         with self._lock:
             self.camera_id = id_
             filename = os.path.join(ASSETS_DIR, f"camera{id_}.jpg")
@@ -50,6 +49,8 @@ class CustomDeviceCamera(
                 self.img_source = None
 
     def get_view(self):
+        from PIL import Image, ImageDraw, ImageFont
+
         with self._lock:
             if not self._enabled:
                 img = Image.new("RGB", (self.RETURN_SIZE, self.RETURN_SIZE), "gray")
@@ -63,6 +64,10 @@ class CustomDeviceCamera(
             return self._render_view()
 
     def _render_view(self):
+        from PIL import Image, ImageDraw, ImageFont
+
+        if self.font is None:
+            self.font = ImageFont.load_default()
         view_text = f"Time={self.time:02d}, zoom x{self.zoom}, "
         view_text += (
             f"right {self.pan}"
@@ -94,9 +99,3 @@ class CustomDeviceCamera(
         )
         draw.text((5, 2), view_text, fill="cyan", font=self.font)
         return img_view
-
-    def run(self):
-        while self._running:
-            time.sleep(1.0)
-            with self._lock:
-                self.time = (self.time + 1) % 100
@@ -35,11 +35,14 @@ class MotionSensor(MotionSensorMetadataMixin, Sensor):
 
     def setDevice(self, device) -> None:
         """물리적 디바이스를 연결합니다."""
+        self._attach_device(self._device, device)
         self._device = device
+        self._notify_change()
 
     def setDetected(self, detected: bool) -> None:
         """테스트를 위한 감지 상태 설정 메서드"""
         self._detected = detected
+        self._notify_change()
 
     def isArmed(self) -> bool:
         return self._armed
@@ -27,6 +27,7 @@ class MotionSensorMetadataMixin:
         self._location_label = location_name or self._location_label
         self._category = (category or "motion").lower()
         self._extra = extra or {}
+        self._notify_change()
 
     def get_sensor_id(self) -> int:
         """Return numeric ID (legacy helper)."""
@@ -48,12 +49,14 @@ class MotionSensorMetadataMixin:
         """Clear detection state."""
         self._detected = False
         self._detectedSignal = 0
+        self._notify_change()
 
     def force_trigger(self):
         """Force a detection event (testing helper)."""
         if self._armed:
             self._detected = True
             self._detectedSignal = 1
+            self._notify_change()
 
     def get_status(self) -> Dict[str, Any]:
         """Return structured status information."""
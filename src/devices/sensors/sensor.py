@@ -1,7 +1,7 @@
 """Base sensor abstract class."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List
 
 
 class Sensor(ABC):
@@ -14,6 +14,7 @@ class Sensor(ABC):
         self._sensorLocation = location if location else [0, 0]
         self._detectedSignal = 0
         self._armed = False
+        self._change_listeners: List[Callable[["Sensor"], None]] = []
 
     @abstractmethod
     def read(self) -> int:
@@ -23,12 +24,39 @@ class Sensor(ABC):
     def arm(self) -> None:
         """센서를 활성화합니다."""
         self._armed = True
+        self._notify_change()
 
     def disarm(self) -> bool:
         """센서를 비활성화합니다."""
         self._armed = False
+        self._notify_change()
         return True
 
+    def add_change_listener(self, listener: Callable[["Sensor"], None]) -> None:
+        """상태 변경 시 호출될 리스너를 등록합니다."""
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[["Sensor"], None]) -> None:
+        """등록된 리스너를 제거합니다."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_change(self) -> None:
+        """등록된 리스너에게 상태 변경을 알립니다."""
+        for listener in list(self._change_listeners):
+            listener(self)
+
+    def _attach_device(self, old, new) -> None:
+        """연결된 디바이스의 상태 변경을 이 센서의 변경으로 전달합니다."""
+        if old is not None and hasattr(old, "remove_change_listener"):
+            old.remove_change_listener(self._on_device_change)
+        if new is not None and hasattr(new, "add_change_listener"):
+            new.add_change_listener(self._on_device_change)
+
+    def _on_device_change(self, _device) -> None:
+        self._notify_change()
+
     def isArmed(self) -> bool:
         """센서의 활성화 상태를 확인합니다."""
         return self._armed
@@ -12,7 +12,7 @@ class WindowDoorSensor(WindowDoorSensorMetadataMixin, Sensor):
         super().__init__(sensor_id or 0, sensor_type or 0, location or [0, 0])
         self._opened = False
         self._device = None
-        self.hardware = None
+        self._hardware = None
         self.status = "DISARMED"
         self.type = sensor_type or 0
         self._friendly_id = f"S{self._id}"
@@ -37,12 +37,25 @@ class WindowDoorSensor(WindowDoorSensorMetadataMixin, Sensor):
             return False
         return bool(self._read_hardware())
 
+    @property
+    def hardware(self):
+        return self._hardware
+
+    @hardware.setter
+    def hardware(self, device) -> None:
+        self._attach_device(self._hardware, device)
+        self._hardware = device
+        self._notify_change()
+
     def setDevice(self, device) -> None:
+        self._attach_device(self._device, device)
         self._device = device
+        self._notify_change()
 
     def setOpened(self, opened: bool) -> None:
         self._opened = opened
         self.status = "OPEN" if opened else "CLOSED"
+        self._notify_change()
 
     def set_open(self, opened: bool) -> None:
         self.setOpened(opened)
@@ -31,6 +31,7 @@ class WindowDoorSensorMetadataMixin:
         else:
             self._category = normalized
         self._extra = extra or {}
+        self._notify_change()
 
     def get_sensor_id(self) -> int:
         """Legacy helper used by System."""
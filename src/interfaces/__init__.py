@@ -12,10 +12,11 @@ Structure:
   - dialogs/: Dialog windows
 - web_interface.py: Main Web Interface class
 - page_registry.py: Page class registry
+
+Exports are imported on first access, so ``import src.interfaces`` does not
+load Tk widgets or pages that are never used.
 """
-from .web_interface import WebInterface, run_web_interface
-from .page_registry import PAGE_CLASSES, get_page_class, get_all_page_names
-from .control_panel import SafeHomeControlPanel, run_control_panel
+from importlib import import_module
 
 __all__ = [
     'WebInterface',
@@ -26,3 +27,27 @@ __all__ = [
     'SafeHomeControlPanel',
     'run_control_panel',
 ]
+
+_EXPORTS = {
+    'WebInterface': '.web_interface:WebInterface',
+    'run_web_interface': '.web_interface:run_web_interface',
+    'PAGE_CLASSES': '.page_registry:PAGE_CLASSES',
+    'get_page_class': '.page_registry:get_page_class',
+    'get_all_page_names': '.page_registry:get_all_page_names',
+    'SafeHomeControlPanel': '.control_panel:SafeHomeControlPanel',
+    'run_control_panel': '.control_panel:run_control_panel',
+}
+
+
+def __getattr__(name):
+    target = _EXPORTS.get(name)
+    if not target:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target.split(':')
+    value = getattr(import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,163 @@
+"""
+AsyncDispatcher - runs System requests off the Tk thread.
+
+Commands execute on a worker pool; their results are queued and handed back
+on the Tk thread by a short ``after`` poll that only runs while requests are
+in flight, so callbacks may touch widgets directly. Other threads hand work
+to the Tk thread with ``post``, which schedules a single wake-up per batch
+instead of polling.
+"""
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+Result = Dict[str, Any]
+Callback = Callable[[Result], None]
+
+
+class AsyncDispatcher:
+    """Dispatches ``handle(command, **kwargs)`` calls to background workers.
+
+    ``submit`` returns a Future that is resolved on the Tk thread, so its
+    done-callbacks may update widgets too; never block on ``result()`` from
+    the Tk thread. ``System.handle_request`` runs mode, alarm and login
+    commands one at a time whichever thread calls it, so extra workers
+    would mostly queue on its lock; the pool defaults to a single worker,
+    which keeps results in submission order.
+    """
+
+    POLL_MS = 15
+
+    def __init__(
+        self,
+        handle: Callable[..., Result],
+        widget: tk.Misc,
+        workers: int = 1,
+        poll_ms: int = POLL_MS,
+    ):
+        self._handle = handle
+        self._widget = widget
+        self._workers = max(1, workers)
+        self._poll_ms = poll_ms
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._results: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._calls: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._pending = 0
+        self._polling = False
+        self._wake_lock = threading.Lock()
+        self._wake_scheduled = False
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Requests submitted whose results have not been delivered yet."""
+        return self._pending
+
+    def submit(self, command: str, callback: Optional[Callback] = None, **kwargs) -> Future:
+        """Run ``command`` in the background; ``callback(result)`` runs on the Tk thread."""
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(lambda done: self._call(callback, done.result()))
+        if self._closed:
+            future.set_result({"success": False, "message": "Interface closed"})
+            return future
+        self._pending += 1
+        self._executor().submit(self._run, future, command, kwargs)
+        self._schedule()
+        return future
+
+    def post(self, func: Callable[[], None]) -> None:
+        """Queue ``func`` to run on the Tk thread; safe to call from any thread.
+
+        The first call queued while no wake-up is waiting schedules one
+        ``after(0)``, which Tk runs on its own thread; later calls ride on it.
+        """
+        self._calls.put(func)
+        with self._wake_lock:
+            if self._wake_scheduled or self._closed:
+                return
+            self._wake_scheduled = True
+        try:
+            self._widget.after(0, self._wake)
+        except (tk.TclError, RuntimeError):  # window destroyed or Tk not running
+            with self._wake_lock:
+                self._wake_scheduled = False
+
+    def drain(self) -> int:
+        """Deliver finished results and posted calls on the calling (Tk) thread.
+
+        Returns how many results were delivered.
+        """
+        delivered = 0
+        while True:
+            try:
+                future, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            delivered += 1
+            future.set_result(result)
+        self._run_posted()
+        return delivered
+
+    def shutdown(self) -> None:
+        """Stop accepting requests and drop the workers (running ones finish)."""
+        self._closed = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------ #
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="ui-dispatch"
+            )
+        return self._pool
+
+    @staticmethod
+    def _call(callback: Callback, result: Result) -> None:
+        try:
+            callback(result)
+        except Exception as exc:  # keep draining after a failing callback
+            print(f"[AsyncDispatcher] Callback failed: {exc}")
+
+    def _run(self, future: Future, command: str, kwargs: Dict[str, Any]) -> None:
+        try:
+            result = self._handle(command, **kwargs)
+        except Exception as exc:
+            result = {"success": False, "message": f"Request failed: {exc}"}
+        self._results.put((future, result))
+
+    def _run_posted(self) -> None:
+        while True:
+            try:
+                func = self._calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func()
+            except Exception as exc:  # keep draining after a failing call
+                print(f"[AsyncDispatcher] Posted call failed: {exc}")
+
+    def _wake(self) -> None:
+        with self._wake_lock:
+            self._wake_scheduled = False
+        self._run_posted()
+
+    def _schedule(self) -> None:
+        if self._polling:
+            return
+        try:
+            self._widget.after(self._poll_ms, self._poll)
+            self._polling = True
+        except (tk.TclError, RuntimeError):  # window already destroyed
+            pass
+
+    def _poll(self) -> None:
+        self._polling = False
+        self.drain()
+        if self._pending and not self._closed:
+            self._schedule()
@@ -1,15 +1,11 @@
 """
 SafeHome Components Package
 
-Device icons, floor plans, pages, and UI helpers.
+Device icons, floor plans, pages, and UI helpers. Exports are imported on
+first access, so pages that only need ``Page`` do not load the floor plan
+(and PIL) with it.
 """
-from .device_icon import DeviceIcon
-from .device_position import DevicePosition
-from .device_renderer import DeviceRenderer
-from .floor_plan import FloorPlan
-from .room_renderer import RoomRenderer
-from .page import Page
-from .page_helpers import PageHelpersMixin
+from importlib import import_module
 
 __all__ = [
     'DeviceIcon',
@@ -20,3 +16,27 @@ __all__ = [
     'Page',
     'PageHelpersMixin',
 ]
+
+_EXPORTS = {
+    'DeviceIcon': '.device_icon:DeviceIcon',
+    'DevicePosition': '.device_position:DevicePosition',
+    'DeviceRenderer': '.device_renderer:DeviceRenderer',
+    'FloorPlan': '.floor_plan:FloorPlan',
+    'RoomRenderer': '.room_renderer:RoomRenderer',
+    'Page': '.page:Page',
+    'PageHelpersMixin': '.page_helpers:PageHelpersMixin',
+}
+
+
+def __getattr__(name):
+    target = _EXPORTS.get(name)
+    if not target:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target.split(':')
+    value = getattr(import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
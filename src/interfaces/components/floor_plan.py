@@ -1,24 +1,36 @@
 """FloorPlan - House blueprint with clickable devices (SDS: FloorPlan class)"""
 
 import tkinter as tk
-from typing import Dict, Optional, Callable, Set
-from .floor_plan_renderer import load_image
+from typing import Dict, List, Optional, Callable, Sequence, Set, Tuple
+from .floor_plan_catalog import DEFAULT_FLOOR, FloorSpec, default_floors
 from .floor_plan_selection import FloorPlanSelectionMixin
 from .floor_plan_device_layer import DeviceLayer, FloorPlanGeometry
+from .floor_plan_tiles import BackgroundLayer, TilePyramid
+from .floor_plan_view import FloorPlanViewMixin
+from .rendering.image_loader import find_floorplan_image
 
 
-class FloorPlan(FloorPlanSelectionMixin):
-    """Floor plan with clickable device icons."""
+class FloorPlan(FloorPlanSelectionMixin, FloorPlanViewMixin):
+    """Floor plan with clickable device icons.
+
+    The background and device items are drawn once in ``create``; ``refresh``
+    only restyles icons whose armed/selected state changed since the last
+    paint. Use ``redraw`` to rebuild the canvas from scratch.
+
+    A plan can hold several floors (``set_floor``); devices come from the
+    system defaults unless ``devices`` or ``floors`` are given.
+    """
 
     ORIGINAL_IMG_WIDTH = FloorPlanGeometry.ORIGINAL_IMG_WIDTH
     ORIGINAL_IMG_HEIGHT = FloorPlanGeometry.ORIGINAL_IMG_HEIGHT
 
     def __init__(self, parent: tk.Widget, width: int = 450, height: int = 280,
-                 show_cameras: bool = True, show_sensors: bool = True):
+                 show_cameras: bool = True, show_sensors: bool = True,
+                 devices: Optional[Dict[str, Tuple[float, float, str]]] = None,
+                 floors: Optional[Sequence[FloorSpec]] = None):
         self._parent = parent
         self._w, self._h = width, height
         self._canvas: Optional[tk.Canvas] = None
-        self._photo = None
         self._on_click: Optional[Callable] = None
         self._on_sensor_click: Optional[Callable] = None
         self._states: Dict[str, bool] = {}
@@ -26,38 +38,73 @@ class FloorPlan(FloorPlanSelectionMixin):
         self._select_mode = False
         self._device_positions: Dict[str, tuple[int, int, str]] = {}
         self._drag_start, self._drag_rect, self._drag_bound = None, None, False
+        self._pan_anchor = None
         self._img_x_off, self._img_y_off = 0, 0
         self._img_scale_x, self._img_scale_y = 1.0, 1.0
-        self._device_layer = DeviceLayer(show_cameras, show_sensors)
+        self._view_size = (max(width, self.ORIGINAL_IMG_WIDTH), max(height, self.ORIGINAL_IMG_HEIGHT))
+        self._show_cameras, self._show_sensors = show_cameras, show_sensors
+        if floors is None:
+            floors = (
+                [FloorSpec(DEFAULT_FLOOR, devices, image=find_floorplan_image())]
+                if devices is not None
+                else default_floors()
+            )
+        self._floors: List[FloorSpec] = list(floors)
+        self._use_floor(self._floors[0])
 
     def create(self) -> tk.Canvas:
-        canvas_width = max(self._w, self.ORIGINAL_IMG_WIDTH)
-        canvas_height = max(self._h, self.ORIGINAL_IMG_HEIGHT)
+        canvas_width, canvas_height = self._view_size
         self._canvas = tk.Canvas(self._parent, width=canvas_width, height=canvas_height,
                                  bg="#f0f0f0", highlightthickness=1, highlightbackground="#ccc")
         self._draw()
         self._bind_drag_events()
+        self._bind_view_events()
         return self._canvas
 
+    @property
+    def floors(self) -> List[str]:
+        return [floor.name for floor in self._floors]
+
+    @property
+    def floor(self) -> str:
+        return self._floor.name
+
+    def set_floor(self, name: str) -> bool:
+        """Show another floor at the default zoom; False if there is no such floor."""
+        for floor in self._floors:
+            if floor.name == name:
+                self._use_floor(floor)
+                if self._canvas:
+                    self._draw()
+                    self._scroll()
+                return True
+        return False
+
+    def _use_floor(self, floor: FloorSpec):
+        self._floor = floor
+        self._zoom, self._origin = self._fit_zoom(), (0.0, 0.0)
+        self._viewport: Optional[Tuple[float, float, float, float]] = None
+        self._device_layer = DeviceLayer(
+            self._show_cameras, self._show_sensors, floor.devices, floor.size
+        )
+        self._background = BackgroundLayer(TilePyramid.for_floor(floor), floor.size)
+
     def _draw(self):
         if not self._canvas:
             return
         self._canvas.delete("all")
-        result = load_image(self._canvas, self._w, self._h)
-        if result and isinstance(result, tuple) and len(result) == 5:
-            self._photo, self._img_x_off, self._img_y_off, self._img_scale_x, self._img_scale_y = result
-        else:
-            self._photo = result if result else None
-            self._img_x_off, self._img_y_off, self._img_scale_x, self._img_scale_y = 0, 0, 1.0, 1.0
-        if self._canvas:
-            self._device_positions = self._device_layer.render(
-                canvas=self._canvas,
-                offsets=(self._img_x_off, self._img_y_off),
-                scale=(self._img_scale_x, self._img_scale_y),
-                states=self._states,
-                selected=self._selected,
-                click_handler=self._handle_click,
-            )
+        self._img_scale_x = self._img_scale_y = self._zoom
+        self._background.render(self._canvas, self._zoom, self._viewport or self.view)
+        self._device_positions = self._device_layer.render(
+            canvas=self._canvas,
+            offsets=(self._img_x_off, self._img_y_off),
+            scale=(self._img_scale_x, self._img_scale_y),
+            states=self._states,
+            selected=self._selected,
+            click_handler=self._handle_click,
+            viewport=self._viewport,
+            cluster_handler=self._zoom_to_cluster,
+        )
 
     def _handle_click(self, dev_id: str, dtype: str):
         if self._select_mode and dtype in ("sensor", "motion", "door_sensor"):
@@ -84,6 +131,11 @@ class FloorPlan(FloorPlanSelectionMixin):
     def set_armed(self, device_id: str, armed: bool):
         self._states[device_id] = armed
 
+    def set_states(self, states: Dict[str, bool]):
+        """Set the armed state of many devices and repaint once."""
+        self._states.update(states)
+        self.refresh()
+
     def set_selected(self, device_ids: list):
         self._selected = set(device_ids)
         self.refresh()
@@ -96,12 +148,27 @@ class FloorPlan(FloorPlanSelectionMixin):
         self.refresh()
 
     def refresh(self):
+        if not self._canvas:
+            return
+        if not self._device_layer.drawn:
+            self._draw()
+            return
+        self._device_layer.update(self._canvas, self._states, self._selected)
+
+    def redraw(self):
         self._draw()
 
+    def set_viewport(self, viewport: Optional[Tuple[float, float, float, float]]):
+        """Only keep icons for devices inside ``(x0, y0, x1, y1)`` (None shows all)."""
+        self._viewport = viewport
+        if self._canvas and self._device_layer.drawn:
+            self._device_layer.set_viewport(self._canvas, viewport, self._states, self._selected)
+            self._background.set_viewport(self._canvas, viewport or self.view)
+
     def get_devices(self, dtype: str = None) -> list:
-        from .floor_plan_data import DEVICES  # local import to avoid global pollution
-        return [d for d, (_, _, t) in DEVICES.items() if t == dtype] if dtype else list(DEVICES.keys())
+        devices = self._device_layer.devices
+        return [d for d, (_, _, t) in devices.items() if t == dtype] if dtype else list(devices.keys())
 
     def get_sensors(self) -> list:
-        from .floor_plan_data import DEVICES  # local import avoids import cycles during tests
-        return [d for d, (_, _, t) in DEVICES.items() if t in ("sensor", "motion", "door_sensor")]
+        devices = self._device_layer.devices
+        return [d for d, (_, _, t) in devices.items() if t in ("sensor", "motion", "door_sensor")]
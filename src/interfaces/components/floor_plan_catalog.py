@@ -0,0 +1,122 @@
+"""Floor plan device catalog and floor definitions.
+
+Device positions are derived from the system defaults (``SENSORS`` with
+``SENSOR_COORDS`` in plan pixels, ``CAMERAS`` with x/y in 0-1000 units) or
+from equivalent rows loaded from storage, instead of a second hand-kept
+table in the UI.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+Catalog = Dict[str, Tuple[float, float, str]]
+
+DEFAULT_FLOOR = "1F"
+PLAN_SIZE: Tuple[int, int] = (607, 373)  # floorplan.png, the unit of SENSOR_COORDS
+CAMERA_UNITS = 1000.0
+
+SENSOR_DTYPES = {
+    "WINDOW": "sensor",
+    "DOOR": "door_sensor",
+    "MOTION": "motion",
+}
+
+
+@dataclass(frozen=True)
+class FloorSpec:
+    """One floor: its devices and background.
+
+    ``devices`` maps id to ``(nx, ny, dtype)`` with nx/ny as fractions of the
+    floor. The background is either a single ``image`` (cut into tiles on
+    demand) or a pre-cut pyramid given as a ``tiles`` path template with
+    ``{level}``, ``{col}`` and ``{row}`` fields.
+    """
+
+    name: str
+    devices: Catalog = field(default_factory=dict)
+    image: Optional[Path] = None
+    tiles: Optional[str] = None
+    size: Tuple[int, int] = PLAN_SIZE
+
+
+def build_device_catalog(
+    sensors: Iterable[Mapping],
+    cameras: Iterable[Mapping],
+    sensor_coords: Mapping[str, Tuple[int, int]],
+    plan_size: Tuple[int, int] = PLAN_SIZE,
+    floor: Optional[str] = None,
+) -> Catalog:
+    """Return ``{id: (nx, ny, dtype)}`` for the devices placed on the plan.
+
+    Sensors without coordinates are left out. With ``floor`` given, only
+    devices whose ``"floor"`` entry (default ``DEFAULT_FLOOR``) matches are kept.
+    """
+    width, height = plan_size
+    catalog: Catalog = {}
+    for entry in sensors:
+        sensor_id = entry.get("id")
+        coords = sensor_coords.get(sensor_id)
+        if coords is None or not _on_floor(entry, floor):
+            continue
+        dtype = SENSOR_DTYPES.get(str(entry.get("type", "")).upper(), "sensor")
+        catalog[sensor_id] = (coords[0] / width, coords[1] / height, dtype)
+    for entry in cameras:
+        if "x" not in entry or "y" not in entry or not _on_floor(entry, floor):
+            continue
+        catalog[str(entry["id"])] = (
+            entry["x"] / CAMERA_UNITS,
+            entry["y"] / CAMERA_UNITS,
+            "camera",
+        )
+    return catalog
+
+
+def floors_from_config(
+    sensors: Iterable[Mapping],
+    cameras: Iterable[Mapping],
+    sensor_coords: Mapping[str, Tuple[int, int]],
+    images: Optional[Mapping[str, Path]] = None,
+) -> List[FloorSpec]:
+    """Group the configured devices into floors, in order of first appearance."""
+    sensors, cameras = list(sensors), list(cameras)
+    names: List[str] = []
+    for entry in sensors + cameras:
+        name = entry.get("floor", DEFAULT_FLOOR)
+        if name not in names:
+            names.append(name)
+    images = images or {}
+    return [
+        FloorSpec(
+            name,
+            build_device_catalog(sensors, cameras, sensor_coords, floor=name),
+            image=images.get(name),
+        )
+        for name in names or [DEFAULT_FLOOR]
+    ]
+
+
+@lru_cache(maxsize=1)
+def default_device_catalog() -> Catalog:
+    """Catalog of the default SafeHome installation (``system_defaults``)."""
+    from src.core.system_defaults import CAMERAS, SENSOR_COORDS, SENSORS
+
+    return build_device_catalog(SENSORS, CAMERAS, SENSOR_COORDS)
+
+
+def default_floors() -> List[FloorSpec]:
+    """Floors of the default installation; the ground floor uses floorplan.png."""
+    from src.core.system_defaults import CAMERAS, SENSOR_COORDS, SENSORS
+
+    from .rendering.image_loader import find_floorplan_image
+
+    image = find_floorplan_image()
+    images = {DEFAULT_FLOOR: image} if image is not None else None
+    return floors_from_config(SENSORS, CAMERAS, SENSOR_COORDS, images)
+
+
+def _on_floor(entry: Mapping, floor: Optional[str]) -> bool:
+    return floor is None or entry.get("floor", DEFAULT_FLOOR) == floor
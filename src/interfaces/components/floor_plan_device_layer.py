@@ -2,20 +2,73 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import tkinter as tk
+from math import sqrt
 
-from .floor_plan_data import DEVICES
-from .rendering.device_icon import draw_device_icon
+from .floor_plan_catalog import default_device_catalog
+from .floor_plan_spatial import SpatialGrid
+from .rendering.device_icon import device_style, draw_cluster_icon, draw_device_icon
 
+Viewport = Tuple[float, float, float, float]
 
-class DeviceLayer:
-    """Handles drawing devices and returning their positions."""
 
-    def __init__(self, show_cameras: bool = True, show_sensors: bool = True):
+class DeviceLayer:
+    """Handles drawing devices and returning their positions.
+
+    ``render`` lays out every device in a spatial index but only creates
+    canvas items for the ones inside the viewport (all of them when there is
+    none); ``set_viewport`` adds and removes items as the view moves, and
+    ``update`` only reconfigures icons whose armed/selected style changed.
+
+    Detail follows the zoom: with more than ``MAX_ICONS`` devices in view
+    they are binned into about ``MAX_CLUSTERS`` numbered badges, and labels
+    are left out while the plan is drawn smaller than ``LABEL_SCALE``.
+    """
+
+    MAX_ICONS = 400
+    MAX_CLUSTERS = 100
+    CLUSTER_CELL = 64
+    LABEL_SCALE = 0.75
+
+    def __init__(self, show_cameras: bool = True, show_sensors: bool = True,
+                 devices: Optional[Dict[str, Tuple[float, float, str]]] = None,
+                 size: Optional[Tuple[int, int]] = None):
         self._show_cameras = show_cameras
         self._show_sensors = show_sensors
+        self._devices = default_device_catalog() if devices is None else devices
+        self._size = size or (FloorPlanGeometry.ORIGINAL_IMG_WIDTH,
+                              FloorPlanGeometry.ORIGINAL_IMG_HEIGHT)
+        self._items: Dict[str, int] = {}
+        self._styles: Dict[str, Tuple[str, int]] = {}
+        self._clusters: Dict[Tuple[int, int], Tuple[int, Tuple[str, ...]]] = {}
+        self._cluster_styles: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        self._labels = True
+        self._extent: Tuple[float, float] = self._size
+        self._rendered = False
+        self._viewport: Optional[Viewport] = None
+        self._click_handler: Optional[Callable[[str, str], None]] = None
+        self._cluster_handler: Optional[Callable[[int, int], None]] = None
+        self.index = SpatialGrid()
+
+    @property
+    def drawn(self) -> bool:
+        return self._rendered
+
+    @property
+    def visible(self) -> Tuple[str, ...]:
+        """Ids of the devices that currently have canvas items."""
+        return tuple(self._items)
+
+    @property
+    def clusters(self) -> Dict[Tuple[int, int], Tuple[str, ...]]:
+        """Device ids behind each cluster badge currently drawn."""
+        return {cell: members for cell, (_, members) in self._clusters.items()}
+
+    @property
+    def devices(self) -> Dict[str, Tuple[float, float, str]]:
+        return self._devices
 
     def render(
         self,
@@ -25,37 +78,150 @@ class DeviceLayer:
         states: Dict[str, bool],
         selected: set[str],
         click_handler: Callable[[str, str], None],
+        viewport: Optional[Viewport] = None,
+        cluster_handler: Optional[Callable[[int, int], None]] = None,
     ) -> Dict[str, Tuple[int, int, str]]:
-        """Draw devices and return {device_id: (x, y, dtype)} positions."""
+        """Draw devices and return {device_id: (x, y, dtype)} positions.
+
+        Positions cover every shown device, including those culled because
+        they lie outside ``viewport``. ``cluster_handler`` receives the canvas
+        point of a clicked cluster badge.
+        """
         positions: Dict[str, Tuple[int, int, str]] = {}
+        self._items, self._styles = {}, {}
+        self._clusters, self._cluster_styles = {}, {}
+        self._click_handler = click_handler
+        self._cluster_handler = cluster_handler
+        self._viewport = viewport
         x_off, y_off = offsets
         scale_x, scale_y = scale
+        width, height = self._size
+        self._labels = min(scale_x, scale_y) >= self.LABEL_SCALE
+        self._extent = (width * scale_x, height * scale_y)
 
-        for dev_id, (nx, ny, dtype) in DEVICES.items():
+        for dev_id, (nx, ny, dtype) in self._devices.items():
             if dtype == "camera" and not self._show_cameras:
                 continue
             if dtype in ("sensor", "motion", "door_sensor") and not self._show_sensors:
                 continue
 
-            orig_x = nx * FloorPlanGeometry.ORIGINAL_IMG_WIDTH
-            orig_y = ny * FloorPlanGeometry.ORIGINAL_IMG_HEIGHT
-            x = int(x_off + orig_x * scale_x)
-            y = int(y_off + orig_y * scale_y)
-            armed = states.get(dev_id, False)
-            is_selected = dev_id in selected
-            draw_device_icon(canvas, dev_id, x, y, dtype, armed, is_selected, click_handler)
+            x = int(x_off + nx * width * scale_x)
+            y = int(y_off + ny * height * scale_y)
             positions[dev_id] = (x, y, dtype)
+
+        self.index = SpatialGrid.build(positions)
+        self._show(canvas, states, selected)
+        self._rendered = True
         return positions
 
+    def set_viewport(
+        self,
+        canvas: tk.Canvas,
+        viewport: Optional[Viewport],
+        states: Dict[str, bool],
+        selected: set[str],
+    ) -> None:
+        """Create items for devices entering ``viewport`` and drop those leaving it."""
+        self._viewport = viewport
+        self._show(canvas, states, selected)
+
+    def update(
+        self,
+        canvas: tk.Canvas,
+        states: Dict[str, bool],
+        selected: set[str],
+        device_ids: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Restyle drawn icons (all, or only ``device_ids``); returns how many changed."""
+        changed = 0
+        for dev_id in self._items if device_ids is None else device_ids:
+            item = self._items.get(dev_id)
+            if item is None:
+                continue
+            style = device_style(states.get(dev_id, False), dev_id in selected)
+            if self._styles.get(dev_id) == style:
+                continue
+            outline, line_width = style
+            canvas.itemconfigure(item, outline=outline, width=line_width)
+            self._styles[dev_id] = style
+            changed += 1
+        for cell, (item, members) in self._clusters.items():
+            style = self._cluster_style(members, states, selected)
+            if self._cluster_styles.get(cell) == style:
+                continue
+            outline, line_width = style
+            canvas.itemconfigure(item, outline=outline, width=line_width)
+            self._cluster_styles[cell] = style
+            changed += 1
+        return changed
+
+    # ------------------------------------------------------------------ #
+    def _in_view(self, viewport: Optional[Viewport]) -> List[str]:
+        if viewport is None:
+            return list(self.index)
+        return self.index.query_rect(*viewport)
+
+    def _show(self, canvas: tk.Canvas, states: Dict[str, bool], selected: set[str]) -> None:
+        wanted = self._in_view(self._viewport)
+        if len(wanted) > self.MAX_ICONS:
+            self._drop_icons(canvas, ())
+            self._draw_clusters(canvas, wanted, states, selected)
+            return
+        if self._clusters:
+            canvas.delete("cluster")
+            self._clusters, self._cluster_styles = {}, {}
+        self._drop_icons(canvas, wanted)
+        for dev_id in wanted:
+            if dev_id not in self._items:
+                self._draw(canvas, dev_id, states, selected)
+
+    def _drop_icons(self, canvas: tk.Canvas, keep: Iterable[str]) -> None:
+        keep = set(keep)
+        for dev_id in [d for d in self._items if d not in keep]:
+            canvas.delete(f"d_{dev_id}")
+            canvas.delete(f"lbl_{dev_id}")
+            del self._items[dev_id]
+            del self._styles[dev_id]
+
+    def _draw(self, canvas: tk.Canvas, dev_id: str, states: Dict[str, bool],
+              selected: set[str]) -> None:
+        x, y, dtype = self.index.position(dev_id)
+        armed = states.get(dev_id, False)
+        is_selected = dev_id in selected
+        oval, _ = draw_device_icon(
+            canvas, dev_id, x, y, dtype, armed, is_selected, self._click_handler,
+            label=self._labels,
+        )
+        self._items[dev_id] = oval
+        self._styles[dev_id] = device_style(armed, is_selected)
+
+    def _draw_clusters(self, canvas: tk.Canvas, dev_ids: List[str],
+                       states: Dict[str, bool], selected: set[str]) -> None:
+        canvas.delete("cluster")
+        self._clusters, self._cluster_styles = {}, {}
+        x0, y0, x1, y1 = self._viewport or (0, 0, *self._extent)
+        cell_size = max(self.CLUSTER_CELL, sqrt(abs((x1 - x0) * (y1 - y0)) / self.MAX_CLUSTERS))
+        for cell, members in self.index.group(dev_ids, cell_size).items():
+            points = [self.index.position(dev_id) for dev_id in members]
+            x = int(sum(p[0] for p in points) / len(points))
+            y = int(sum(p[1] for p in points) / len(points))
+            style = self._cluster_style(members, states, selected)
+            item = draw_cluster_icon(canvas, x, y, len(members), style, self._cluster_handler)
+            self._clusters[cell] = (item, tuple(members))
+            self._cluster_styles[cell] = style
+
+    @staticmethod
+    def _cluster_style(members: Iterable[str], states: Dict[str, bool],
+                       selected: set[str]) -> Tuple[str, int]:
+        members = tuple(members)
+        return device_style(
+            all(states.get(dev_id, False) for dev_id in members),
+            any(dev_id in selected for dev_id in members),
+        )
+
 
 class FloorPlanGeometry:
     """Namespace for shared geometry constants."""
 
     ORIGINAL_IMG_WIDTH = 607
     ORIGINAL_IMG_HEIGHT = 373
-
-
-
-
-
-
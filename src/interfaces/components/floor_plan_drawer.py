@@ -2,7 +2,7 @@
 Drawing utility for the FloorPlan component.
 """
 import tkinter as tk
-from .floor_plan_definitions import DEVICES
+from .floor_plan_catalog import default_device_catalog
 from .floor_plan_data import DEVICE_COLORS
 
 def draw_fallback(canvas: tk.Canvas, width: int, height: int):
@@ -30,7 +30,7 @@ def draw_devices(
     handle_click: callable
 ):
     """Draw device icons at calculated positions."""
-    for dev_id, (nx, ny, dtype) in DEVICES.items():
+    for dev_id, (nx, ny, dtype) in default_device_catalog().items():
         if (dtype == 'camera' and not show_cameras) or \
            (dtype in ('sensor', 'motion', 'door_sensor') and not show_sensors):
             continue
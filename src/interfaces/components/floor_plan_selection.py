@@ -7,9 +7,20 @@ from typing import TYPE_CHECKING, Callable, Optional, Set, Tuple
 if TYPE_CHECKING:
     import tkinter as tk
 
+    from .floor_plan_device_layer import DeviceLayer
+
+
+SENSOR_TYPES = ("sensor", "motion", "door_sensor")
+
 
 class FloorPlanSelectionMixin:
-    """Handles selection and drag operations for floor plan."""
+    """Handles selection and drag operations for floor plan.
+
+    Rubber-band selection and point picking query the device layer's spatial
+    index instead of scanning every device position.
+    """
+
+    HIT_RADIUS = 12  # icon radius plus a little slack
 
     _canvas: Optional["tk.Canvas"]
     _select_mode: bool
@@ -19,6 +30,7 @@ class FloorPlanSelectionMixin:
     _drag_start: Optional[Tuple[int, int]]
     _drag_rect: Optional[int]
     _drag_bound: bool
+    _device_layer: "DeviceLayer"
 
     def _bind_drag_events(self):
         if self._drag_bound or not self._canvas:
@@ -67,17 +79,17 @@ class FloorPlanSelectionMixin:
             self._canvas.delete(self._drag_rect)
         self._drag_rect = None
 
+    def device_at(self, x: float, y: float) -> Optional[str]:
+        """Id of the device icon under canvas point (x, y), if any."""
+        return self._device_layer.index.nearest(x, y, self.HIT_RADIUS)
+
     def _select_sensors_in_box(self, x0: float, y0: float, x1: float, y1: float):
-        min_x, max_x = sorted([x0, x1])
-        min_y, max_y = sorted([y0, y1])
         newly_added = []
-        for dev_id, (dx, dy, dtype) in self._device_positions.items():
-            if dtype not in ("sensor", "motion", "door_sensor"):
-                continue
-            if min_x <= dx <= max_x and min_y <= dy <= max_y:
-                if dev_id not in self._selected:
-                    self._selected.add(dev_id)
-                    newly_added.append((dev_id, dtype))
+        index = self._device_layer.index
+        for dev_id in index.query_rect(x0, y0, x1, y1, types=SENSOR_TYPES):
+            if dev_id not in self._selected:
+                self._selected.add(dev_id)
+                newly_added.append((dev_id, index.position(dev_id)[2]))
         if newly_added:
             self.refresh()
             if self._on_sensor_click:
@@ -0,0 +1,117 @@
+"""Uniform-grid spatial index over floor plan device positions."""
+
+from __future__ import annotations
+
+from math import floor, hypot
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+Position = Tuple[float, float, str]
+
+
+class SpatialGrid:
+    """Buckets devices into square cells for rectangle and point queries.
+
+    Queries only visit the cells overlapping the requested area, so rubber
+    band selection, hit testing and viewport culling cost grows with the
+    devices near the area rather than with the whole plan.
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List[str]] = {}
+        self._positions: Dict[str, Position] = {}
+
+    @classmethod
+    def build(cls, positions: Dict[str, Position], cell_size: float = 64.0) -> "SpatialGrid":
+        grid = cls(cell_size)
+        for dev_id, (x, y, dtype) in positions.items():
+            grid.insert(dev_id, x, y, dtype)
+        return grid
+
+    def insert(self, dev_id: str, x: float, y: float, dtype: str) -> None:
+        if dev_id in self._positions:
+            self.remove(dev_id)
+        self._positions[dev_id] = (x, y, dtype)
+        self._cells.setdefault(self._cell(x, y), []).append(dev_id)
+
+    def remove(self, dev_id: str) -> None:
+        position = self._positions.pop(dev_id, None)
+        if position is None:
+            return
+        cell = self._cell(position[0], position[1])
+        members = self._cells.get(cell, [])
+        if dev_id in members:
+            members.remove(dev_id)
+        if not members:
+            self._cells.pop(cell, None)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._positions.clear()
+
+    def position(self, dev_id: str) -> Optional[Position]:
+        return self._positions.get(dev_id)
+
+    def query_rect(
+        self, x0: float, y0: float, x1: float, y1: float,
+        types: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Devices inside the rectangle (edges included), optionally of ``types``."""
+        min_x, max_x = sorted((x0, x1))
+        min_y, max_y = sorted((y0, y1))
+        wanted = set(types) if types is not None else None
+        found = []
+        for dev_id in self._candidates(min_x, min_y, max_x, max_y):
+            x, y, dtype = self._positions[dev_id]
+            if wanted is not None and dtype not in wanted:
+                continue
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                found.append(dev_id)
+        return found
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[str]:
+        """Closest device within ``radius`` of the point, if any."""
+        best, best_dist = None, radius
+        for dev_id in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            dx, dy, _ = self._positions[dev_id]
+            dist = hypot(dx - x, dy - y)
+            if dist <= best_dist:
+                best, best_dist = dev_id, dist
+        return best
+
+    def group(
+        self, dev_ids: Iterable[str], cell_size: Optional[float] = None
+    ) -> Dict[Tuple[int, int], List[str]]:
+        """Split ``dev_ids`` into square cells of ``cell_size`` (clusters of nearby devices)."""
+        size = cell_size or self.cell_size
+        groups: Dict[Tuple[int, int], List[str]] = {}
+        for dev_id in dev_ids:
+            x, y, _ = self._positions[dev_id]
+            groups.setdefault((floor(x / size), floor(y / size)), []).append(dev_id)
+        return groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._positions))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, dev_id: str) -> bool:
+        return dev_id in self._positions
+
+    # ------------------------------------------------------------------ #
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def _candidates(self, min_x, min_y, max_x, max_y) -> Iterator[str]:
+        cx0, cy0 = self._cell(min_x, min_y)
+        cx1, cy1 = self._cell(max_x, max_y)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            # Area spans more cells than are occupied: walk the occupied ones
+            for (cx, cy), members in self._cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    yield from members
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                yield from self._cells.get((cx, cy), ())
@@ -0,0 +1,197 @@
+"""Tiled, multi-resolution floor plan backgrounds."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from math import ceil, floor, log2
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image, ImageTk
+
+    from src.resources.image_cache import get_image_cache
+    HAS_PIL = True
+except ImportError:  # pragma: no cover
+    HAS_PIL = False
+
+from .rendering.fallback_drawing import draw_fallback_layout
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+    from .floor_plan_catalog import FloorSpec
+
+TileKey = Tuple[int, int, int]  # (level, col, row)
+Rect = Tuple[float, float, float, float]
+
+
+class TilePyramid:
+    """Serves a floor background as square tiles at power-of-two resolutions.
+
+    Level 0 is full resolution and each level above halves it, so a zoomed
+    out view reads a few coarse tiles instead of the whole image. Tiles come
+    from a pre-cut ``template`` (``"{level}/{col}_{row}.png"``) or are cut
+    from a single ``image`` (the size of the plan) on first use; at most
+    ``max_tiles`` are kept.
+    """
+
+    TILE_SIZE = 256
+    MAX_TILES = 64
+
+    def __init__(
+        self,
+        size: Tuple[int, int],
+        image: Optional[Path] = None,
+        template: Optional[str] = None,
+        tile_size: int = TILE_SIZE,
+        max_tiles: int = MAX_TILES,
+    ):
+        self.size = (int(size[0]), int(size[1]))
+        self.tile_size = int(tile_size)
+        self.max_tiles = max(1, int(max_tiles))
+        self._image = image
+        self._template = template
+        self._tiles: "OrderedDict[TileKey, Optional[Image.Image]]" = OrderedDict()
+        self.loads = 0
+
+    @classmethod
+    def for_floor(cls, floor: "FloorSpec") -> Optional["TilePyramid"]:
+        if not HAS_PIL or (floor.image is None and floor.tiles is None):
+            return None
+        return cls(floor.size, image=floor.image, template=floor.tiles)
+
+    @property
+    def levels(self) -> int:
+        """Levels needed until the whole plan fits in a single tile."""
+        longest = max(self.size)
+        return 1 + max(0, ceil(log2(longest / self.tile_size))) if longest else 1
+
+    def level_for(self, scale: float) -> int:
+        """Coarsest level that still has at least ``scale`` pixels per plan pixel."""
+        if scale >= 1.0:
+            return 0
+        return min(self.levels - 1, floor(log2(1.0 / scale)))
+
+    def tiles_in(self, rect: Rect, scale: float) -> List[Tuple[TileKey, Rect]]:
+        """Tiles covering ``rect`` (canvas pixels at ``scale``) with their plan boxes."""
+        level = self.level_for(scale)
+        span = self.tile_size * (1 << level)
+        width, height = self.size
+        x0, y0 = max(0.0, rect[0] / scale), max(0.0, rect[1] / scale)
+        x1, y1 = min(width, rect[2] / scale), min(height, rect[3] / scale)
+        if x1 <= x0 or y1 <= y0:
+            return []
+        return [
+            (
+                (level, col, row),
+                (col * span, row * span, min(width, (col + 1) * span), min(height, (row + 1) * span)),
+            )
+            for col in range(int(x0 // span), int(ceil(x1 / span)))
+            for row in range(int(y0 // span), int(ceil(y1 / span)))
+        ]
+
+    def tile(self, key: TileKey) -> Optional["Image.Image"]:
+        """Image of one tile (``None`` if its source is missing), loaded on first use."""
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+        image = self._load(key)
+        self.loads += 1
+        self._tiles[key] = image
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return image
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    # ------------------------------------------------------------------ #
+    def _load(self, key: TileKey) -> Optional["Image.Image"]:
+        level, col, row = key
+        if self._template is not None:
+            path = Path(self._template.format(level=level, col=col, row=row))
+            if not path.exists():
+                return None
+            with Image.open(path) as image:
+                image.load()
+                return image.copy()
+        span = self.tile_size * (1 << level)
+        source = get_image_cache().load(self._image)
+        box = (col * span, row * span, min(source.width, (col + 1) * span),
+               min(source.height, (row + 1) * span))
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return None
+        tile = source.crop(box)
+        if level:
+            tile = tile.resize(
+                (max(1, ceil(tile.width / (1 << level))), max(1, ceil(tile.height / (1 << level)))),
+                Image.BILINEAR,
+            )
+        return tile
+
+
+class BackgroundLayer:
+    """Keeps canvas images only for the background tiles in view.
+
+    Without a pyramid, or when Tk images cannot be created, the simple room
+    layout is drawn instead.
+    """
+
+    def __init__(self, pyramid: Optional[TilePyramid], size: Tuple[int, int]):
+        self.pyramid = pyramid
+        self._size = size
+        self._items: Dict[TileKey, Tuple[int, object]] = {}
+        self._scale = 1.0
+        self._fallback = False
+
+    @property
+    def visible(self) -> Tuple[TileKey, ...]:
+        return tuple(self._items)
+
+    def render(self, canvas: "tk.Canvas", scale: float, rect: Rect) -> None:
+        self._items = {}
+        self._scale = scale
+        self._fallback = self.pyramid is None
+        if self._fallback:
+            self._draw_fallback(canvas)
+        else:
+            self.set_viewport(canvas, rect)
+
+    def set_viewport(self, canvas: "tk.Canvas", rect: Rect) -> None:
+        if self._fallback:
+            return
+        wanted = dict(self.pyramid.tiles_in(rect, self._scale))
+        for key in [k for k in self._items if k not in wanted]:
+            canvas.delete(self._items.pop(key)[0])
+        for key, box in wanted.items():
+            if key not in self._items:
+                try:
+                    self._draw_tile(canvas, key, box)
+                except Exception:  # e.g. no Tk root to own the images
+                    self._drop(canvas)
+                    self._fallback = True
+                    self._draw_fallback(canvas)
+                    return
+
+    # ------------------------------------------------------------------ #
+    def _draw_tile(self, canvas: "tk.Canvas", key: TileKey, box: Rect) -> None:
+        image = self.pyramid.tile(key)
+        if image is None:
+            return
+        x0, y0 = round(box[0] * self._scale), round(box[1] * self._scale)
+        size = (max(1, round(box[2] * self._scale) - x0), max(1, round(box[3] * self._scale) - y0))
+        if image.size != size:
+            image = image.resize(size, Image.BILINEAR)
+        photo = ImageTk.PhotoImage(image)
+        item = canvas.create_image(x0, y0, image=photo, anchor="nw", tags=("tile",))
+        canvas.tag_lower(item)
+        self._items[key] = (item, photo)
+
+    def _draw_fallback(self, canvas: "tk.Canvas") -> None:
+        draw_fallback_layout(canvas, self._size[0] * self._scale, self._size[1] * self._scale)
+
+    def _drop(self, canvas: "tk.Canvas") -> None:
+        for item, _ in self._items.values():
+            canvas.delete(item)
+        self._items = {}
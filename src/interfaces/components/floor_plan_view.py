@@ -0,0 +1,128 @@
+"""Floor plan pan and zoom handling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+    from .floor_plan_catalog import FloorSpec
+
+
+class FloorPlanViewMixin:
+    """Pans and zooms the floor plan.
+
+    Items are laid out at ``plan pixels * zoom`` and panning scrolls the
+    canvas, so device positions only change when the zoom does. Every move
+    narrows the device and background layers to the part of the plan in
+    view. The wheel zooms around the pointer; dragging with the right
+    button pans.
+    """
+
+    MIN_ZOOM = 0.05
+    MAX_ZOOM = 8.0
+    WHEEL_STEP = 1.25
+
+    _canvas: Optional["tk.Canvas"]
+    _floor: "FloorSpec"
+    _viewport: Optional[Tuple[float, float, float, float]]
+    _zoom: float
+    _origin: Tuple[float, float]
+    _view_size: Tuple[int, int]
+    _pan_anchor: Optional[Tuple[int, int]]
+
+    @property
+    def zoom(self) -> float:
+        return self._zoom
+
+    @property
+    def view(self) -> Tuple[float, float, float, float]:
+        """Visible area in canvas coordinates ``(x0, y0, x1, y1)``."""
+        x, y = self._origin
+        return x, y, x + self._view_size[0], y + self._view_size[1]
+
+    def set_zoom(self, zoom: float, x: Optional[float] = None, y: Optional[float] = None):
+        """Zoom so the point at window position (x, y) (default: centre) stays put."""
+        zoom = min(self.MAX_ZOOM, max(self.MIN_ZOOM, zoom))
+        if x is None or y is None:
+            x, y = self._view_size[0] / 2, self._view_size[1] / 2
+        plan_x = (self._origin[0] + x) / self._zoom
+        plan_y = (self._origin[1] + y) / self._zoom
+        self._zoom = zoom
+        self._origin = self._clamp(plan_x * zoom - x, plan_y * zoom - y)
+        self._viewport = self.view
+        self._draw()
+        self._scroll()
+
+    def zoom_by(self, factor: float, x: Optional[float] = None, y: Optional[float] = None):
+        self.set_zoom(self._zoom * factor, x, y)
+
+    def pan(self, dx: float, dy: float):
+        """Scroll the view by (dx, dy) canvas pixels."""
+        origin = self._clamp(self._origin[0] + dx, self._origin[1] + dy)
+        if origin == self._origin:
+            return
+        self._origin = origin
+        self._scroll()
+        self.set_viewport(self.view)
+
+    def reset_view(self):
+        self._zoom, self._origin = self._fit_zoom(), (0.0, 0.0)
+        self._viewport = None
+        self._draw()
+        self._scroll()
+
+    # ------------------------------------------------------------------ #
+    def _bind_view_events(self):
+        if not self._canvas:
+            return
+        self._canvas.bind("<MouseWheel>", self._on_wheel)
+        self._canvas.bind("<Button-4>", self._on_wheel)
+        self._canvas.bind("<Button-5>", self._on_wheel)
+        self._canvas.bind("<ButtonPress-3>", self._on_pan_start)
+        self._canvas.bind("<B3-Motion>", self._on_pan_drag)
+
+    def _on_wheel(self, event):
+        zoom_in = getattr(event, "delta", 0) > 0 or getattr(event, "num", None) == 4
+        self.zoom_by(self.WHEEL_STEP if zoom_in else 1 / self.WHEEL_STEP, event.x, event.y)
+
+    def _on_pan_start(self, event):
+        self._pan_anchor = (event.x, event.y)
+
+    def _on_pan_drag(self, event):
+        if self._pan_anchor is None:
+            return
+        x0, y0 = self._pan_anchor
+        self._pan_anchor = (event.x, event.y)
+        self.pan(x0 - event.x, y0 - event.y)
+
+    def _zoom_to_cluster(self, x: float, y: float):
+        """Clicking a cluster badge zooms in 2x around it."""
+        self.zoom_by(2.0, x - self._origin[0], y - self._origin[1])
+
+    def _fit_zoom(self) -> float:
+        """Natural size, or small enough for a large floor to fit the view."""
+        width, height = self._floor.size
+        return min(1.0, self._view_size[0] / width, self._view_size[1] / height)
+
+    def _extent(self) -> Tuple[float, float]:
+        width, height = self._floor.size
+        return width * self._zoom, height * self._zoom
+
+    def _clamp(self, x: float, y: float) -> Tuple[float, float]:
+        width, height = self._extent()
+        return (
+            min(max(0.0, x), max(0.0, width - self._view_size[0])),
+            min(max(0.0, y), max(0.0, height - self._view_size[1])),
+        )
+
+    def _scroll(self):
+        """Point the canvas at ``_origin`` within the plan's scroll region."""
+        if not self._canvas:
+            return
+        width, height = self._extent()
+        width, height = max(width, self._view_size[0]), max(height, self._view_size[1])
+        self._canvas.configure(scrollregion=(0, 0, width, height))
+        self._canvas.xview_moveto(self._origin[0] / width)
+        self._canvas.yview_moveto(self._origin[1] / height)
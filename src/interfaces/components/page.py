@@ -2,7 +2,8 @@
 import tkinter as tk
 from tkinter import ttk
 from abc import ABC, abstractmethod
-from typing import Optional, Any, TYPE_CHECKING
+from concurrent.futures import Future
+from typing import Callable, Optional, Any, TYPE_CHECKING
 
 from .page_helpers import PageHelpersMixin
 
@@ -58,6 +59,11 @@ class Page(PageHelpersMixin, ABC):
     
     def send_to_system(self, command: str, **kwargs) -> Any:
         return self._web_interface.send_message(command, **kwargs)
+
+    def send_message_async(self, command: str,
+                           callback: Optional[Callable[[dict], None]] = None, **kwargs) -> Future:
+        """Like ``send_to_system`` without blocking the UI; ``callback`` runs on the Tk thread."""
+        return self._web_interface.send_message_async(command, callback, **kwargs)
     
     def navigate_to(self, page_name: str) -> None:
         self._web_interface.show_page(page_name)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Optional, Tuple
 
 from ...utils import sensor_display_name
 from ..floor_plan_data import DEVICE_COLORS
@@ -18,20 +18,18 @@ def draw_device_icon(
     armed: bool,
     selected: bool,
     click_handler: Callable[[str, str], None],
-) -> None:
-    """Draw sensor icon with state colors and click binding."""
+    label: bool = True,
+) -> Tuple[int, Optional[int]]:
+    """Draw sensor icon with state colors and click binding.
+
+    Returns the canvas ids of the icon and its label (``None`` without one).
+    """
     radius = 10
     fill_color = DEVICE_COLORS.get(device_type, "#666")
-
-    if selected:
-        outline, line_width = "#f39c12", 3
-    elif armed:
-        outline, line_width = "#27ae60", 3
-    else:
-        outline, line_width = "#333", 2
+    outline, line_width = device_style(armed, selected)
 
     tag = f"d_{device_id}"
-    canvas.create_oval(
+    oval = canvas.create_oval(
         x - radius,
         y - radius,
         x + radius,
@@ -41,17 +39,58 @@ def draw_device_icon(
         width=line_width,
         tags=(tag, "device", device_type),
     )
-    canvas.create_text(
-        x,
-        y + 16,
-        text=sensor_display_name(device_id, device_type),
-        font=("Arial", 9, "bold"),
-        fill="#333",
-        tags=(f"lbl_{device_id}",),
-    )
+    text = None
+    if label:
+        text = canvas.create_text(
+            x,
+            y + 16,
+            text=sensor_display_name(device_id, device_type),
+            font=("Arial", 9, "bold"),
+            fill="#333",
+            tags=(f"lbl_{device_id}",),
+        )
     canvas.tag_bind(
         tag,
         "<Button-1>",
         lambda event, dev=device_id, dtype=device_type: click_handler(dev, dtype),
     )
+    return oval, text
+
 
+def device_style(armed: bool, selected: bool) -> Tuple[str, int]:
+    """Outline color and width of a device icon for its state."""
+    if selected:
+        return "#f39c12", 3
+    if armed:
+        return "#27ae60", 3
+    return "#333", 2
+
+
+
+def draw_cluster_icon(
+    canvas: tk.Canvas,
+    x: int,
+    y: int,
+    count: int,
+    style: Tuple[str, int],
+    click_handler: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Draw a badge standing for ``count`` nearby devices; returns its canvas id."""
+    radius = 10 + 2 * len(str(count))
+    outline, line_width = style
+    oval = canvas.create_oval(
+        x - radius,
+        y - radius,
+        x + radius,
+        y + radius,
+        fill="#7f8c8d",
+        outline=outline,
+        width=line_width,
+        tags=("cluster",),
+    )
+    canvas.create_text(
+        x, y, text=str(count), font=("Arial", 9, "bold"), fill="#fff", tags=("cluster",)
+    )
+    if click_handler is not None:
+        canvas.tag_bind(oval, "<Button-1>", lambda event: click_handler(x, y))
+    return oval
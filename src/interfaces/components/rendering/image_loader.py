@@ -9,6 +9,8 @@ from src.resources import get_image
 
 try:
     from PIL import Image, ImageTk
+
+    from src.resources.image_cache import get_image_cache
     HAS_PIL = True
 except ImportError:  # pragma: no cover
     HAS_PIL = False
@@ -36,7 +38,8 @@ def load_floorplan_image(canvas: tk.Canvas, width: int, height: int):
         return None
 
     try:
-        img = Image.open(img_path)
+        # Decoded once per process; each canvas only wraps it in a PhotoImage
+        img = get_image_cache().load(img_path)
         photo = ImageTk.PhotoImage(img)
         canvas.create_image(0, 0, image=photo, anchor="nw")
         return photo, 0, 0, 1.0, 1.0
@@ -1,7 +1,9 @@
 """SafeHomeControlPanel - Main control panel class."""
 
-from typing import TYPE_CHECKING
-from src.devices.device_control_panel_abstract import DeviceControlPanelAbstract
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Optional
+from .device_control_panel_abstract import DeviceControlPanelAbstract
+from ..async_dispatcher import AsyncDispatcher
 from .button_mixin import ButtonMixin
 from .panic_handler import PanicVerificationMixin
 from .handlers import (
@@ -42,6 +44,7 @@ class SafeHomeControlPanel(
         self._transitions = StateTransitions(self)
         self._security = SecurityActions(self)
         self._display.init_off_display()
+        self._display.subscribe_status()
         self._apply_security_policy()
         self._panic_prev_state = None
         self._panic_lock_id = None
@@ -65,6 +68,27 @@ class SafeHomeControlPanel(
     def send_command(self, cmd: str, **kw) -> dict:
         return self.send_request(cmd, **kw)
 
+    def send_request_async(
+        self, cmd: str, callback: Optional[Callable[[dict], None]] = None, **kw
+    ) -> Future:
+        """``send_request`` on a worker thread; ``callback`` runs on the Tk thread."""
+        return self._get_dispatcher().submit(cmd, callback, **kw)
+
+    def _get_dispatcher(self) -> AsyncDispatcher:
+        dispatcher = getattr(self, "_dispatcher", None)
+        if dispatcher is None:
+            dispatcher = self._dispatcher = AsyncDispatcher(self.send_request, self)
+        return dispatcher
+
+    def destroy(self):
+        display = getattr(self, "_display", None)
+        if display is not None:
+            display.unsubscribe_status()
+        dispatcher = getattr(self, "_dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.shutdown()
+        super().destroy()
+
     def restore_state(self, state: str):
         self._state = state
         if state == self.STATE_LOGGED_IN:
@@ -74,18 +98,15 @@ class SafeHomeControlPanel(
         self._update_leds()
 
     def _update_leds(self):
-        res = self._system_ctrl.get_status()
-        if res.get("success"):
-            self._display.update_leds_from_status(res.get("data", {}))
+        self._display.refresh_leds()
 
     def handle_alarm_event(self, data: dict):
         self._alarm.handle_event(data)
 
     def _apply_security_policy(self):
-        try:
-            res = self.send_request("get_system_settings")
-        except Exception:
-            return
+        self.send_request_async("get_system_settings", self._on_system_settings)
+
+    def _on_system_settings(self, res: dict):
         if not isinstance(res, dict) or not res.get("success"):
             return
         data = res.get("data", {})
@@ -13,14 +13,7 @@ class LoggedInState(ControlPanelState):
         pass
 
     def _update_leds(self) -> None:
-        res = self._req('get_status')
-        if res.get('success'):
-            d = res.get('data', {})
-            armed = d.get('armed', False)
-            mode = d.get('mode', 'DISARMED')
-            self._panel.set_armed_led(armed)
-            self._panel.set_display_away(mode == 'AWAY')
-            self._panel.set_display_stay(mode == 'HOME')
+        self._panel._update_leds()
 
     def handle_button3(self) -> None: # Turn off
         self._panel.set_display_short_message1("Stopping...")
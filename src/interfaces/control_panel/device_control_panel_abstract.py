@@ -9,7 +9,7 @@ from .control_panel_ui_layout import (
     create_led_panel,
 )
 from .control_panel_buttons import create_button_panel
-from .control_panel_buttons_base import ControlPanelButtonCallbacks
+from src.devices.control_panel_buttons_base import ControlPanelButtonCallbacks
 
 
 class DeviceControlPanelAbstract(ControlPanelButtonCallbacks, tk.Toplevel, ABC):
@@ -34,7 +34,12 @@ class AlarmHandler:
         if self._panel.is_off:
             return
 
-        res = self._panel.send_request("get_alarm_status")
+        self._panel.send_request_async("get_alarm_status", self._on_alarm_status)
+
+    def _on_alarm_status(self, res: dict):
+        """Apply a polled alarm status and schedule the next poll."""
+        if self._panel.is_off:
+            return
         if res.get("success"):
             data = res.get("data", {})
             is_alarm = data.get("alarm_active", False)
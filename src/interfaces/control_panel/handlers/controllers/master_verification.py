@@ -10,19 +10,20 @@ from .password_buffer import PasswordBuffer
 class MasterVerification:
     """Allows verifying master password without logging in."""
 
-    def __init__(self, send_request: Callable[..., Dict], display_cb: Callable[[str], None]):
+    def __init__(self, send_request_async: Callable[..., object], display_cb: Callable[[str], None]):
         self._buffer = PasswordBuffer()
-        self._send_request = send_request
+        self._send_request_async = send_request_async
         self._display_cb = display_cb
 
     def add_digit(self, digit: str, on_complete: Callable[[], None]):
         self._buffer.add_digit(digit, on_complete, self._display_cb)
 
-    def verify(self) -> Dict:
+    def verify(self, callback: Callable[[Dict], None]):
         code = self._buffer.consume()
         if not code:
-            return {"success": False, "message": "Enter password"}
-        return self._send_request("verify_control_panel_password", password=code)
+            callback({"success": False, "message": "Enter password"})
+            return
+        self._send_request_async("verify_control_panel_password", callback, password=code)
 
     def reset(self):
         self._buffer.reset()
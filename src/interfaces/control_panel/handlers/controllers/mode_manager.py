@@ -53,7 +53,10 @@ class ControlPanelModeManager:
         self._panel.after(300, self.turn_on)
 
     def try_login(self):
-        if self._panel._password.try_login():
+        self._panel._password.try_login(self._login_finished)
+
+    def _login_finished(self, logged_in: bool):
+        if logged_in:
             self._panel._state = self._panel.STATE_LOGGED_IN
             self._panel._display.show_welcome(self._panel._password.access_level)
             self._panel._display.cancel_lock_countdown()
@@ -86,7 +89,9 @@ class ControlPanelModeManager:
         self._panel.set_display_short_message2("")
 
     def finish_pw_change(self):
-        result = self._panel._password.finish_change()
+        self._panel._password.finish_change(self._pw_change_finished)
+
+    def _pw_change_finished(self, result: dict):
         if result.get("success"):
             self._panel._state = self._panel.STATE_LOGGED_IN
             self._panel.set_display_short_message1("Password changed")
@@ -10,9 +10,9 @@ from .password_buffer import PasswordBuffer
 class PasswordChangeFlow:
     """Manages collecting new password digits and submitting to system."""
 
-    def __init__(self, send_request: Callable[..., dict], display_cb: Callable[[str], None]):
+    def __init__(self, send_request_async: Callable[..., object], display_cb: Callable[[str], None]):
         self._buffer = PasswordBuffer()
-        self._send_request = send_request
+        self._send_request_async = send_request_async
         self._display_cb = display_cb
 
     def start(self):
@@ -25,15 +25,17 @@ class PasswordChangeFlow:
     def add_digit(self, digit: str, on_complete: Callable[[], None]):
         self._buffer.add_digit(digit, on_complete, self._display_cb)
 
-    def finish(self, current_password: str):
+    def finish(self, current_password: str, callback: Callable[[dict, str], None]):
+        """Submit the new password; ``callback(response, new_code)`` gets the answer."""
         new_code = self._buffer.consume()
         if not new_code:
-            return {"success": False, "message": "Enter password"}, ""
-        response = self._send_request(
+            callback({"success": False, "message": "Enter password"}, "")
+            return
+        self._send_request_async(
             "change_password",
+            lambda response: callback(response, new_code),
             current_password=current_password,
             new_password=new_code,
         )
-        return response, new_code
 
 
@@ -1,4 +1,5 @@
 """Display and LED handler for control panel."""
+import threading
 from typing import TYPE_CHECKING
 
 from .display.messages import DisplayMessages
@@ -10,12 +11,20 @@ if TYPE_CHECKING:
 
 
 class DisplayHandler:
-    """Coordinates text display, LEDs, and lock countdown."""
+    """Coordinates text display, LEDs, and lock countdown.
+
+    LEDs follow mode and alarm changes pushed by the system
+    (``subscribe_status_events``); keypad transitions only re-apply the last
+    pushed status, so they never wait on a full ``get_status``.
+    """
 
     def __init__(self, panel: "SafeHomeControlPanel"):
+        self._panel = panel
         self._messages = DisplayMessages(panel)
         self._leds = LedController(panel)
         self._lock = LockCountdown(panel, self._messages)
+        self._status = {}
+        self._subscribed = False
 
     def init_off_display(self):
         self._lock.cancel()
@@ -54,7 +63,35 @@ class DisplayHandler:
         self._messages.show_resetting()
 
     def update_leds_from_status(self, data: dict):
-        self._leds.update_from_status(data)
+        self._status = dict(data)
+        if not self._panel.is_off:
+            self._leds.update_from_status(self._status)
+
+    def refresh_leds(self):
+        """Re-apply the last pushed status, subscribing on first use."""
+        if not self._subscribed:
+            self.subscribe_status()
+        else:
+            self.update_leds_from_status(self._status)
+
+    def subscribe_status(self):
+        res = self._panel.send_request("subscribe_status_events", callback=self._on_status_event)
+        if res.get("success"):
+            self._subscribed = True
+            self.update_leds_from_status(res.get("data", {}))
+
+    def unsubscribe_status(self):
+        if self._subscribed:
+            self._subscribed = False
+            self._panel.send_request("unsubscribe_status_events", callback=self._on_status_event)
+
+    def _on_status_event(self, data: dict):
+        if threading.current_thread() is threading.main_thread():
+            self.update_leds_from_status(data)
+        else:
+            # Changes made on worker threads (e.g. web requests) must not touch
+            # Tk here; the panel's dispatcher wakes the Tk thread to apply them.
+            self._panel._get_dispatcher().post(lambda: self.update_leds_from_status(data))
 
     def start_lock_countdown(self, total_seconds: int):
         self._lock.start(total_seconds)
@@ -20,8 +20,8 @@ class PasswordHandler:
         self._panel = panel
         self._buffer = PasswordBuffer()
         self._guard = LoginGuard(self.MAX_ATTEMPTS, self.LOCK_TIME_MS)
-        self._change_flow = PasswordChangeFlow(panel.send_request, self._display_mask)
-        self._master_verification = MasterVerification(panel.send_request, self._display_mask)
+        self._change_flow = PasswordChangeFlow(panel.send_request_async, self._display_mask)
+        self._master_verification = MasterVerification(panel.send_request_async, self._display_mask)
         self._access_level: Optional[str] = None
         self._last_code: Optional[str] = None
 
@@ -46,16 +46,21 @@ class PasswordHandler:
     # ------------------------------------------------------------------ #
     # Login / Attempts
     # ------------------------------------------------------------------ #
-    def try_login(self) -> bool:
+    def try_login(self, on_result: Callable[[bool], None]):
+        """Submit the entered code; ``on_result(logged_in)`` runs on the Tk thread."""
         code = self.consume_buffer()
-        res = self._panel.send_request("login_control_panel", password=code)
-        if res.get("success"):
-            self._access_level = res.get("access_level", "GUEST")
-            self._guard.record_success()
-            self._last_code = code
-            return True
-        self._guard.record_failure()
-        return False
+
+        def finished(res: dict):
+            if res.get("success"):
+                self._access_level = res.get("access_level", "GUEST")
+                self._guard.record_success()
+                self._last_code = code
+                on_result(True)
+                return
+            self._guard.record_failure()
+            on_result(False)
+
+        self._panel.send_request_async("login_control_panel", finished, password=code)
 
     def get_remaining_attempts(self) -> int:
         return self._guard.remaining_attempts()
@@ -75,17 +80,19 @@ class PasswordHandler:
     def add_new_digit(self, digit: str, on_complete: Callable[[], None]):
         self._change_flow.add_digit(digit, on_complete)
 
-    def finish_change(self):
-        response, new_code = self._change_flow.finish(self._last_code or "")
-        if response.get("success"):
-            self._last_code = new_code
-        return response
+    def finish_change(self, callback: Callable[[dict], None]):
+        def finished(response: dict, new_code: str):
+            if response.get("success"):
+                self._last_code = new_code
+            callback(response)
+
+        self._change_flow.finish(self._last_code or "", finished)
 
     # ------------------------------------------------------------------ #
     # Master verification (without login)
     # ------------------------------------------------------------------ #
-    def verify_master_code(self):
-        return self._master_verification.verify()
+    def verify_master_code(self, callback: Callable[[dict], None]):
+        self._master_verification.verify(callback)
 
     def add_master_digit(self, digit: str, on_complete: Callable[[], None]):
         self._master_verification.add_digit(digit, on_complete)
@@ -15,7 +15,9 @@ class SecurityActions:
         """Arm system with specified mode."""
         if self._panel._state != self._panel.STATE_LOGGED_IN:
             return
-        res = self._panel._system_ctrl.arm(mode)
+        self._panel._system_ctrl.arm(mode, lambda res: self._armed(mode, res))
+
+    def _armed(self, mode: str, res: dict):
         if res.get("success"):
             self._panel.set_display_short_message1(f"Armed: {mode}")
             self._panel.set_display_short_message2("")
@@ -29,7 +31,9 @@ class SecurityActions:
         """Arm system in HOME (stay) mode."""
         if self._panel._state != self._panel.STATE_LOGGED_IN:
             return
-        res = self._panel._system_ctrl.arm("HOME")
+        self._panel._system_ctrl.arm("HOME", self._armed_home)
+
+    def _armed_home(self, res: dict):
         if res.get("success"):
             self._panel.set_display_short_message1("HOME mode")
             self._panel.set_display_short_message2("Perimeter armed")
@@ -45,11 +49,13 @@ class SecurityActions:
 
     def handle_panic_code(self):
         """Process master password input during panic."""
-        res = self._panel._password.verify_master_code()
+        self._panel._password.verify_master_code(self._panic_code_checked)
+
+    def _panic_code_checked(self, res: dict):
         if res.get("success"):
             self._panel.set_display_short_message1("Panic cleared")
             self._panel.set_display_short_message2("")
-            self._panel.send_request("clear_alarm")
+            self._panel.send_request_async("clear_alarm")
             self._panel.exit_panic_verification()
             return
 
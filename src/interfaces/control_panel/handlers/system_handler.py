@@ -1,43 +1,50 @@
 """System control handler for control panel."""
-from typing import TYPE_CHECKING
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Optional
 
 if TYPE_CHECKING:
     from ..control_panel import SafeHomeControlPanel
 
+Callback = Optional[Callable[[dict], None]]
+
 
 class SystemHandler:
-    """Handles system on/off/reset and arm/disarm."""
+    """Handles system on/off/reset and arm/disarm.
+
+    Requests run on the panel's dispatcher; each returns a Future and calls
+    ``callback(result)`` on the Tk thread when the System answers.
+    """
 
     def __init__(self, panel: "SafeHomeControlPanel"):
         self._panel = panel
 
-    def turn_on(self):
+    def turn_on(self, callback: Callback = None) -> Future:
         """Send turn on command to system."""
-        self._panel.send_request("turn_on")
+        return self._panel.send_request_async("turn_on", callback)
 
-    def turn_off(self):
+    def turn_off(self, callback: Callback = None) -> Future:
         """Send turn off command to system."""
-        self._panel.send_request("turn_off")
+        return self._panel.send_request_async("turn_off", callback)
 
-    def reset(self):
+    def reset(self, callback: Callback = None) -> Future:
         """Send reset command to system."""
-        self._panel.send_request("reset_system")
+        return self._panel.send_request_async("reset_system", callback)
 
-    def arm(self, mode: str) -> dict:
+    def arm(self, mode: str, callback: Callback = None) -> Future:
         """Arm system with specified mode."""
-        return self._panel.send_request("arm_system", mode=mode)
+        return self._panel.send_request_async("arm_system", callback, mode=mode)
 
-    def disarm(self):
+    def disarm(self, callback: Callback = None) -> Future:
         """Disarm system."""
-        self._panel.send_request("disarm_system")
+        return self._panel.send_request_async("disarm_system", callback)
 
-    def panic(self):
+    def panic(self, callback: Callback = None) -> Future:
         """Trigger panic alarm."""
-        self._panel.send_request("panic")
+        return self._panel.send_request_async("panic", callback)
 
-    def get_status(self) -> dict:
+    def get_status(self, callback: Callback = None) -> Future:
         """Get current system status."""
-        return self._panel.send_request("get_status")
+        return self._panel.send_request_async("get_status", callback)
 
 
 
@@ -1,36 +1,62 @@
 """
 PageRegistry - Central registry for all page classes
+
+Pages are registered as ``"module:Class"`` import strings and imported the
+first time they are shown, so starting the web interface only loads the
+login page (and not PIL, ImageTk or the dialogs the other pages use).
 """
-from .pages.login_page import LoginPage
-from .pages.major_function_page import MajorFunctionPage
-from .pages.security_page import SecurityPage
-from .pages.safety_zone_page import SafetyZonePage
-from .pages.safehome_mode_page import SafeHomeModePage
-from .pages.safehome_mode_configure_page import SafeHomeModeConfigurePage
-from .pages.configure_system_setting_page import ConfigureSystemSettingPage
-from .pages.surveillance_page import SurveillancePage
-from .pages.camera_list_page import CameraListPage
-from .pages.single_camera_view_page import SingleCameraViewPage
-from .pages.thumbnail_view_page import ThumbnailViewPage
-from .pages.view_log_page import ViewLogPage
-
-
-PAGE_CLASSES = {
-    'login': LoginPage,
-    'major_function': MajorFunctionPage,
-    'security': SecurityPage,
-    'safety_zone': SafetyZonePage,
-    'safehome_mode': SafeHomeModePage,
-    'safehome_mode_configure': SafeHomeModeConfigurePage,
-    'configure_system_setting': ConfigureSystemSettingPage,
-    'surveillance': SurveillancePage,
-    'camera_list': CameraListPage,
-    'single_camera_view': SingleCameraViewPage,
-    'thumbnail_view': ThumbnailViewPage,
-    'view_log': ViewLogPage,
+from collections.abc import Mapping
+from importlib import import_module
+
+
+PAGE_MODULES = {
+    'login': 'src.interfaces.pages.login_page:LoginPage',
+    'major_function': 'src.interfaces.pages.major_function_page:MajorFunctionPage',
+    'security': 'src.interfaces.pages.security_page:SecurityPage',
+    'safety_zone': 'src.interfaces.pages.safety_zone_page:SafetyZonePage',
+    'safehome_mode': 'src.interfaces.pages.safehome_mode_page:SafeHomeModePage',
+    'safehome_mode_configure': (
+        'src.interfaces.pages.safehome_mode_configure_page:SafeHomeModeConfigurePage'
+    ),
+    'configure_system_setting': (
+        'src.interfaces.pages.configure_system_setting_page:ConfigureSystemSettingPage'
+    ),
+    'surveillance': 'src.interfaces.pages.surveillance_page:SurveillancePage',
+    'camera_list': 'src.interfaces.pages.camera_list_page:CameraListPage',
+    'single_camera_view': 'src.interfaces.pages.single_camera_view_page:SingleCameraViewPage',
+    'thumbnail_view': 'src.interfaces.pages.thumbnail_view_page:ThumbnailViewPage',
+    'view_log': 'src.interfaces.pages.view_log_page:ViewLogPage',
 }
 
 
+class _LazyPageClasses(Mapping):
+    """Read-only page name -> class mapping that imports each class on first access."""
+
+    def __init__(self, modules):
+        self._modules = modules
+        self._classes = {}
+
+    def __getitem__(self, page_name):
+        page_class = self._classes.get(page_name)
+        if page_class is None:
+            module_name, class_name = self._modules[page_name].split(':')
+            page_class = getattr(import_module(module_name), class_name)
+            self._classes[page_name] = page_class
+        return page_class
+
+    def __contains__(self, page_name):
+        return page_name in self._modules
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self):
+        return len(self._modules)
+
+
+PAGE_CLASSES = _LazyPageClasses(PAGE_MODULES)
+
+
 def get_page_class(page_name: str):
     return PAGE_CLASSES.get(page_name)
 
@@ -1,26 +1,10 @@
 """
 SafeHome Pages Package
 
-All UI pages for web interface.
+All UI pages for web interface. Exports are imported on first access so
+importing one page does not load every other page.
 """
-from .login_page import LoginPage
-from .main_page import MainPage
-from .major_function_page import MajorFunctionPage
-from .security_page import SecurityPage
-from .safety_zone_page import SafetyZonePage
-from .safehome_mode_page import SafeHomeModePage
-from .safehome_mode_configure_page import SafeHomeModeConfigurePage
-from .configure_system_setting_page import ConfigureSystemSettingPage
-from .phone_number_validation_page import PhoneNumberValidationPage
-from .surveillance_page import SurveillancePage
-from .camera_list_page import CameraListPage
-from .single_camera_view_page import SingleCameraViewPage
-from .thumbnail_view_page import ThumbnailViewPage
-from .view_log_page import ViewLogPage
-
-# Action mixins
-from .camera_controls import CameraControlsMixin
-from .status_display import StatusDisplayMixin
+from importlib import import_module
 
 __all__ = [
     'LoginPage',
@@ -40,3 +24,37 @@ __all__ = [
     'CameraControlsMixin',
     'StatusDisplayMixin',
 ]
+
+_EXPORTS = {
+    'LoginPage': '.login_page:LoginPage',
+    'MainPage': '.main_page:MainPage',
+    'MajorFunctionPage': '.major_function_page:MajorFunctionPage',
+    'SecurityPage': '.security_page:SecurityPage',
+    'SafetyZonePage': '.safety_zone_page:SafetyZonePage',
+    'SafeHomeModePage': '.safehome_mode_page:SafeHomeModePage',
+    'SafeHomeModeConfigurePage': '.safehome_mode_configure_page:SafeHomeModeConfigurePage',
+    'ConfigureSystemSettingPage': '.configure_system_setting_page:ConfigureSystemSettingPage',
+    'PhoneNumberValidationPage': '.phone_number_validation_page:PhoneNumberValidationPage',
+    'SurveillancePage': '.surveillance_page:SurveillancePage',
+    'CameraListPage': '.camera_list_page:CameraListPage',
+    'SingleCameraViewPage': '.single_camera_view_page:SingleCameraViewPage',
+    'ThumbnailViewPage': '.thumbnail_view_page:ThumbnailViewPage',
+    'ViewLogPage': '.view_log_page:ViewLogPage',
+    # Action mixins
+    'CameraControlsMixin': '.camera_controls:CameraControlsMixin',
+    'StatusDisplayMixin': '.status_display:StatusDisplayMixin',
+}
+
+
+def __getattr__(name):
+    target = _EXPORTS.get(name)
+    if not target:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target.split(':')
+    value = getattr(import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -77,10 +77,11 @@ class CameraSelectionManager:
         # Update floorplan camera states
         all_devices_status = self._web_interface.send_message("get_all_devices_status")
         if all_devices_status.get("success"):
-            for dev_id, dev_info in all_devices_status["data"].items():
-                if dev_info["type"] == "camera":
-                    self._floorplan.set_armed(dev_id, dev_info["armed"])
-            self._floorplan.refresh()
+            self._floorplan.set_states({
+                dev_id: dev_info["armed"]
+                for dev_id, dev_info in all_devices_status["data"].items()
+                if dev_info["type"] == "camera"
+            })
 
     def on_show(self):
         self.load_cameras()
@@ -19,8 +19,7 @@ class MainPageUpdater:
     def set_device_armed_status(self, device_id: str, armed: bool):
         """Set the armed status of a device on the floor plan."""
         if self.floor_plan:
-            self.floor_plan.set_armed(device_id, armed)
-            self.floor_plan.refresh()
+            self.floor_plan.set_states({device_id: armed})
 
     def update_status(self, message: str):
         """Update the status bar message."""
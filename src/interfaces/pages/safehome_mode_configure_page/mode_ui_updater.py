@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Set, List, Dict, Any, TYPE_CHECKING
+from typing import Set, List, Dict, Any, Optional, TYPE_CHECKING
 
 from ...utils import sensor_display_name
 
@@ -15,7 +15,7 @@ class ModeUIUpdater:
         floorplan: 'FloorPlan',
         sel_info_label: ttk.Label,
         mode_desc_label: ttk.Label,
-        sensor_listbox: tk.Optional[tk.Listbox] = None,
+        sensor_listbox: Optional[tk.Listbox] = None,
     ):
         self._manager = manager_instance
         self.floorplan = floorplan
@@ -25,9 +25,9 @@ class ZoneUIUpdater:
 
     def _update_floorplan_states(self, zones: List[Dict]):
         armed_sensors = {s for z in zones if z.get('armed') for s in z.get('sensors', [])}
-        for sensor_id in self.floorplan.get_sensors():
-            self.floorplan.set_armed(sensor_id, sensor_id in armed_sensors)
-        self.floorplan.refresh()
+        self.floorplan.set_states({
+            sensor_id: sensor_id in armed_sensors for sensor_id in self.floorplan.get_sensors()
+        })
 
     def update_selection_info(self):
         selected = self.floorplan.get_selected()
@@ -17,13 +17,13 @@ class CameraControls:
         self._info_panel = info_panel
 
     def pan(self, direction: str) -> None:
-        self._send_and_refresh("camera_pan", direction=direction)
+        self._move("camera_pan", direction=direction)
 
     def tilt(self, direction: str) -> None:
-        self._send_and_refresh("camera_tilt", direction=direction)
+        self._move("camera_tilt", direction=direction)
 
     def zoom(self, direction: str) -> None:
-        self._send_and_refresh("camera_zoom", direction=direction)
+        self._move("camera_zoom", direction=direction)
 
     def enable(self) -> None:
         result = self._send("enable_camera")
@@ -48,6 +48,10 @@ class CameraControls:
                 "Disable Camera", result.get("message", "Unable to disable camera.")
             )
 
+    def _move(self, command: str, **kwargs) -> None:
+        self._send_and_refresh(command, **kwargs)
+        self._page._video_feed.boost()
+
     def _send_and_refresh(self, command: str, **kwargs) -> None:
         self._send(command, **kwargs)
         self._info_panel.refresh()
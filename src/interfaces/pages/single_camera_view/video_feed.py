@@ -1,5 +1,6 @@
 """Video feed manager for camera view."""
-from typing import TYPE_CHECKING, Optional
+import time
+from typing import TYPE_CHECKING, Any, Optional
 from PIL import ImageTk
 
 if TYPE_CHECKING:
@@ -7,25 +8,79 @@ if TYPE_CHECKING:
 
 
 class VideoFeedManager:
-    """Manages live video feed display."""
+    """Manages live video feed display.
 
-    def __init__(self, page: "SingleCameraViewPage"):
+    Polls the camera's frame subscription at ``FPS``, at ``active_fps`` for
+    ``ACTIVE_SECONDS`` after a pan/tilt/zoom, and only every
+    ``HIDDEN_INTERVAL_MS`` while the window is minimized. New frames are
+    pasted into one PhotoImage instead of allocating a new one each time.
+    """
+
+    FPS = 10
+    ACTIVE_FPS = 30
+    ACTIVE_SECONDS = 2.0
+    HIDDEN_INTERVAL_MS = 1000
+
+    def __init__(self, page: "SingleCameraViewPage", active_fps: Optional[int] = None):
         self._page = page
         self._job: Optional[int] = None
+        self._subscription: Optional[Any] = None
+        self._showing_lock = False
+        self._photo: Optional[Any] = None
+        self._active_fps = active_fps or self.ACTIVE_FPS
+        self._active_until = 0.0
+        self._clock = time.monotonic
 
     def start(self):
         """Start video feed loop."""
         self.stop()
+        res = self._page.send_to_system(
+            "subscribe_camera_frames",
+            camera_id=self._page._cam_id,
+            fps=self.FPS,
+        )
+        self._subscription = res.get("subscription") if res.get("success") else None
         self._update()
 
     def stop(self):
         """Stop video feed loop."""
+        self._cancel()
+        if self._subscription is not None:
+            self._page.send_to_system(
+                "unsubscribe_camera_frames", subscription=self._subscription
+            )
+            self._subscription = None
+
+    def boost(self):
+        """Poll at ``active_fps`` for a while; called on pan/tilt/zoom."""
+        self._active_until = self._clock() + self.ACTIVE_SECONDS
+        if self._job and self._subscription is not None:
+            # Show the moved view now rather than at the end of the idle delay
+            self._cancel()
+            self._update()
+
+    def next_delay(self) -> int:
+        """Milliseconds until the next poll."""
+        if not self._is_viewable():
+            return self.HIDDEN_INTERVAL_MS
+        if self._clock() < self._active_until:
+            return max(1, 1000 // self._active_fps)
+        return 1000 // self.FPS
+
+    def _cancel(self):
         if self._job:
             self._page._frame.after_cancel(self._job)
             self._job = None
 
+    def _is_viewable(self) -> bool:
+        try:
+            return bool(self._page._video.winfo_viewable())
+        except Exception:  # widget destroyed mid-shutdown
+            return True
+
     def _update(self):
-        """Fetch and display latest camera view."""
+        """Display the latest camera frame if it changed."""
+        self._job = None
         if not self._page._is_visible:
             return
 
@@ -40,18 +95,26 @@ class VideoFeedManager:
                 compound='center'
             )
             self._page._video.image = None
-        else:
-            res = self._page.send_to_system(
-                "get_camera_view",
-                camera_id=self._page._cam_id
-            )
+            self._showing_lock = True
+        elif self._subscription is not None and self._is_viewable():
+            if self._showing_lock:
+                # Force a repaint of the current frame once the lock lifts
+                self._subscription.reset()
+                self._showing_lock = False
+            view = self._subscription.poll()
+            if view:
+                self._show(view)
 
-            if res.get("success"):
-                view = res.get("view")
-                if view:
-                    photo = ImageTk.PhotoImage(view)
-                    self._page._video.config(image=photo, text="")
-                    self._page._video.image = photo
-
-        self._job = self._page._frame.after(1000, self._update)
+        self._job = self._page._frame.after(self.next_delay(), self._update)
 
+    def _show(self, view):
+        """Paste ``view`` into the shared PhotoImage, reallocating only on resize."""
+        photo = self._photo
+        if photo is not None and (photo.width(), photo.height()) == view.size:
+            photo.paste(view)
+            if self._page._video.image is photo:
+                return
+        else:
+            photo = self._photo = ImageTk.PhotoImage(view)
+        self._page._video.config(image=photo, text="")
+        self._page._video.image = photo
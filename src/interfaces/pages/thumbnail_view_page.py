@@ -9,6 +9,8 @@ from .camera_list.access_manager import CameraAccessManager
 class ThumbnailViewPage(Page):
     """View all cameras as thumbnails. Shows all enabled cameras with lock indicators."""
 
+    THUMBNAIL_SIZE = (200, 150)
+
     def __init__(self, parent, web_interface):
         super().__init__(parent, web_interface)
         self._access = CameraAccessManager(self)
@@ -21,11 +23,16 @@ class ThumbnailViewPage(Page):
         self._images = []  # Keep references to images
     
     def _create_grid(self):
+        # Cameras render on a worker thread; the grid is rebuilt when they arrive
+        self.send_message_async('get_camera_thumbnails', self._show_grid, size=self.THUMBNAIL_SIZE)
+
+    def _show_grid(self, res):
+        if not self.is_visible:
+            return
         for f in self._frames: f.destroy()
         self._frames = []
         self._images = []
         
-        res = self.send_to_system('get_thumbnails')
         cams = res.get('data', {}) if res.get('success') else {}
         
         cols = 3
@@ -50,34 +57,26 @@ class ThumbnailViewPage(Page):
                 )
                 locked_label.pack(expand=True, fill='both', padx=5, pady=5)
                 locked_label.bind('<Button-1>', lambda e, cid=cam_id, locked=is_locked: self._view(cid, locked))
+            elif cam.get('thumbnail') is not None:
+                # Thumbnail is already rendered at THUMBNAIL_SIZE by the system
+                photo = ImageTk.PhotoImage(cam['thumbnail'])
+                self._images.append(photo)  # Keep reference
+                
+                img_label = ttk.Label(f, image=photo, anchor='center')
+                img_label.pack(expand=True, fill='both', padx=5, pady=5)
+                img_label.bind('<Button-1>', lambda e, cid=cam_id, locked=is_locked: self._view(cid, locked))
             else:
-                # Get actual thumbnail
-                view_res = self.send_to_system('get_camera_view', camera_id=cam_id)
-                if view_res.get('success') and view_res.get('view'):
-                    view_img = view_res.get('view')
-                    # Resize to thumbnail size
-                    try:
-                        from PIL import Image
-                        thumbnail = view_img.resize((200, 150), Image.Resampling.LANCZOS)
-                    except (AttributeError, ImportError):
-                        # Fallback for older PIL versions
-                        thumbnail = view_img.resize((200, 150))
-                    photo = ImageTk.PhotoImage(thumbnail)
-                    self._images.append(photo)  # Keep reference
-                    
-                    img_label = ttk.Label(f, image=photo, anchor='center')
-                    img_label.pack(expand=True, fill='both', padx=5, pady=5)
-                    img_label.bind('<Button-1>', lambda e, cid=cam_id, locked=is_locked: self._view(cid, locked))
-                else:
-                    # Fallback if image not available
-                    lbl = ttk.Label(f, text=f"📷\n{cam_id}", font=('Arial', 16), anchor='center')
-                    lbl.pack(expand=True, fill='both', padx=5, pady=5)
-                    lbl.bind('<Button-1>', lambda e, cid=cam_id, locked=is_locked: self._view(cid, locked))
+                # Fallback if image not available
+                lbl = ttk.Label(f, text=f"📷\n{cam_id}", font=('Arial', 16), anchor='center')
+                lbl.pack(expand=True, fill='both', padx=5, pady=5)
+                lbl.bind('<Button-1>', lambda e, cid=cam_id, locked=is_locked: self._view(cid, locked))
             
             self._frames.append(f)
         
         if not cams:
-            ttk.Label(self._content, text="No cameras available", font=('Arial', 14)).pack(pady=50)
+            empty = ttk.Label(self._content, text="No cameras available", font=('Arial', 14))
+            empty.pack(pady=50)
+            self._frames.append(empty)
     
     def _view(self, cam_id, locked: bool = False):
         if locked and self._access.is_locked(cam_id):
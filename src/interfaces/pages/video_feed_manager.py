@@ -10,12 +10,18 @@ if TYPE_CHECKING:
 class VideoFeedManager:
     """
     Manages the fetching and displaying of the camera's video feed.
+
+    Frames come from a ``subscribe_camera_frames`` subscription polled at
+    ``FPS``; the label is only updated when a new frame arrives.
     """
+    FPS = 10
+
     def __init__(self, page_instance: 'SingleCameraViewPage', video_label: ttk.Label, frame: tk.Frame):
         self._page = page_instance
         self._video = video_label
         self._frame = frame
         self._video_job: Optional[str] = None
+        self._subscription: Optional[Any] = None
 
     @property
     def _cam_id(self) -> str:
@@ -28,6 +34,9 @@ class VideoFeedManager:
     def start_feed(self):
         """Starts the video feed loop."""
         self._page._is_visible = True
+        self._unsubscribe()
+        res = self._page.send_to_system('subscribe_camera_frames', camera_id=self._cam_id, fps=self.FPS)
+        self._subscription = res.get('subscription') if res.get('success') else None
         self._update_video_feed()
 
     def stop_feed(self):
@@ -36,19 +45,23 @@ class VideoFeedManager:
         if self._video_job:
             self._frame.after_cancel(self._video_job)
             self._video_job = None
+        self._unsubscribe()
+
+    def _unsubscribe(self):
+        if self._subscription is not None:
+            self._page.send_to_system('unsubscribe_camera_frames', subscription=self._subscription)
+            self._subscription = None
 
     def _update_video_feed(self):
-        """Fetch and display the latest camera view."""
+        """Display the latest camera view if it changed."""
         if not self._is_visible:
             return  # Stop the loop if the page is hidden
 
-        res = self._page.send_to_system('get_camera_view', camera_id=self._cam_id)
-        if res.get('success'):
-            view = res.get('view')
-            if view:
-                photo_img = ImageTk.PhotoImage(view)
-                self._video.config(image=photo_img)
-                self._video.image = photo_img # Keep reference to prevent garbage collection
+        view = self._subscription.poll() if self._subscription is not None else None
+        if view:
+            photo_img = ImageTk.PhotoImage(view)
+            self._video.config(image=photo_img)
+            self._video.image = photo_img # Keep reference to prevent garbage collection
         
         # Schedule the next update
-        self._video_job = self._frame.after(1000, self._update_video_feed)
+        self._video_job = self._frame.after(1000 // self.FPS, self._update_video_feed)
@@ -1,56 +1,139 @@
 """Log table widget for view log page."""
+from collections import deque
 from tkinter import ttk
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from .view_log_page import ViewLogPage
 
 
 class LogTable:
-    """Treeview-based log display table."""
+    """Treeview-based log display table.
+
+    Rows are kept newest first. ``prepend`` inserts entries newer than the
+    ones shown and ``append`` older ones, so a refresh only adds what is new;
+    scrolling near the bottom asks the page for the next older page. At most
+    ``MAX_ROWS`` rows are kept: adding at one end drops rows from the other,
+    and scrolling back toward dropped rows loads them again.
+    """
 
     COLUMNS = ("timestamp", "event", "detail")
     HEADINGS = {"timestamp": "Date/Time", "event": "Event Type", "detail": "Details"}
     WIDTHS = {"timestamp": 150, "event": 120, "detail": 350}
     ANCHORS = {"timestamp": "center", "event": "center", "detail": "w"}
+    LOAD_MORE_AT = 0.9  # scroll fraction that triggers loading older rows
+    MAX_ROWS = 1000
 
     def __init__(self, parent, page: "ViewLogPage"):
         self._page = page
         self._tree = ttk.Treeview(parent, columns=self.COLUMNS, show="headings", height=15)
+        self._latest_id: Optional[int] = None
+        self._oldest_id: Optional[int] = None
+        self._has_more = False
+        self._has_newer = False
+        self._items: Deque[Tuple[str, Optional[int]]] = deque()  # (item, log_id), top first
         self._setup_columns()
         self._setup_scrollbar(parent)
         self._setup_tags()
 
+    @property
+    def latest_id(self) -> Optional[int]:
+        return self._latest_id
+
+    @property
+    def oldest_id(self) -> Optional[int]:
+        return self._oldest_id
+
+    @property
+    def has_more(self) -> bool:
+        """Whether older entries exist beyond the last row."""
+        return self._has_more
+
+    @property
+    def has_newer(self) -> bool:
+        """Whether newer entries were dropped from above the first row."""
+        return self._has_newer
+
+    @property
+    def row_count(self) -> int:
+        return len(self._items)
+
     def _setup_columns(self):
         for col in self.COLUMNS:
             self._tree.heading(col, text=self.HEADINGS[col])
             self._tree.column(col, width=self.WIDTHS[col], anchor=self.ANCHORS[col])
 
     def _setup_scrollbar(self, parent):
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._tree.yview)
-        self._tree.configure(yscrollcommand=scrollbar.set)
+        self._scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._tree.yview)
+        self._tree.configure(yscrollcommand=self._on_scroll)
         self._tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self._scrollbar.pack(side="right", fill="y")
 
     def _setup_tags(self):
         self._tree.tag_configure("alert", foreground="red")
         self._tree.tag_configure("armed", foreground="green")
         self._tree.tag_configure("disarmed", foreground="gray")
 
-    def clear(self):
-        for item in self._tree.get_children():
-            self._tree.delete(item)
+    def _on_scroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if self._has_more and float(last) >= self.LOAD_MORE_AT:
+            self._page.load_older()
+        elif self._has_newer and float(first) <= 1 - self.LOAD_MORE_AT:
+            self._page.load_newer()
 
-    def load(self, logs: List[dict]):
+    def clear(self):
+        children = self._tree.get_children()
+        if children:
+            self._tree.delete(*children)
+        self._latest_id = self._oldest_id = None
+        self._has_more = self._has_newer = False
+        self._items.clear()
+
+    def load(self, logs: List[dict], has_more: bool = False):
+        """Replace the table with ``logs`` (newest first)."""
         self.clear()
+        self.append(logs, has_more)
+
+    def append(self, logs: List[dict], has_more: bool = False):
+        """Add older entries (newest first) below the current rows."""
         for log in logs:
-            event = log.get("event", "-")
-            tag = self._get_tag(event)
-            self._tree.insert("", "end", values=(
-                log.get("timestamp", "-"),
-                event,
-                log.get("detail", "-")
-            ), tags=(tag,))
+            self._items.append((self._insert("end", log), log.get("log_id")))
+        if logs:
+            self._oldest_id = logs[-1].get("log_id", self._oldest_id)
+            if self._latest_id is None:
+                self._latest_id = logs[0].get("log_id")
+        self._has_more = has_more
+        if len(self._items) > self.MAX_ROWS:
+            self._drop(self._items.popleft)
+            self._latest_id = self._items[0][1]
+            self._has_newer = True
+
+    def prepend(self, logs: List[dict], has_newer: bool = False):
+        """Add newer entries (newest first) above the current rows."""
+        for log in reversed(logs):
+            self._items.appendleft((self._insert(0, log), log.get("log_id")))
+        if logs:
+            self._latest_id = logs[0].get("log_id", self._latest_id)
+            if self._oldest_id is None:
+                self._oldest_id = logs[-1].get("log_id")
+            self._has_newer = has_newer
+        if len(self._items) > self.MAX_ROWS:
+            self._drop(self._items.pop)
+            self._oldest_id = self._items[-1][1]
+            self._has_more = True
+
+    def _drop(self, pop):
+        """Remove rows beyond ``MAX_ROWS`` from the end that ``pop`` takes from."""
+        excess = len(self._items) - self.MAX_ROWS
+        self._tree.delete(*[pop()[0] for _ in range(excess)])
+
+    def _insert(self, index, log: dict) -> str:
+        event = log.get("event", "-")
+        return self._tree.insert("", index, values=(
+            log.get("timestamp", "-"),
+            event,
+            log.get("detail", "-")
+        ), tags=(self._get_tag(event),))
 
     def _get_tag(self, event: str) -> str:
         if event in ("INTRUSION", "PANIC"):
@@ -60,10 +143,3 @@ class LogTable:
         elif event in ("DISARM", "DISARM_ZONE"):
             return "disarmed"
         return "normal"
-
-
-
-
-
-
-
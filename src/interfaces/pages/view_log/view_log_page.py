@@ -5,7 +5,20 @@ from .log_table import LogTable
 
 
 class ViewLogPage(Page):
-    """View intrusion and security event log."""
+    """View intrusion and security event log.
+
+    The newest page is loaded first; Refresh only fetches entries newer than
+    the top row and scrolling down fetches older pages (scrolling up brings
+    back newer ones the table dropped). Event type and date filters are
+    applied by the system, not in the table.
+    """
+
+    ALL_EVENTS = "All"
+
+    def __init__(self, parent, web_interface):
+        super().__init__(parent, web_interface)
+        self._loading = False
+        self._generation = 0
 
     def _build_ui(self):
         self._create_header("Security Event Log", back_page="security")
@@ -13,6 +26,20 @@ class ViewLogPage(Page):
         main = ttk.Frame(self._frame)
         main.pack(fill="both", expand=True, padx=20, pady=10)
 
+        filters = ttk.Frame(main)
+        filters.pack(fill="x", pady=(0, 5))
+        ttk.Label(filters, text="Event:").pack(side="left")
+        self._event = ttk.Combobox(filters, values=(self.ALL_EVENTS,), state="readonly", width=14)
+        self._event.set(self.ALL_EVENTS)
+        self._event.pack(side="left", padx=(2, 10))
+        ttk.Label(filters, text="From (YYYY-MM-DD):").pack(side="left")
+        self._since = ttk.Entry(filters, width=11)
+        self._since.pack(side="left", padx=(2, 10))
+        ttk.Label(filters, text="To:").pack(side="left")
+        self._until = ttk.Entry(filters, width=11)
+        self._until.pack(side="left", padx=(2, 10))
+        ttk.Button(filters, text="Apply", command=self._apply_filters, width=8).pack(side="left")
+
         log_frame = ttk.LabelFrame(main, text="Event Log", padding=10)
         log_frame.pack(fill="both", expand=True)
 
@@ -26,25 +53,90 @@ class ViewLogPage(Page):
         self._status = ttk.Label(main, text="", font=("Arial", 9))
         self._status.pack()
 
+    def _filters(self) -> dict:
+        filters = {}
+        event = self._event.get()
+        if event and event != self.ALL_EVENTS:
+            filters["event_type"] = event
+        for key, entry in (("since", self._since), ("until", self._until)):
+            value = entry.get().strip()
+            if value:
+                filters[key] = value
+        return filters
+
+    def _request(self, callback, **kwargs):
+        """Ask for a page of logs; answers to requests made before a reset are dropped."""
+        self._loading = True
+        generation = self._generation
+
+        def deliver(res):
+            if generation != self._generation:
+                return
+            self._loading = False
+            if not res.get("success"):
+                self._status.config(text=res.get("message", "Failed to load log"))
+                return
+            callback(res)
+            self._show_count()
+
+        self.send_message_async("get_intrusion_log", deliver, **kwargs, **self._filters())
+
     def _load(self):
-        res = self.send_to_system("get_intrusion_log")
-        if res.get("success"):
-            logs = res.get("data", [])
-            self._table.load(logs)
-            self._status.config(text=f"Showing {len(logs)} entries")
+        if self._loading:
+            return
+        if self._table.latest_id is None:
+            self._status.config(text="Loading...")
+            self._request(lambda res: self._table.load(res.get("data", []), res.get("has_more", False)))
         else:
-            self._status.config(text="Failed to load log")
-
-    def _clear(self):
-        self._table.clear()
-        self._status.config(text="Log cleared from display")
-
-    def on_show(self):
+            self._request(self._show_newer, after_id=self._table.latest_id)
+
+    def _show_newer(self, res):
+        self._table.prepend(res.get("data", []), res.get("has_more", False))
+        if res.get("has_more"):
+            self._request(self._show_newer, after_id=self._table.latest_id)
+
+    def load_older(self):
+        """Fetch the page before the oldest row (called when scrolled near the end)."""
+        if self._loading or not self._table.has_more or self._table.oldest_id is None:
+            return
+        self._request(
+            lambda res: self._table.append(res.get("data", []), res.get("has_more", False)),
+            before_id=self._table.oldest_id,
+        )
+
+    def load_newer(self):
+        """Fetch the page after the top row once the table has dropped newer rows."""
+        if self._loading or not self._table.has_newer or self._table.latest_id is None:
+            return
+        self._request(
+            lambda res: self._table.prepend(res.get("data", []), res.get("has_more", False)),
+            after_id=self._table.latest_id,
+        )
+
+    def _apply_filters(self):
+        self._reset()
         self._load()
 
+    def _reset(self):
+        self._generation += 1
+        self._loading = False
+        self._table.clear()
 
+    def _show_count(self):
+        more = " (scroll for older)" if self._table.has_more else ""
+        self._status.config(text=f"Showing {self._table.row_count} entries{more}")
 
+    def _clear(self):
+        self._reset()
+        self._status.config(text="Log cleared from display")
 
+    def _load_event_types(self):
+        def show(res):
+            if res.get("success"):
+                self._event.configure(values=(self.ALL_EVENTS, *res.get("data", [])))
 
+        self.send_message_async("get_log_event_types", show)
 
-
+    def on_show(self):
+        self._load_event_types()
+        self._load()
@@ -3,10 +3,12 @@ WebInterface - Interface between system and user (web browser)
 SDS: Sends commands to System, receives responses, draws pages.
 """
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Any, Optional, TYPE_CHECKING
 
-from .page_registry import PAGE_CLASSES
+from .async_dispatcher import AsyncDispatcher
+from .page_registry import get_page_class
 
 if TYPE_CHECKING:
     from src.core.system import System
@@ -48,7 +50,7 @@ class WebInterface(tk.Toplevel):
                 page.hide()
 
         if page_name not in self._pages:
-            page_class = PAGE_CLASSES.get(page_name)
+            page_class = get_page_class(page_name)
             if not page_class:
                 print(f"[WebInterface] Unknown page: {page_name}")
                 return
@@ -66,6 +68,28 @@ class WebInterface(tk.Toplevel):
             return {'success': False, 'message': 'System not connected'}
         return self._system.handle_request(source='web', command=command, **kwargs)
 
+    def send_message_async(
+        self, command: str, callback: Optional[Callable[[Dict[str, Any]], None]] = None, **kwargs
+    ) -> Future:
+        """Send a command on a worker thread; the result comes back on the Tk thread.
+
+        ``callback(result)`` (and the returned Future's done-callbacks) run in
+        the Tk event loop, so they may update widgets.
+        """
+        return self._get_dispatcher().submit(command, callback, **kwargs)
+
+    def _get_dispatcher(self) -> AsyncDispatcher:
+        dispatcher = getattr(self, '_dispatcher', None)
+        if dispatcher is None:
+            dispatcher = self._dispatcher = AsyncDispatcher(self.send_message, self)
+        return dispatcher
+
+    def destroy(self):
+        dispatcher = getattr(self, '_dispatcher', None)
+        if dispatcher is not None:
+            dispatcher.shutdown()
+        super().destroy()
+
     def set_context(self, key: str, value: Any):
         """Store context value for sharing between pages."""
         self._context[key] = value
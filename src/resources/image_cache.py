@@ -0,0 +1,130 @@
+"""
+Process-wide cache of decoded image assets.
+
+Images are keyed by absolute path, decoded once and shared between every
+user, so callers must treat them as read-only (``crop``/``resize``/``copy``
+return new images and are fine). Loads can be started in the background with
+``prefetch`` and are joined by the first ``load`` that needs them.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Tuple, Union
+
+if TYPE_CHECKING:  # PIL is imported by the first decode
+    from PIL import Image
+
+PathLike = Union[str, Path]
+
+
+class ImageAssetCache:
+    """Thread-safe decode-once cache keyed by absolute path."""
+
+    def __init__(self, workers: int = 2):
+        self._lock = threading.Lock()
+        self._images: Dict[Path, Future] = {}
+        self._derived: Dict[Tuple[Path, str], Future] = {}
+        self._workers = workers
+        self._pool: ThreadPoolExecutor | None = None
+
+    def load(self, path: PathLike) -> Image.Image:
+        """Return the decoded image, decoding it now unless already cached or in flight.
+
+        Raises the loader's error (e.g. ``FileNotFoundError``); failures are not
+        cached, so a later call retries.
+        """
+        future, owner = self._claim(self._images, self._key(path))
+        if owner:
+            self._fill(self._images, self._key(path), future, lambda: self._decode(path))
+        return future.result()
+
+    def prefetch(self, paths: Iterable[PathLike]) -> None:
+        """Start decoding ``paths`` in the background."""
+        for path in paths:
+            key = self._key(path)
+            future, owner = self._claim(self._images, key)
+            if owner:
+                self._executor().submit(
+                    self._fill, self._images, key, future, lambda p=path: self._decode(p)
+                )
+
+    def derive(self, path: PathLike, name: str, build: Callable[[Image.Image], Any]) -> Any:
+        """Return ``build(image)`` for ``path``, computed once per (path, name)."""
+        key = (self._key(path), name)
+        future, owner = self._claim(self._derived, key)
+        if owner:
+            self._fill(self._derived, key, future, lambda: build(self.load(path)))
+        return future.result()
+
+    def evict(self, path: PathLike) -> None:
+        key = self._key(path)
+        with self._lock:
+            self._images.pop(key, None)
+            for derived_key in [k for k in self._derived if k[0] == key]:
+                del self._derived[derived_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._derived.clear()
+
+    def __contains__(self, path: PathLike) -> bool:
+        with self._lock:
+            return self._key(path) in self._images
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(path: PathLike) -> Path:
+        return Path(path).resolve()
+
+    @staticmethod
+    def _decode(path: PathLike) -> Image.Image:
+        from PIL import Image
+
+        with Image.open(path) as image:
+            image.load()
+            if image.mode in ("RGB", "RGBA"):
+                return image.copy()
+            # Keep transparency (e.g. the palette floor plan) instead of flattening it
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            return image.convert("RGBA" if has_alpha else "RGB")
+
+    def _claim(self, table: Dict, key) -> Tuple[Future, bool]:
+        """Return the future for ``key`` and whether the caller must fill it."""
+        with self._lock:
+            future = table.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            table[key] = future
+            return future, True
+
+    def _fill(self, table: Dict, key, future: Future, produce: Callable[[], Any]) -> None:
+        try:
+            future.set_result(produce())
+        except BaseException as exc:
+            with self._lock:
+                if table.get(key) is future:
+                    del table[key]
+            future.set_exception(exc)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._workers, thread_name_prefix="image-assets"
+                )
+            return self._pool
+
+
+_cache = ImageAssetCache()
+
+
+def get_image_cache() -> ImageAssetCache:
+    """Return the process-wide image cache."""
+    return _cache
@@ -0,0 +1,9 @@
+"""
+Simulation Module
+Headless load generation and scenario replay for benchmarking SafeHome.
+"""
+
+from .load_generator import LoadReport, SensorLoadGenerator
+from .scenario import Scenario, ScenarioEvent
+
+__all__ = ["LoadReport", "Scenario", "ScenarioEvent", "SensorLoadGenerator"]
@@ -0,0 +1,5 @@
+"""Entry point for ``python -m src.simulation``."""
+
+from .load_generator import main
+
+raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""Headless sensor load generator.
+
+Creates synthetic window/door and motion sensors, fires a ``Scenario``
+against a ``System`` and measures trigger->alarm latency through
+``System.handle_request``.
+
+Usage::
+
+    python -m src.simulation --windoor 500 --motion 100 \\
+        --events 2000 --rate 200 --seed 7 --record scenario.json
+    python -m src.simulation --replay scenario.json --fast
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.headless import build_system
+from .scenario import INTRUDE, Scenario, ScenarioEvent
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one scenario run; latencies are in milliseconds."""
+
+    events: int = 0
+    requests: int = 0
+    alarms: int = 0
+    masked_triggers: int = 0
+    duration_s: float = 0.0
+    throughput_eps: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    alarm_sequence: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """Reduce per-trigger latencies (seconds) to mean/percentiles in ms."""
+    ordered = sorted(value * 1000.0 for value in latencies)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": _percentile(ordered, 0.50),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1],
+    }
+
+
+class SensorLoadGenerator:
+    """Drives synthetic sensors of a ``System`` from a scenario."""
+
+    SOURCE = "load_generator"
+
+    def __init__(
+        self,
+        system,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._system = system
+        self._sensors = system.sensor_service
+        self._clock = clock
+        self._sleep = sleep
+        self._created: List[str] = []
+        self._requests = 0
+
+    # ------------------------------------------------------------------ #
+    def populate(self, scenario: Scenario) -> List[str]:
+        """Create the scenario's sensors (armed) through the sensor controller."""
+        created = []
+        for index, entry in enumerate(scenario.sensor_entries()):
+            entry = dict(entry, armed=True)
+            if self._sensors.add_sensor(entry, (index % 1000, index // 1000)):
+                created.append(entry["id"])
+        self._created.extend(created)
+        return created
+
+    def teardown(self) -> None:
+        """Remove every sensor created by ``populate``."""
+        for sensor_id in self._created:
+            self._sensors.remove_sensor(sensor_id)
+        self._created = []
+
+    def run(self, scenario: Scenario, realtime: bool = True) -> LoadReport:
+        """Arm the system, create the sensors and fire every scenario event.
+
+        With ``realtime`` the events are paced by their ``at`` offsets;
+        otherwise they are fired back to back to measure peak throughput.
+        """
+        self._requests = 0
+        self._request("arm_system", mode="AWAY")
+        self.populate(scenario)
+
+        report = LoadReport()
+        latencies: List[float] = []
+        start = self._clock()
+        for event in scenario.events:
+            if realtime:
+                delay = start + event.at - self._clock()
+                if delay > 0:
+                    self._sleep(delay)
+            fired = self._clock()
+            if not self._apply(event):
+                continue
+            report.events += 1
+            result = self._request("poll_sensors")
+            if not result.get("alarm"):
+                continue
+            alarmed = result.get("sensor_id", "")
+            report.alarms += 1
+            report.alarm_sequence.append(alarmed)
+            if event.action == INTRUDE:
+                if alarmed == event.sensor_id:
+                    latencies.append(self._clock() - fired)
+                else:
+                    report.masked_triggers += 1
+            self._request("clear_alarm")
+
+        report.duration_s = self._clock() - start
+        report.requests = self._requests
+        if report.duration_s > 0:
+            report.throughput_eps = report.events / report.duration_s
+        report.latency_ms = summarize_latencies(latencies)
+        return report
+
+    # ------------------------------------------------------------------ #
+    def _request(self, command: str, **kwargs) -> Dict[str, Any]:
+        self._requests += 1
+        return self._system.handle_request(self.SOURCE, command, **kwargs)
+
+    def _apply(self, event: ScenarioEvent) -> bool:
+        sensor = self._sensors.get_sensor(event.sensor_id)
+        if sensor is None:
+            return False
+        active = event.action == INTRUDE
+        if hasattr(sensor, "set_open"):
+            sensor.set_open(active)
+        else:
+            sensor.setDetected(active)
+        return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="SafeHome sensor load generator")
+    parser.add_argument("--windoor", type=int, default=100, help="window/door sensors")
+    parser.add_argument("--motion", type=int, default=20, help="motion sensors")
+    parser.add_argument("--events", type=int, default=1000, help="events to generate")
+    parser.add_argument("--rate", type=float, default=100.0, help="events per second")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--record", help="save the scenario to this JSON file")
+    parser.add_argument("--replay", help="replay a scenario JSON file")
+    parser.add_argument("--fast", action="store_true", help="ignore pacing, fire back to back")
+    parser.add_argument("--db", default=":memory:", help="SQLite database path")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        scenario = Scenario.load(args.replay)
+    else:
+        scenario = Scenario.randomized(
+            args.windoor, args.motion, args.events, rate=args.rate, seed=args.seed
+        )
+    if args.record:
+        scenario.save(args.record)
+
+    system = build_system(args.db)
+    report = SensorLoadGenerator(system).run(scenario, realtime=not args.fast)
+    summary = report.to_dict()
+    summary.pop("alarm_sequence")
+    print(json.dumps(summary, indent=2))
+    return 0
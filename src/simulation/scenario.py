@@ -0,0 +1,139 @@
+"""Sensor event scenarios that can be generated, saved and replayed."""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+INTRUDE = "intrude"
+RELEASE = "release"
+
+
+@dataclass(frozen=True)
+class ScenarioEvent:
+    """One intrude/release action, ``at`` seconds after the scenario starts."""
+
+    at: float
+    sensor_id: str
+    action: str
+
+    def __post_init__(self) -> None:
+        if self.action not in (INTRUDE, RELEASE):
+            raise ValueError(f"Unknown scenario action: {self.action}")
+
+
+@dataclass
+class Scenario:
+    """Sensor population plus an ordered list of events to fire against it."""
+
+    windoor_sensors: int
+    motion_sensors: int
+    events: List[ScenarioEvent] = field(default_factory=list)
+    rate: Optional[float] = None
+    seed: Optional[int] = None
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def windoor_id(index: int) -> str:
+        return f"LW{index}"
+
+    @staticmethod
+    def motion_id(index: int) -> str:
+        return f"LM{index}"
+
+    def sensor_entries(self) -> List[Dict[str, Any]]:
+        """Sensor definitions in the format accepted by ``SensorService.add_sensor``."""
+        entries = [
+            {"id": self.windoor_id(i), "type": "WINDOW", "location": f"Load Window {i}"}
+            for i in range(1, self.windoor_sensors + 1)
+        ]
+        entries.extend(
+            {"id": self.motion_id(i), "type": "MOTION", "location": f"Load Motion {i}"}
+            for i in range(1, self.motion_sensors + 1)
+        )
+        return entries
+
+    def sensor_ids(self) -> List[str]:
+        return [entry["id"] for entry in self.sensor_entries()]
+
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def randomized(
+        cls,
+        windoor_sensors: int,
+        motion_sensors: int,
+        events: int,
+        rate: Optional[float] = None,
+        seed: Optional[int] = None,
+        max_open: int = 1,
+    ) -> "Scenario":
+        """Randomly intrude sensors and release them again.
+
+        At most ``max_open`` sensors are intruded at once; with the default of
+        one, every intrusion is released before the next, so each trigger is
+        reported by its own alarm.
+        """
+        scenario = cls(windoor_sensors, motion_sensors, rate=rate, seed=seed)
+        sensor_ids = scenario.sensor_ids()
+        if not sensor_ids:
+            return scenario
+        rng = random.Random(seed)
+        limit = max(1, min(max_open, len(sensor_ids)))
+        opened: List[str] = []
+        for index in range(events):
+            must_release = len(opened) >= limit
+            if opened and (must_release or rng.random() < 0.5):
+                sensor_id = opened.pop(rng.randrange(len(opened)))
+                action = RELEASE
+            else:
+                sensor_id = rng.choice(sensor_ids)
+                while sensor_id in opened:
+                    sensor_id = rng.choice(sensor_ids)
+                opened.append(sensor_id)
+                action = INTRUDE
+            scenario.events.append(
+                ScenarioEvent(scenario._offset(index), sensor_id, action)
+            )
+        return scenario
+
+    @classmethod
+    def scripted(
+        cls,
+        windoor_sensors: int,
+        motion_sensors: int,
+        steps: Iterable[Tuple[str, str]],
+        rate: Optional[float] = None,
+    ) -> "Scenario":
+        """Build a scenario from ``(sensor_id, action)`` pairs spaced at ``rate``."""
+        scenario = cls(windoor_sensors, motion_sensors, rate=rate)
+        for index, (sensor_id, action) in enumerate(steps):
+            scenario.events.append(ScenarioEvent(scenario._offset(index), sensor_id, action))
+        return scenario
+
+    def _offset(self, index: int) -> float:
+        return index / self.rate if self.rate else 0.0
+
+    # ------------------------------------------------------------------ #
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Scenario":
+        return cls(
+            windoor_sensors=int(data.get("windoor_sensors", 0)),
+            motion_sensors=int(data.get("motion_sensors", 0)),
+            events=[ScenarioEvent(**event) for event in data.get("events", [])],
+            rate=data.get("rate"),
+            seed=data.get("seed"),
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "Scenario":
+        with open(path, "r", encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
@@ -0,0 +1,48 @@
+"""Shared clock behind the virtual cameras' ``time`` counters.
+
+Cameras no longer run a ticking thread each; they derive their counter from
+one process-wide clock when it is read. Tests can install a ``VirtualClock``
+with ``set_clock`` and advance it by hand.
+"""
+
+import threading
+from time import monotonic
+
+
+class MonotonicClock:
+    """Wall-clock independent seconds from ``time.monotonic``."""
+
+    def now(self) -> float:
+        return monotonic()
+
+
+class VirtualClock:
+    """Manually advanced clock for deterministic tests."""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float = 1.0) -> float:
+        with self._lock:
+            self._now += seconds
+            return self._now
+
+
+_clock = MonotonicClock()
+
+
+def get_clock():
+    """Return the clock new cameras attach to."""
+    return _clock
+
+
+def set_clock(clock):
+    """Install ``clock`` for cameras created from now on; returns the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
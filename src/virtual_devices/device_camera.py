@@ -1,125 +1,270 @@
 import threading
-import time
-from PIL import Image, ImageDraw, ImageFont
-import tkinter as tk
-from tkinter import messagebox
+from collections import OrderedDict
+from pathlib import Path
+from ..resources import get_images_path
+from ..resources.image_cache import get_image_cache
+from . import camera_clock, device_errors
 from .interface_camera import InterfaceCamera
 
 
-class DeviceCamera(threading.Thread, InterfaceCamera):
+class DeviceCamera(InterfaceCamera):
     
     RETURN_SIZE = 500
     SOURCE_SIZE = 200
+    # The overlay clock advances once per TICK_SECONDS and wraps at TIME_WRAP
+    TICK_SECONDS = 1.0
+    TIME_WRAP = 100
+    # camera{id}.jpg is looked up here; images are shared through the asset cache
+    ASSET_DIR = get_images_path()
+    # Number of resized (pan, tilt, zoom, size) crops kept per camera
+    CROP_CACHE_SIZE = 32
+    # Smallest edge of the pre-downscaled source levels used for thumbnails
+    PYRAMID_MIN_SIZE = 32
     
-    def __init__(self):
-        super().__init__(daemon=True)
+    def __init__(self, clock=None):
+        super().__init__()
         
+        self._init_clock(clock)
         self.cameraId = 0
         self.time = 0
         self.pan = 0
         self.tilt = 0
         self.zoom = 2
         self.imgSource = None
+        self.source_path = None
+        self._source_pending = False
+        self._pyramid = []
+        self.asset_dir = self.ASSET_DIR
         self.centerWidth = 0
         self.centerHeight = 0
         self._running = True
         self._lock = threading.Lock()
-        # Font was previously missing; using a default PIL font prevents AttributeError in getView
-        self.font = ImageFont.load_default()
-        
-        self.start()
+        # Overlay font, loaded with PIL on the first rendered frame
+        self.font = None
+        # Resized crops keyed by (pan, tilt, zoom, size), least recently used first,
+        # and the last rendered frame shared by every viewer of this camera
+        self._crops = OrderedDict()
+        self._frame = None
+        self._frame_key = None
+    
+    def _init_clock(self, clock=None):
+        """Attach to ``clock`` (default: the shared camera clock)."""
+        self._clock = clock or camera_clock.get_clock()
+        self._time_offset = 0
+        self._epoch_tick = self._clock_ticks()
+
+    def _clock_ticks(self):
+        # Whole ticks on the shared clock, so every camera ticks at the same instant
+        return int(self._clock.now() // self.TICK_SECONDS)
+
+    @property
+    def time(self):
+        """Overlay clock counter, derived from the shared clock when read."""
+        elapsed = self._clock_ticks() - self._epoch_tick
+        return (self._time_offset + elapsed) % self.TIME_WRAP
+
+    @time.setter
+    def time(self, value):
+        elapsed = self._clock_ticks() - self._epoch_tick
+        self._time_offset = value - elapsed
+
+    def next_tick_in(self):
+        """Seconds until ``time`` next changes."""
+        return (self._clock_ticks() + 1) * self.TICK_SECONDS - self._clock.now()
     
     def set_id(self, id_):
         """Set the camera ID and load associated image (synchronized)."""
+        fileName = f"camera{id_}.jpg"
         with self._lock:
             self.cameraId = id_
-            fileName = f"camera{id_}.jpg"
-            
-            try:
-                self.imgSource = Image.open(fileName)
-                self.centerWidth = self.imgSource.width // 2
-                self.centerHeight = self.imgSource.height // 2
-            except FileNotFoundError:
-                self.imgSource = None
-                try:
-                    messagebox.showerror("File Error", f"{fileName} file open error")
-                except:
-                    print(f"ERROR: {fileName} file open error")
-                return
+        if not self.load_source(Path(self.asset_dir) / fileName):
+            device_errors.report_error("File Error", f"{fileName} file open error")
+    
+    def load_source(self, path):
+        """Use the image at ``path`` as the camera source (synchronized).
+
+        Decoding runs in the background on the shared asset cache and is
+        joined by the first frame that needs it. Returns False if the file
+        does not exist.
+        """
+        path = Path(path).resolve()
+        with self._lock:
+            self._crops.clear()
+            self._frame = None
+            self._frame_key = None
+            self.imgSource = None
+            self._pyramid = []
+            if not path.is_file():
+                self.source_path = None
+                self._source_pending = False
+                return False
+            self.source_path = path
+            self._source_pending = True
+        get_image_cache().prefetch([path])
+        return True
+
+    def _ensure_source(self):
+        """Join the pending source decode, if any (caller holds the lock)."""
+        if not self._source_pending:
+            return
+        self._source_pending = False
+        cache = get_image_cache()
+        try:
+            self.imgSource = cache.load(self.source_path)
+            self._pyramid = cache.derive(
+                self.source_path, f"pyramid/{self.PYRAMID_MIN_SIZE}", self._build_pyramid
+            )
+        except OSError as exc:
+            self.imgSource = None
+            self._pyramid = []
+            device_errors.report_error(
+                "File Error", f"{self.source_path} could not be decoded: {exc}"
+            )
+            return
+        self.centerWidth = self.imgSource.width // 2
+        self.centerHeight = self.imgSource.height // 2
     
     def get_id(self):
         """Get the camera ID."""
         return self.cameraId
     
     def get_view(self):
-        """Get the current camera view as a PIL Image (synchronized)."""
+        """Get the current camera view as a PIL Image (synchronized).
+
+        The returned frame is shared between callers until the camera moves or
+        its clock ticks, so it must be treated as read-only.
+        """
         with self._lock:
+            key = (self.pan, self.tilt, self.zoom, self.time)
+            if self._frame is not None and self._frame_key == key:
+                return self._frame
 
-            view = "Time = "
-            if self.time < 10:
-                view += "0"
-            view += f"{self.time}, zoom x{self.zoom}, "
-            
-            if self.pan > 0:
-                view += f"right {self.pan}"
-            elif self.pan == 0:
-                view += "center"
-            else:
-                view += f"left {-self.pan}"
-
-            view += ", "
-            if self.tilt > 0:
-                view += f"up {self.tilt}"
-            elif self.tilt == 0:
-                view += "level"
-            else:
-                view += f"down {-self.tilt}"
-            
-            # Create the view image (500x500)
-            imgView = Image.new('RGB', (self.RETURN_SIZE, self.RETURN_SIZE), 'black')
-            
-            if self.imgSource is not None:
+            size = (self.RETURN_SIZE, self.RETURN_SIZE)
+            imgView = self._get_crop(key[:3] + (size,)).copy()
+            self._draw_overlay(imgView, self._overlay_text())
+            self._frame = imgView
+            self._frame_key = key
+            return imgView
+
+    def get_thumbnail(self, size):
+        """Get the current view rendered directly at ``size`` (synchronized).
+
+        Thumbnails carry no overlay text, so they only change when the camera
+        moves and are served from the crop cache; treat them as read-only.
+        """
+        size = (int(size[0]), int(size[1]))
+        with self._lock:
+            return self._get_crop((self.pan, self.tilt, self.zoom, size))
+
+    def _overlay_text(self):
+        view = "Time = "
+        if self.time < 10:
+            view += "0"
+        view += f"{self.time}, zoom x{self.zoom}, "
+        
+        if self.pan > 0:
+            view += f"right {self.pan}"
+        elif self.pan == 0:
+            view += "center"
+        else:
+            view += f"left {-self.pan}"
+
+        view += ", "
+        if self.tilt > 0:
+            view += f"up {self.tilt}"
+        elif self.tilt == 0:
+            view += "level"
+        else:
+            view += f"down {-self.tilt}"
+        return view
+
+    def _get_crop(self, key):
+        """Return the resized crop for (pan, tilt, zoom, size) from the LRU."""
+        crop = self._crops.get(key)
+        if crop is not None:
+            self._crops.move_to_end(key)
+            return crop
+
+        self._ensure_source()
+        crop = self._render_crop(*key)
+        self._crops[key] = crop
+        if len(self._crops) > self.CROP_CACHE_SIZE:
+            self._crops.popitem(last=False)
+        return crop
+
+    def _render_crop(self, pan, tilt, zoom, size=None):
+        from PIL import Image
+
+        size = size or (self.RETURN_SIZE, self.RETURN_SIZE)
+        # Create the view image (500x500 unless a thumbnail size is given)
+        imgView = Image.new('RGB', size, 'black')
+        
+        if self.imgSource is not None:
  
-                zoomed = self.SOURCE_SIZE * (10 - self.zoom) // 10
-                panned = self.pan * self.SOURCE_SIZE // 5
-                tilted = self.tilt * self.SOURCE_SIZE // 5
-                
-                left = self.centerWidth + panned - zoomed
-                top = self.centerHeight - zoomed - tilted
-                right = self.centerWidth + panned + zoomed
-                bottom = self.centerHeight + zoomed - tilted
-                
-                # Crop and resize to fill the view
-                try:
-                    cropped = self.imgSource.crop((left, top, right, bottom))
-                    resized = cropped.resize((self.RETURN_SIZE, self.RETURN_SIZE), Image.LANCZOS)
-                    imgView.paste(resized, (0, 0))
-                except Exception:
-                    # If crop fails, keep black background
-                    pass
-            
-            draw = ImageDraw.Draw(imgView)
-            
-            # Get text size
-            bbox = draw.textbbox((0, 0), view, font=self.font)
-            wText = bbox[2] - bbox[0]
-            hText = bbox[3] - bbox[1]
+            zoomed = self.SOURCE_SIZE * (10 - zoom) // 10
+            panned = pan * self.SOURCE_SIZE // 5
+            tilted = tilt * self.SOURCE_SIZE // 5
             
-            # Draw rounded rectangle background (gray)
-            rX = 0
-            rY = 0
-            draw.rounded_rectangle(
-                [(rX, rY), (rX + wText + 10, rY + hText + 5)],
-                radius=hText // 2,
-                fill='gray'
-            )
+            left = self.centerWidth + panned - zoomed
+            top = self.centerHeight - zoomed - tilted
+            right = self.centerWidth + panned + zoomed
+            bottom = self.centerHeight + zoomed - tilted
             
-            # Draw text (cyan)
-            xText = rX + 5
-            yText = rY + 2
-            draw.text((xText, yText), view, fill='cyan', font=self.font)
+            # Crop the smallest source level that still covers the target size
+            scale, source = self._pyramid_level(2 * zoomed, size)
+            box = tuple(round(edge * scale) for edge in (left, top, right, bottom))
             
-            return imgView
+            # Crop and resize to fill the view
+            try:
+                cropped = source.crop(box)
+                resized = cropped.resize(size, Image.LANCZOS)
+                imgView.paste(resized, (0, 0))
+            except Exception:
+                # If crop fails, keep black background
+                pass
+        return imgView
+
+    def _build_pyramid(self, source):
+        """Return (scale, image) levels of ``source``, halving down to PYRAMID_MIN_SIZE."""
+        levels = [(1.0, source)]
+        level = source
+        while min(level.size) >= 2 * self.PYRAMID_MIN_SIZE:
+            level = level.reduce(2)
+            levels.append((level.width / source.width, level))
+        return levels
+
+    def _pyramid_level(self, span, size):
+        """Pick the smallest level where a ``span``-pixel source crop covers ``size``."""
+        for scale, level in reversed(self._pyramid):
+            if span * scale >= max(size):
+                return scale, level
+        return 1.0, self.imgSource
+
+    def _draw_overlay(self, imgView, view):
+        from PIL import ImageDraw, ImageFont
+
+        if self.font is None:
+            self.font = ImageFont.load_default()
+        draw = ImageDraw.Draw(imgView)
+        
+        # Get text size
+        bbox = draw.textbbox((0, 0), view, font=self.font)
+        wText = bbox[2] - bbox[0]
+        hText = bbox[3] - bbox[1]
+        
+        # Draw rounded rectangle background (gray)
+        rX = 0
+        rY = 0
+        draw.rounded_rectangle(
+            [(rX, rY), (rX + wText + 10, rY + hText + 5)],
+            radius=hText // 2,
+            fill='gray'
+        )
+        
+        # Draw text (cyan)
+        xText = rX + 5
+        yText = rY + 2
+        draw.text((xText, yText), view, fill='cyan', font=self.font)
     
     def pan_right(self):
         """Pan camera to the right (synchronized)."""
@@ -166,21 +311,10 @@ class DeviceCamera(threading.Thread, InterfaceCamera):
             return True
     
     def _tick(self):
-        """Increment time counter (synchronized, private)."""
+        """Advance the time counter by one tick (synchronized, private)."""
         with self._lock:
-            self.time += 1
-            if self.time >= 100:
-                self.time = 0
-    
-    def run(self):
-        """Thread run method - updates time every second."""
-        while self._running:
-            try:
-                time.sleep(1.0)
-            except InterruptedError:
-                pass
-            self._tick()
+            self._time_offset += 1
     
     def stop(self):
-        """Stop the camera thread."""
+        """Kept for callers of the former ticking thread; there is nothing to stop."""
         self._running = False
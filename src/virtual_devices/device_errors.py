@@ -0,0 +1,38 @@
+"""Where virtual devices report errors (e.g. a camera image that fails to open).
+
+Devices never open dialogs themselves: by default errors are printed, which
+is all a headless ``System`` needs. A GUI runner installs its own reporter
+with ``set_reporter`` (``main.py`` shows a message box).
+"""
+
+from typing import Callable
+
+Reporter = Callable[[str, str], None]
+
+
+def print_error(title: str, message: str) -> None:
+    """Default reporter: write the message to stdout."""
+    print(f"ERROR: {message}")
+
+
+_reporter: Reporter = print_error
+
+
+def get_reporter() -> Reporter:
+    """Return the reporter devices currently send errors to."""
+    return _reporter
+
+
+def set_reporter(reporter: Reporter) -> Reporter:
+    """Install ``reporter(title, message)``; returns the previous one."""
+    global _reporter
+    previous, _reporter = _reporter, reporter
+    return previous
+
+
+def report_error(title: str, message: str) -> None:
+    """Send an error to the installed reporter, falling back to printing it."""
+    try:
+        _reporter(title, message)
+    except Exception:
+        print_error(title, message)
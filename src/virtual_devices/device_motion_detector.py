@@ -3,6 +3,13 @@ from .interface_sensor import InterfaceSensor
 
 
 class DeviceMotionDetector(DeviceSensorTester, InterfaceSensor):
+
+    _HEAD_ATTRS = ("head_MotionDetector", "head_motion_detector")
+    _GUI_HEAD_ATTR = "head_motion"
+
+    @classmethod
+    def _index(cls):
+        return DeviceSensorTester.motion_detectors
     
     def __init__(self):
         super().__init__()
@@ -15,25 +22,23 @@ class DeviceMotionDetector(DeviceSensorTester, InterfaceSensor):
         self.detected = False
         self.armed = False
         
-        # Add to linked list
-        self.next = DeviceSensorTester.head_MotionDetector
-        self.next_sensor = self.next  # alias
-        DeviceSensorTester.head_MotionDetector = self
-        DeviceSensorTester.head_motion_detector = self  # alias
+        # Add to linked list and id registry
+        self._link()
         
-        # Update GUI and link heads
+        # Update GUI ID range
         if DeviceSensorTester.safeHomeSensorTest is not None:
-            DeviceSensorTester.safeHomeSensorTest.head_motion = DeviceSensorTester.head_MotionDetector
             DeviceSensorTester.safeHomeSensorTest.rangeSensorID_MotionDetector.set(
                 f"1 ~ {DeviceSensorTester.newIdSequence_MotionDetector}")
     
     def intrude(self):
         """Simulate motion detection."""
         self.detected = True
+        self._notify_change()
     
     def release(self):
         """Clear motion detection."""
         self.detected = False
+        self._notify_change()
 
     def get_id(self):
         """Alias for getID."""
@@ -48,10 +53,12 @@ class DeviceMotionDetector(DeviceSensorTester, InterfaceSensor):
     def arm(self):
         """Enable the sensor."""
         self.armed = True
+        self._notify_change()
     
     def disarm(self):
         """Disable the sensor."""
         self.armed = False
+        self._notify_change()
     
     def test_armed_state(self):
         """Test if the sensor is enabled."""
@@ -1,9 +1,23 @@
+import os
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import device_errors
 
 
 class DeviceSensorTester(ABC):
-    """Abstract base class for sensor devices with testing capability."""
-    
+    """Abstract base class for sensor devices with testing capability.
+
+    Sensors are kept in the original head_* linked lists and, alongside them,
+    in id-indexed registries (``windoor_sensors`` / ``motion_detectors``) so
+    lookups, bulk intrude/release and deregistration do not scan the lists.
+    Subscribers registered with ``subscribe`` are told about every state
+    change as ``listener(sensor, structural)``, where ``structural`` is True
+    when a sensor was linked or unlinked. ``add_change_listener`` watches a
+    single sensor instead (``listener(sensor)``), e.g. the core sensor it
+    backs.
+    """
+
     safeHomeSensorTest = None
     safehome_sensor_test = None  # alias for compatibility
     head_WinDoorSensor = None
@@ -12,47 +26,177 @@ class DeviceSensorTester(ABC):
     head_motion_detector = None  # alias
     newIdSequence_WinDoorSensor = 0
     newIdSequence_MotionDetector = 0
-    
+    windoor_sensors: Dict[int, "DeviceSensorTester"] = {}
+    motion_detectors: Dict[int, "DeviceSensorTester"] = {}
+    _change_listeners: List[Callable[["DeviceSensorTester", bool], None]] = []
+    # Builds and shows the tester window; set by GUI runners (see
+    # safehome_sensor_test_gui.install), left None in headless processes
+    gui_factory: Optional[Callable[[], Any]] = None
+
+    # Set by subclasses: class-level head attributes and the GUI head attribute
+    _HEAD_ATTRS = ()
+    _GUI_HEAD_ATTR = None
+
     def __init__(self):
         self.next = None
         self.next_sensor = None  # alias
+        self.prev = None
+        self._device_listeners: List[Callable[["DeviceSensorTester"], None]] = []
         self.sensor_id = 0  # alias
-    
+
+    @property
+    def sensor_id(self):
+        return self.__dict__.get("_sensor_id", 0)
+
+    @sensor_id.setter
+    def sensor_id(self, value):
+        # Re-key the registry entry when an already linked sensor is renumbered
+        index = self._index()
+        old = self.__dict__.get("_sensor_id")
+        if index is not None and old is not None and index.get(old) is self:
+            del index[old]
+            index[value] = self
+            self._sensor_id = value
+            self._notify_change()
+            return
+        self._sensor_id = value
+
     @abstractmethod
     def intrude(self):
         """Simulate intrusion/detection."""
         pass
-    
+
     @abstractmethod
     def release(self):
         """Release intrusion/detection state."""
         pass
-    
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def subscribe(listener: Callable[["DeviceSensorTester", bool], None]) -> None:
+        """Register a listener for sensor state and membership changes."""
+        if listener not in DeviceSensorTester._change_listeners:
+            DeviceSensorTester._change_listeners.append(listener)
+
+    @staticmethod
+    def unsubscribe(listener: Callable[["DeviceSensorTester", bool], None]) -> None:
+        if listener in DeviceSensorTester._change_listeners:
+            DeviceSensorTester._change_listeners.remove(listener)
+
+    def add_change_listener(self, listener: Callable[["DeviceSensorTester"], None]) -> None:
+        """Call ``listener(self)`` whenever this sensor's state changes."""
+        if listener not in self._device_listeners:
+            self._device_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[["DeviceSensorTester"], None]) -> None:
+        if listener in self._device_listeners:
+            self._device_listeners.remove(listener)
+
+    def _notify_change(self, structural: bool = False):
+        for listener in list(DeviceSensorTester._change_listeners):
+            listener(self, structural)
+        for listener in list(self._device_listeners):
+            listener(self)
+
+    @classmethod
+    def _index(cls) -> Optional[Dict[int, "DeviceSensorTester"]]:
+        """Return the id registry for this sensor kind (None on the base)."""
+        return None
+
+    def _link(self):
+        """Push this sensor onto its linked list and register it by id."""
+        head = getattr(DeviceSensorTester, self._HEAD_ATTRS[0])
+        self.next = head
+        self.next_sensor = head  # alias
+        if head is not None:
+            head.prev = self
+        for attr in self._HEAD_ATTRS:
+            setattr(DeviceSensorTester, attr, self)
+        self._index()[self.sensor_id] = self
+        self._sync_gui_head()
+        self._notify_change(structural=True)
+
+    def _unlink(self):
+        if self.prev is not None:
+            self.prev.next = self.next
+            self.prev.next_sensor = self.next
+        else:
+            for attr in self._HEAD_ATTRS:
+                setattr(DeviceSensorTester, attr, self.next)
+        if self.next is not None:
+            self.next.prev = self.prev
+        self.next = self.next_sensor = self.prev = None
+        self._sync_gui_head()
+        self._notify_change(structural=True)
+
+    def _sync_gui_head(self):
+        gui = DeviceSensorTester.safeHomeSensorTest
+        if gui is not None and self._GUI_HEAD_ATTR:
+            setattr(gui, self._GUI_HEAD_ATTR, getattr(DeviceSensorTester, self._HEAD_ATTRS[0]))
+
+    @classmethod
+    def find(cls, sensor_id: int) -> Optional["DeviceSensorTester"]:
+        """Return the registered sensor with ``sensor_id`` or None."""
+        index = cls._index()
+        return index.get(sensor_id) if index is not None else None
+
+    @classmethod
+    def intrude_many(cls, sensor_ids: Iterable[int]) -> List[int]:
+        """Intrude every listed sensor; return the ids that were not found."""
+        return cls._apply_many(sensor_ids, "intrude")
+
+    @classmethod
+    def release_many(cls, sensor_ids: Iterable[int]) -> List[int]:
+        """Release every listed sensor; return the ids that were not found."""
+        return cls._apply_many(sensor_ids, "release")
+
+    @classmethod
+    def _apply_many(cls, sensor_ids: Iterable[int], action: str) -> List[int]:
+        index = cls._index() or {}
+        missing = []
+        for sensor_id in sensor_ids:
+            sensor = index.get(sensor_id)
+            if sensor is None:
+                missing.append(sensor_id)
+            else:
+                getattr(sensor, action)()
+        return missing
+
+    @classmethod
+    def deregister(cls, sensor_id: int) -> bool:
+        """Remove a sensor from its registry and linked list."""
+        index = cls._index()
+        sensor = index.pop(sensor_id, None) if index is not None else None
+        if sensor is None:
+            return False
+        sensor._unlink()
+        return True
+
+    @classmethod
+    def deregister_all(cls) -> None:
+        """Drop every registered sensor of this kind."""
+        index = cls._index()
+        if index is None:
+            return
+        for sensor_id in list(index):
+            cls.deregister(sensor_id)
+
     @staticmethod
     def showSensorTester():
-        """Show the sensor tester GUI."""
-        if DeviceSensorTester.safeHomeSensorTest is not None:
+        """Show the sensor tester GUI, if a GUI runner installed ``gui_factory``.
+
+        Headless processes (no factory, or ``SAFEHOME_HEADLESS=1``) skip it, so
+        the sensor layer never imports or probes Tk itself.
+        """
+        factory = DeviceSensorTester.gui_factory
+        if DeviceSensorTester.safeHomeSensorTest is not None or factory is None:
+            return
+        if os.environ.get("SAFEHOME_HEADLESS") == "1":
             return
         try:
-            import os
-            if os.environ.get("SAFEHOME_HEADLESS") == "1":
-                return
-            import tkinter as tk
-            from .safehome_sensor_test_gui import SafeHomeSensorTest
-            root = tk._default_root
-            if root is None:
-                root = tk.Tk()
-                root.withdraw()
-            gui = SafeHomeSensorTest(master=root)
-            # Mirror Java setVisible(true)
-            try:
-                gui.deiconify()
-                gui.lift()
-            except Exception:
-                pass
-            DeviceSensorTester.safeHomeSensorTest = gui
-            DeviceSensorTester.safehome_sensor_test = gui
-        except Exception:
-            # Fail silently in environments without display/Tkinter
-            DeviceSensorTester.safeHomeSensorTest = None
-            DeviceSensorTester.safehome_sensor_test = None
+            gui = factory()
+        except Exception as exc:
+            device_errors.report_error("Sensor Tester", f"sensor tester unavailable: {exc}")
+            return
+        DeviceSensorTester.safeHomeSensorTest = gui
+        DeviceSensorTester.safehome_sensor_test = gui
@@ -4,6 +4,13 @@ from .interface_sensor import InterfaceSensor
 
 
 class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
+
+    _HEAD_ATTRS = ("head_WinDoorSensor", "head_windoor_sensor")
+    _GUI_HEAD_ATTR = "head_windoor"
+
+    @classmethod
+    def _index(cls):
+        return DeviceSensorTester.windoor_sensors
     
     def __init__(self):
         super().__init__()
@@ -16,25 +23,23 @@ class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
         self.opened = False
         self.armed = False
         
-        # Add to linked list
-        self.next = DeviceSensorTester.head_WinDoorSensor
-        self.next_sensor = self.next  # alias
-        DeviceSensorTester.head_WinDoorSensor = self
-        DeviceSensorTester.head_windoor_sensor = self  # alias
+        # Add to linked list and id registry
+        self._link()
         
-        # Update GUI and link heads
+        # Update GUI ID range
         if DeviceSensorTester.safeHomeSensorTest is not None:
-            DeviceSensorTester.safeHomeSensorTest.head_windoor = DeviceSensorTester.head_WinDoorSensor
             DeviceSensorTester.safeHomeSensorTest.rangeSensorID_WinDoorSensor.set(
                 f"1 ~ {DeviceSensorTester.newIdSequence_WinDoorSensor}")
     
     def intrude(self):
         """Simulate opening the window/door."""
         self.opened = True
+        self._notify_change()
     
     def release(self):
         """Simulate closing the window/door."""
         self.opened = False
+        self._notify_change()
 
     def get_id(self):
         """Alias for getID."""
@@ -49,10 +54,12 @@ class DeviceWinDoorSensor(DeviceSensorTester, InterfaceSensor):
     def arm(self):
         """Enable the sensor."""
         self.armed = True
+        self._notify_change()
     
     def disarm(self):
         """Disable the sensor."""
         self.armed = False
+        self._notify_change()
     
     def test_armed_state(self):
         """Test if the sensor is enabled."""
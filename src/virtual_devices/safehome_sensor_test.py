@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import Label, Button, messagebox
 
+from .device_motion_detector import DeviceMotionDetector
+from .device_windoor_sensor import DeviceWinDoorSensor
+
 
 class SafeHomeSensorTest(tk.Toplevel):
     
@@ -84,9 +87,7 @@ class SafeHomeSensorTest(tk.Toplevel):
         selected_id = int(input_number)
         
         # Search for sensor with matching ID
-        scan = self.head_windoor
-        while scan is not None and scan.sensor_id != selected_id:
-            scan = scan.next_sensor
+        scan = DeviceWinDoorSensor.find(selected_id)
         
         if scan is None:
             messagebox.showwarning("Sensor Not Found", f"ID {selected_id} not exist")
@@ -111,9 +112,7 @@ class SafeHomeSensorTest(tk.Toplevel):
         selected_id = int(input_number)
         
         # Search for sensor with matching ID
-        scan = self.head_motion
-        while scan is not None and scan.sensor_id != selected_id:
-            scan = scan.next_sensor
+        scan = DeviceMotionDetector.find(selected_id)
         
         if scan is None:
             messagebox.showwarning("Sensor Not Found", f"ID {selected_id} not exist")
@@ -1,15 +1,46 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from .device_motion_detector import DeviceMotionDetector
 from .device_sensor_tester import DeviceSensorTester
+from .device_windoor_sensor import DeviceWinDoorSensor
+from .sensor_status_list import SensorStatusList
+from .sensor_status_panel import SensorStatusPanel
+
+
+def _armed_state(scan) -> bool:
+    # Prefer explicit test method when available, fall back to known attrs
+    if callable(getattr(scan, "test_armed_state", None)):
+        try:
+            return bool(scan.test_armed_state())
+        except Exception:
+            return False
+    return getattr(scan, "armed", getattr(scan, "enabled", getattr(scan, "amred", False)))
+
+
+def _windoor_row(scan) -> str:
+    # Separate status display: Sensor ON/OFF | Door OPEN/CLOSED
+    sensor_id = getattr(scan, "sensor_id", getattr(scan, "sensorID", "?"))
+    sensor_status = "🟢 ON " if _armed_state(scan) else "🔴 OFF"
+    door_status = "🚪 OPEN  " if getattr(scan, "opened", False) else "🚪 CLOSED"
+    return f"ID {sensor_id}: Sensor[{sensor_status}] Door[{door_status}]"
+
+
+def _motion_row(scan) -> str:
+    # Separate status display: Sensor ON/OFF | Motion DETECTED/CLEAR
+    sensor_id = getattr(scan, "sensor_id", getattr(scan, "sensorID", "?"))
+    sensor_status = "🟢 ON " if _armed_state(scan) else "🔴 OFF"
+    motion_status = "👁️  DETECTED" if getattr(scan, "detected", False) else "⚪ CLEAR   "
+    return f"ID {sensor_id}: Sensor[{sensor_status}] Motion[{motion_status}]"
 
 
 class SafeHomeSensorTest(tk.Toplevel):
     """Tkinter translation of the Java SafeHomeSensorTest GUI.
 
     This GUI allows the user to input a sensor ID and call open/close or
-    detect/clear on registered sensors by ID. It uses the DeviceSensorTester
-    head_* linked lists to find sensors.
+    detect/clear on registered sensors by ID. Sensors are looked up through
+    the id-indexed DeviceSensorTester registries. The status panels subscribe
+    to sensor change notifications and only rewrite the rows that changed.
     """
 
     def __init__(self, master=None):
@@ -68,74 +99,55 @@ class SafeHomeSensorTest(tk.Toplevel):
         
         # WinDoor status
         ttk.Label(status_frame, text="Window/Door Sensors:", font=("Arial", 9, "bold")).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 5))
-        self.wd_status_text = tk.Text(status_frame, height=5, width=53, font=("Courier", 9), state="disabled")
-        self.wd_status_text.grid(row=1, column=0, columnspan=3, pady=(0, 10))
+        self.wd_status = SensorStatusPanel(
+            status_frame,
+            SensorStatusList(lambda: DeviceSensorTester.head_WinDoorSensor, _windoor_row),
+            "No sensors registered",
+        )
+        self.wd_status.frame.grid(row=1, column=0, columnspan=3, pady=(0, 10))
+        self.wd_status_text = self.wd_status.text
         
         # Motion status
         ttk.Label(status_frame, text="Motion Detectors:", font=("Arial", 9, "bold")).grid(row=2, column=0, columnspan=3, sticky="w", pady=(0, 5))
-        self.motion_status_text = tk.Text(status_frame, height=5, width=53, font=("Courier", 9), state="disabled")
-        self.motion_status_text.grid(row=3, column=0, columnspan=3)
+        self.motion_status = SensorStatusPanel(
+            status_frame,
+            SensorStatusList(lambda: DeviceSensorTester.head_MotionDetector, _motion_row),
+            "No detectors registered",
+        )
+        self.motion_status.frame.grid(row=3, column=0, columnspan=3)
+        self.motion_status_text = self.motion_status.text
+        
+        # Only sensors that report a change are re-rendered on the next tick
+        DeviceSensorTester.subscribe(self._on_sensor_change)
+        self.bind("<Destroy>", self._on_destroy, add="+")
         
         # Start status update loop
         self._update_status()
 
-    def _update_status(self):
-        """Update sensor status display every 500ms."""
-        # Update WinDoor status
-        self.wd_status_text.config(state="normal")
-        self.wd_status_text.delete(1.0, tk.END)
-        
-        scan = DeviceSensorTester.head_WinDoorSensor
-        if scan is None:
-            self.wd_status_text.insert(tk.END, "No sensors registered\n")
+    def _on_sensor_change(self, sensor, structural: bool):
+        if isinstance(sensor, DeviceWinDoorSensor):
+            model = self.wd_status.model
+        elif isinstance(sensor, DeviceMotionDetector):
+            model = self.motion_status.model
         else:
-            while scan is not None:
-                sensor_id = getattr(scan, "sensor_id", getattr(scan, "sensorID", "?"))
-                # Prefer explicit test method when available, fall back to known attrs
-                if callable(getattr(scan, "test_armed_state", None)):
-                    try:
-                        armed = bool(scan.test_armed_state())
-                    except Exception:
-                        armed = False
-                else:
-                    armed = getattr(scan, "amred", getattr(scan, "armed", getattr(scan, "enabled", False)))
-                opened = getattr(scan, "opened", False)
-                
-                # Separate status display: Sensor ON/OFF | Door OPEN/CLOSED
-                sensor_status = "🟢 ON " if armed else "🔴 OFF"
-                door_status = "🚪 OPEN  " if opened else "🚪 CLOSED"
-                self.wd_status_text.insert(tk.END, f"ID {sensor_id}: Sensor[{sensor_status}] Door[{door_status}]\n")
-                scan = getattr(scan, "next", None)
-        
-        self.wd_status_text.config(state="disabled")
-        
-        # Update Motion status
-        self.motion_status_text.config(state="normal")
-        self.motion_status_text.delete(1.0, tk.END)
-        
-        scan = DeviceSensorTester.head_MotionDetector
-        if scan is None:
-            self.motion_status_text.insert(tk.END, "No detectors registered\n")
+            return
+        if structural:
+            model.mark_stale()
         else:
-            while scan is not None:
-                sensor_id = getattr(scan, "sensor_id", getattr(scan, "sensorID", "?"))
-                # Prefer explicit test method when available, fall back to known attrs
-                if callable(getattr(scan, "test_armed_state", None)):
-                    try:
-                        armed = bool(scan.test_armed_state())
-                    except Exception:
-                        armed = False
-                else:
-                    armed = getattr(scan, "enabled", getattr(scan, "armed", getattr(scan, "amred", False)))
-                detected = getattr(scan, "detected", False)
-                
-                # Separate status display: Sensor ON/OFF | Motion DETECTED/CLEAR
-                sensor_status = "🟢 ON " if armed else "🔴 OFF"
-                motion_status = "👁️  DETECTED" if detected else "⚪ CLEAR   "
-                self.motion_status_text.insert(tk.END, f"ID {sensor_id}: Sensor[{sensor_status}] Motion[{motion_status}]\n")
-                scan = getattr(scan, "next", None)
-        
-        self.motion_status_text.config(state="disabled")
+            model.mark_dirty(sensor)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            DeviceSensorTester.unsubscribe(self._on_sensor_change)
+
+    def _refresh_status(self):
+        """Render pending sensor changes."""
+        self.wd_status.refresh()
+        self.motion_status.refresh()
+
+    def _update_status(self):
+        """Update sensor status display every 500ms."""
+        self._refresh_status()
         
         # Schedule next update
         self.after(500, self._update_status)
@@ -153,9 +165,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             messagebox.showinfo(self.title(), "only digit allowed")
             return
         selectedID = int(inputNumber)
-        scan = DeviceSensorTester.head_WinDoorSensor
-        while scan is not None and getattr(scan, "sensor_id", getattr(scan, "sensorID", None)) != selectedID:
-            scan = getattr(scan, "next", None)
+        scan = DeviceWinDoorSensor.find(selectedID)
         if scan is None:
             messagebox.showinfo(self.title(), f"ID {selectedID} not exist")
         else:
@@ -164,7 +174,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             else:
                 scan.disarm()
             # Immediately update status display
-            self._update_status()
+            self._refresh_status()
 
     def _handle_windoor(self, action: str):
         inputNumber = self.inputSensorID_WinDoorSensor.get()
@@ -175,9 +185,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             messagebox.showinfo(self.title(), "only digit allowed")
             return
         selectedID = int(inputNumber)
-        scan = DeviceSensorTester.head_WinDoorSensor
-        while scan is not None and getattr(scan, "sensor_id", getattr(scan, "sensorID", None)) != selectedID:
-            scan = getattr(scan, "next", None)
+        scan = DeviceWinDoorSensor.find(selectedID)
         if scan is None:
             messagebox.showinfo(self.title(), f"ID {selectedID} not exist")
         else:
@@ -186,7 +194,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             else:
                 scan.release()
             # Immediately update status display
-            self._update_status()
+            self._refresh_status()
 
     def _handle_motion_sensor(self, action: str):
         """Handle Motion Detector arm/disarm."""
@@ -198,9 +206,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             messagebox.showinfo(self.title(), "only digit allowed")
             return
         selectedID = int(inputNumber)
-        scan = DeviceSensorTester.head_MotionDetector
-        while scan is not None and getattr(scan, "sensor_id", getattr(scan, "sensorID", None)) != selectedID:
-            scan = getattr(scan, "next", None)
+        scan = DeviceMotionDetector.find(selectedID)
         if scan is None:
             messagebox.showinfo(self.title(), f"ID {selectedID} not exist")
         else:
@@ -209,7 +215,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             else:
                 scan.disarm()
             # Immediately update status display
-            self._update_status()
+            self._refresh_status()
 
     def _handle_motion(self, action: str):
         inputNumber = self.inputSensorID_MotionDetector.get()
@@ -220,9 +226,7 @@ class SafeHomeSensorTest(tk.Toplevel):
             messagebox.showinfo(self.title(), "only digit allowed")
             return
         selectedID = int(inputNumber)
-        scan = DeviceSensorTester.head_MotionDetector
-        while scan is not None and getattr(scan, "sensor_id", getattr(scan, "sensorID", None)) != selectedID:
-            scan = getattr(scan, "next", None)
+        scan = DeviceMotionDetector.find(selectedID)
         if scan is None:
             messagebox.showinfo(self.title(), f"ID {selectedID} not exist")
         else:
@@ -231,4 +235,28 @@ class SafeHomeSensorTest(tk.Toplevel):
             else:
                 scan.release()
             # Immediately update status display
-            self._update_status()
+            self._refresh_status()
+
+
+def install(master=None):
+    """Let ``DeviceSensorTester.showSensorTester`` open this window on ``master``.
+
+    Called by GUI runners; headless processes never install a factory. Without
+    ``master`` the default Tk root is used, or a hidden one is created.
+    """
+
+    def open_tester():
+        root = master or tk._default_root
+        if root is None:
+            root = tk.Tk()
+            root.withdraw()
+        gui = SafeHomeSensorTest(master=root)
+        # Mirror Java setVisible(true)
+        try:
+            gui.deiconify()
+            gui.lift()
+        except Exception:
+            pass
+        return gui
+
+    DeviceSensorTester.gui_factory = open_tester
@@ -0,0 +1,68 @@
+"""Row model behind the sensor tester's status panels.
+
+Keeps the last rendered line per sensor so the GUI only rewrites the lines
+of sensors that reported a change, and rebuilds everything only when
+sensors are linked or unlinked.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class SensorStatusList:
+    """Rendered status rows for one linked list of tester sensors."""
+
+    def __init__(self, head_supplier: Callable[[], object], format_row: Callable[[object], str]):
+        self._head_supplier = head_supplier
+        self._format_row = format_row
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._stale = True
+        self._positions: Dict[int, int] = {}
+        self.rows: List[str] = []
+
+    def mark_dirty(self, sensor) -> None:
+        """Record a state change; safe to call from any thread."""
+        with self._lock:
+            self._dirty.add(sensor)
+
+    def mark_stale(self) -> None:
+        """Record a membership change that requires a full rebuild."""
+        with self._lock:
+            self._stale = True
+
+    def sync(self) -> Tuple[bool, List[int]]:
+        """Bring ``rows`` up to date.
+
+        Returns ``(rebuilt, changed)`` where ``rebuilt`` is True when every
+        row was regenerated and ``changed`` lists the positions of rows whose
+        text differs from what was rendered before.
+        """
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            stale, self._stale = self._stale, False
+        if stale:
+            self._rebuild()
+            return True, list(range(len(self.rows)))
+        changed = []
+        for sensor in dirty:
+            position = self._positions.get(id(sensor))
+            if position is None:
+                continue
+            row = self._format_row(sensor)
+            if row != self.rows[position]:
+                self.rows[position] = row
+                changed.append(position)
+        changed.sort()
+        return False, changed
+
+    def _rebuild(self) -> None:
+        rows: List[str] = []
+        positions: Dict[int, int] = {}
+        scan: Optional[object] = self._head_supplier()
+        while scan is not None:
+            positions[id(scan)] = len(rows)
+            rows.append(self._format_row(scan))
+            scan = getattr(scan, "next", None)
+        self.rows = rows
+        self._positions = positions
@@ -0,0 +1,105 @@
+"""Scrollable status panel for the sensor tester GUI.
+
+Rows come from a ``SensorStatusList``. Small lists are kept in full inside
+the Text widget and patched line by line; above ``VIRTUALIZE_THRESHOLD``
+rows the widget only holds the visible window, which is redrawn when the
+user scrolls or when a visible row changes.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import List
+
+from .sensor_status_list import SensorStatusList
+
+
+class SensorStatusPanel:
+    VIRTUALIZE_THRESHOLD = 300
+
+    def __init__(self, master, model: SensorStatusList, empty_message: str,
+                 height: int = 5, width: int = 51):
+        self.model = model
+        self._empty_message = empty_message
+        self._height = height
+        self._offset = 0
+        self._virtual = False
+        self.frame = ttk.Frame(master)
+        self.text = tk.Text(self.frame, height=height, width=width,
+                            font=("Courier", 9), state="disabled", wrap="none")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self._on_scroll)
+        self.text.pack(side="left")
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.bind("<MouseWheel>", self._on_wheel)
+        self.text.bind("<Button-4>", lambda _e: self._scroll_rows(-1))
+        self.text.bind("<Button-5>", lambda _e: self._scroll_rows(1))
+        self._set_mode(False)
+
+    def refresh(self) -> None:
+        """Apply pending model changes to the widget."""
+        rebuilt, changed = self.model.sync()
+        if not rebuilt and not changed:
+            return
+        rows = self.model.rows
+        virtual = len(rows) > self.VIRTUALIZE_THRESHOLD
+        if virtual != self._virtual:
+            self._set_mode(virtual)
+            rebuilt = True
+        if self._virtual:
+            self._offset = min(self._offset, max(0, len(rows) - self._height))
+            if rebuilt or any(self._offset <= pos < self._offset + self._height for pos in changed):
+                self._render_window()
+            return
+        if rebuilt:
+            self._replace_all(rows if rows else [self._empty_message])
+        else:
+            self._replace_lines(rows, changed)
+
+    # ------------------------------------------------------------------ #
+    def _set_mode(self, virtual: bool) -> None:
+        self._virtual = virtual
+        self._offset = 0
+        if virtual:
+            self.text.config(yscrollcommand="")
+        else:
+            self.text.config(yscrollcommand=self.scrollbar.set)
+
+    def _replace_all(self, rows: List[str]) -> None:
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, "\n".join(rows) + "\n")
+        self.text.config(state="disabled")
+
+    def _replace_lines(self, rows: List[str], positions: List[int]) -> None:
+        self.text.config(state="normal")
+        for pos in positions:
+            line = pos + 1
+            self.text.delete(f"{line}.0", f"{line}.end")
+            self.text.insert(f"{line}.0", rows[pos])
+        self.text.config(state="disabled")
+
+    def _render_window(self) -> None:
+        rows = self.model.rows
+        self._replace_all(rows[self._offset:self._offset + self._height])
+        total = len(rows) or 1
+        self.scrollbar.set(self._offset / total, min(1.0, (self._offset + self._height) / total))
+
+    def _on_scroll(self, *args) -> None:
+        if not self._virtual:
+            self.text.yview(*args)
+            return
+        total = len(self.model.rows)
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._height if args[2] == "pages" else 1
+            self._offset += int(args[1]) * step
+        self._offset = max(0, min(self._offset, total - self._height))
+        self._render_window()
+
+    def _on_wheel(self, event) -> str:
+        self._scroll_rows(-1 if event.delta > 0 else 1)
+        return "break"
+
+    def _scroll_rows(self, rows: int) -> str:
+        self._on_scroll("scroll", rows, "units")
+        return "break"
@@ -0,0 +1,2 @@
+# benchmark suite package
+
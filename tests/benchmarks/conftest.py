@@ -0,0 +1,32 @@
+"""
+Shared helpers for the benchmark suite.
+
+Benchmarks report timings instead of asserting on them so the suite stays
+stable on slow CI machines; run them with ``pytest -m benchmark -s`` to see
+the numbers.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture
+def bench(request) -> Callable[..., float]:
+    """Time ``func`` ``repeat`` times and report the best run in seconds."""
+
+    def run(label: str, func: Callable[[], object], repeat: int = 5) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        request.node.user_properties.append((label, best))
+        print(f"\n[benchmark] {label}: best {best * 1e3:.3f} ms over {repeat} runs")
+        return best
+
+    return run
@@ -0,0 +1,64 @@
+"""
+Microbenchmark: frame-differencing motion detection across many cameras.
+"""
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.core.services.camera.camera_motion import MotionDetector, MotionRegion
+
+
+def _frames(size):
+    still = Image.new("RGB", size, "gray")
+    moved = still.copy()
+    ImageDraw.Draw(moved).rectangle((0, 0, size[0] // 3, size[1] // 3), fill="white")
+    return still, moved
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [3, 16, 64])
+class TestCameraMotionBenchmark:
+    def test_detect_on_analysis_sized_frames(self, count, bench):
+        """Thumbnails arrive at the analysis size, as from the motion monitor."""
+        detector = MotionDetector()
+        frames = _frames(detector.size)
+        for camera_id in range(count):
+            detector.set_regions(
+                camera_id,
+                [MotionRegion("door", (0.0, 0.0, 0.5, 0.5)), MotionRegion()],
+            )
+            detector.process(camera_id, frames[0])
+        state = {"flip": 1}
+
+        def sweep():
+            frame = frames[state["flip"]]
+            state["flip"] ^= 1
+            return [detector.process(camera_id, frame) for camera_id in range(count)]
+
+        best = bench(f"motion sweep x{count}", sweep, repeat=10)
+        print(f"[benchmark] motion sweeps/s x{count}: {1 / best:.1f}")
+        assert all(regions for regions in sweep())
+
+    def test_detect_on_full_views(self, count, bench):
+        detector = MotionDetector()
+        frames = _frames((500, 500))
+        state = {"flip": 1}
+
+        def sweep():
+            frame = frames[state["flip"]]
+            state["flip"] ^= 1
+            return [detector.process(camera_id, frame) for camera_id in range(count)]
+
+        sweep()
+        bench(f"motion sweep (500x500 views) x{count}", sweep, repeat=5)
+
+    def test_unchanged_views_are_skipped(self, count, bench):
+        detector = MotionDetector()
+        frame = _frames(detector.size)[0]
+        for camera_id in range(count):
+            detector.process(camera_id, frame)
+        bench(
+            f"motion sweep (unchanged) x{count}",
+            lambda: [detector.process(camera_id, frame) for camera_id in range(count)],
+            repeat=10,
+        )
@@ -0,0 +1,85 @@
+"""
+Microbenchmark: rendering every camera view, one by one vs. on the render pool.
+"""
+
+import pytest
+
+from src.controllers.camera_controller import CameraController
+from src.devices.cameras.safehome_camera import SafeHomeCamera
+
+
+SOURCE_IMAGES = 3  # only camera1..3.jpg ship with the app
+
+
+def _build_controller(count):
+    controller = CameraController()
+    for index in range(count):
+        camera_id = controller.add_camera(index % 1000, index // 1000)
+        controller.get_camera_by_id(camera_id).enable()
+    # Cameras beyond the shipped images reuse one so every frame has real work
+    devices = [camera._device for camera in controller.camera_list]
+    for index, device in enumerate(devices[SOURCE_IMAGES:]):
+        device.load_source(devices[index % SOURCE_IMAGES].source_path)
+    return controller
+
+
+def _build_cameras(count):
+    for index in range(count):
+        camera = SafeHomeCamera(index % SOURCE_IMAGES + 1, index % 1000, index // 1000)
+        camera._device.stop()
+
+
+def _cold(controller, render):
+    """Drop the per-device frame caches so every run renders from the source."""
+
+    def run():
+        for camera in controller.camera_list:
+            device = camera._device
+            device._crops.clear()
+            device._frame = device._frame_key = None
+        return render()
+
+    return run
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [3, 16, 64])
+class TestCameraRenderBenchmark:
+    def test_sequential_vs_parallel_views(self, count, bench):
+        controller = _build_controller(count)
+        try:
+            sequential = bench(
+                f"sequential views x{count}",
+                _cold(controller, lambda: [c.display_view() for c in controller.camera_list]),
+                repeat=3,
+            )
+            parallel = bench(
+                f"parallel views x{count}",
+                _cold(controller, controller.display_thumbnail_view),
+                repeat=3,
+            )
+            print(f"[benchmark] speedup x{count}: {sequential / parallel:.2f}")
+
+            views = controller.display_thumbnail_view()
+            assert len(views) == count
+            assert all(view is not None for _, view in views)
+        finally:
+            for camera in controller.camera_list:
+                camera._device.stop()
+
+    def test_parallel_thumbnails(self, count, bench):
+        controller = _build_controller(count)
+        try:
+            bench(
+                f"parallel thumbnails x{count}",
+                _cold(controller, lambda: list(controller.iter_views(size=(200, 150)))),
+                repeat=3,
+            )
+        finally:
+            for camera in controller.camera_list:
+                camera._device.stop()
+
+
+@pytest.mark.benchmark
+def test_bulk_camera_creation(bench):
+    bench("create 64 cameras", lambda: _build_cameras(64), repeat=3)
@@ -0,0 +1,209 @@
+"""
+Command-layer benchmark: throughput and latency of the main
+``System.handle_request`` commands on a headless System, at several house
+sizes (synthetic sensors added to the default house).
+
+The 100k sensor house only runs with ``SAFEHOME_BENCH_LARGE=1``. When the
+suite is selected with ``-m benchmark`` (or ``SAFEHOME_BENCH_OUT`` is set),
+results are written as JSON to ``SAFEHOME_BENCH_OUT`` (default
+``bench_results/commands-<commit>.json``) so runs can be compared between
+commits; point ``SAFEHOME_BENCH_BASELINE`` at an earlier file to print the
+p50 change of every command. A plain ``pytest`` run writes nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from src.core.headless import build_system
+from src.simulation.load_generator import SensorLoadGenerator, summarize_latencies
+from src.simulation.scenario import Scenario
+
+ROOT = Path(__file__).resolve().parents[2]
+SOURCE = "benchmark"
+
+LARGE = os.environ.get("SAFEHOME_BENCH_LARGE") == "1"
+SIZES = [
+    10,
+    1_000,
+    pytest.param(
+        100_000,
+        marks=pytest.mark.skipif(not LARGE, reason="set SAFEHOME_BENCH_LARGE=1"),
+    ),
+]
+
+
+def send(system, command, **kwargs):
+    result = system.handle_request(SOURCE, command, **kwargs)
+    assert result.get("success"), f"{command}: {result}"
+    return result
+
+
+def login_control_panel(system, i):
+    send(system, "login_control_panel", password="1234")
+
+
+def login_web(system, i):
+    send(system, "login_web", user_id="admin", password1="password", password2="password")
+
+
+def arm_disarm(system, i):
+    send(system, "arm_system", mode="AWAY" if i % 2 else "HOME")
+    send(system, "disarm_system")
+
+
+def zone_crud(system, i):
+    zone_id = send(system, "create_safety_zone", name=f"Bench {i}", sensors=["S1", "M1"])["zone_id"]
+    send(system, "update_safety_zone", zone_id=zone_id, name=f"Bench {i} renamed")
+    send(system, "get_safety_zones")
+    send(system, "delete_safety_zone", zone_id=zone_id)
+
+
+def get_status(system, i):
+    send(system, "get_status")
+
+
+def poll_sensors(system, i):
+    send(system, "poll_sensors")
+
+
+def get_intrusion_log(system, i):
+    send(system, "get_intrusion_log")
+
+
+def camera_view(system, i):
+    send(system, "get_camera_view", camera_id=1)
+
+
+def camera_pan_view(system, i):
+    # Moving the camera invalidates its frame, so every view is a fresh render
+    send(system, "camera_pan", camera_id=1, direction="L" if i % 2 else "R")
+    send(system, "get_camera_view", camera_id=1)
+
+
+def camera_thumbnails(system, i):
+    send(system, "get_camera_thumbnails")
+
+
+# name -> (operation, iterations)
+COMMANDS = {
+    "login_control_panel": (login_control_panel, 200),
+    "login_web": (login_web, 100),
+    "arm_disarm": (arm_disarm, 50),
+    "zone_crud": (zone_crud, 50),
+    "get_status": (get_status, 200),
+    "poll_sensors": (poll_sensors, 200),
+    "get_intrusion_log": (get_intrusion_log, 200),
+    "get_camera_view": (camera_view, 200),
+    "camera_pan_view": (camera_pan_view, 20),
+    "get_camera_thumbnails": (camera_thumbnails, 10),
+}
+
+
+def commit_id():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def should_write(config):
+    """Only benchmark runs keep results; the unit suite has no file side effects."""
+    if os.environ.get("SAFEHOME_BENCH_OUT"):
+        return True
+    markexpr = config.getoption("markexpr", "") or ""
+    return "benchmark" in markexpr and "not benchmark" not in markexpr
+
+
+def compare(baseline_path, results):
+    """Print the p50 ratio of every command against a previous results file."""
+    baseline = json.loads(Path(baseline_path).read_text())["results"]
+    print(f"\n[benchmark] compared with {baseline_path}")
+    for size, commands in results.items():
+        for name, stats in commands.items():
+            before = baseline.get(size, {}).get(name)
+            if before and before["latency_ms"].get("p50"):
+                ratio = stats["latency_ms"]["p50"] / before["latency_ms"]["p50"]
+                print(f"  {size:>7} sensors  {name:<22} p50 x{ratio:.2f}")
+
+
+@pytest.fixture(scope="module")
+def results(request):
+    results = {}
+    yield results
+    if not results or not should_write(request.config):
+        return
+    commit = commit_id()
+    out = Path(os.environ.get("SAFEHOME_BENCH_OUT") or ROOT / "bench_results" / f"commands-{commit}.json")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    out.write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"\n[benchmark] command results written to {out}")
+    baseline = os.environ.get("SAFEHOME_BENCH_BASELINE")
+    if baseline:
+        compare(baseline, results)
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}-sensors")
+def house(request):
+    size = request.param
+    system = build_system()
+    motion = max(1, size // 5)
+    scenario = Scenario.randomized(size - motion, motion, 0, seed=size)
+    start = time.perf_counter()
+    SensorLoadGenerator(system).populate(scenario)
+    print(f"\n[benchmark] {size} sensor house built in {time.perf_counter() - start:.2f} s")
+    send(system, "turn_on")
+    yield size, system
+    system.turn_off()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", list(COMMANDS))
+def test_command(house, name, results):
+    size, system = house
+    operation, iterations = COMMANDS[name]
+    if size >= 100_000:
+        iterations = max(5, iterations // 10)
+
+    start = time.perf_counter()
+    operation(system, 0)
+    first = time.perf_counter() - start
+
+    latencies = []
+    total_start = time.perf_counter()
+    for i in range(1, iterations + 1):
+        start = time.perf_counter()
+        operation(system, i)
+        latencies.append(time.perf_counter() - start)
+    total = time.perf_counter() - total_start
+
+    stats = {
+        "iterations": iterations,
+        "first_ms": first * 1e3,
+        "ops_per_s": iterations / total if total else 0.0,
+        "latency_ms": summarize_latencies(latencies),
+    }
+    results.setdefault(str(size), {})[name] = stats
+    latency = stats["latency_ms"]
+    print(
+        f"\n[benchmark] {name} @ {size} sensors: {stats['ops_per_s']:.0f} ops/s, "
+        f"p50 {latency['p50']:.3f} ms, p95 {latency['p95']:.3f} ms, first {stats['first_ms']:.3f} ms"
+    )
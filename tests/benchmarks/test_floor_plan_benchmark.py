@@ -0,0 +1,106 @@
+"""
+Microbenchmark: floor plan hit testing, drag selection, culling and
+zoomed-out clustering at scale.
+"""
+
+import random
+
+import pytest
+
+from src.interfaces.components.floor_plan_device_layer import DeviceLayer
+from src.interfaces.components.floor_plan_spatial import SpatialGrid
+
+
+class NullCanvas:
+    """Canvas stand-in that only hands out item ids."""
+
+    def __init__(self):
+        self.items = 0
+
+    def _create(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_oval = create_text = _create
+
+    def tag_bind(self, *args, **kwargs):
+        pass
+
+    def delete(self, *args):
+        pass
+
+
+def _devices(count, seed=7):
+    rng = random.Random(seed)
+    kinds = ("sensor", "motion", "door_sensor", "camera")
+    return {
+        f"D{i}": (rng.random(), rng.random(), kinds[i % len(kinds)]) for i in range(count)
+    }
+
+
+def _positions(devices, scale=20.0):
+    """Lay the plan out 20x larger, as a zoomed-in commercial floor."""
+    return {
+        dev_id: (int(nx * 607 * scale), int(ny * 373 * scale), dtype)
+        for dev_id, (nx, ny, dtype) in devices.items()
+    }
+
+
+def _scan_box(positions, x0, y0, x1, y1):
+    return [
+        dev_id
+        for dev_id, (x, y, dtype) in positions.items()
+        if dtype != "camera" and x0 <= x <= x1 and y0 <= y <= y1
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [100, 5000, 50000])
+class TestFloorPlanSpatialBenchmark:
+    def test_box_selection(self, count, bench):
+        positions = _positions(_devices(count))
+        grid = SpatialGrid.build(positions)
+        box = (1000, 1000, 1600, 1400)
+        scan = bench(f"linear box scan x{count}", lambda: _scan_box(positions, *box), repeat=5)
+        indexed = bench(
+            f"grid box query x{count}",
+            lambda: grid.query_rect(*box, types=("sensor", "motion", "door_sensor")),
+            repeat=5,
+        )
+        print(f"[benchmark] box selection speedup x{count}: {scan / indexed:.1f}")
+        assert sorted(grid.query_rect(*box, types=("sensor", "motion", "door_sensor"))) == sorted(
+            _scan_box(positions, *box)
+        )
+
+    def test_point_picking(self, count, bench):
+        grid = SpatialGrid.build(_positions(_devices(count)))
+        points = [(x, y) for x in range(0, 12000, 600) for y in range(0, 7400, 600)]
+        bench(
+            f"grid nearest x{count} ({len(points)} clicks)",
+            lambda: [grid.nearest(x, y, 12) for x, y in points],
+            repeat=5,
+        )
+
+    def test_render_visible_viewport(self, count, bench):
+        devices = _devices(count)
+        layer = DeviceLayer(devices=devices)
+        viewport = (0, 0, 900, 600)
+
+        def render():
+            layer.render(NullCanvas(), (0, 0), (20.0, 20.0), {}, set(), lambda *a: None, viewport)
+
+        bench(f"render viewport x{count}", render, repeat=3)
+        print(f"[benchmark] drawn {len(layer.visible)} of {count} devices")
+
+    def test_render_zoomed_out_clusters(self, count, bench):
+        devices = _devices(count)
+        layer = DeviceLayer(devices=devices)
+        canvas = NullCanvas()
+
+        def render():
+            canvas.items = 0
+            layer.render(canvas, (0, 0), (1.0, 1.0), {}, set(), lambda *a: None)
+
+        bench(f"render whole plan x{count}", render, repeat=3)
+        mode = f"{len(layer.clusters)} clusters" if layer.clusters else "icons"
+        print(f"[benchmark] whole plan x{count}: {canvas.items} canvas items ({mode})")
@@ -0,0 +1,72 @@
+"""
+Import-time benchmark: what each entry point costs to import, measured with
+``python -X importtime`` in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+GUI_MODULES = ("tkinter", "PIL", "numpy")
+
+
+def import_profile(statement):
+    """Run ``statement`` in a new interpreter; return (import time in us, loaded modules).
+
+    The time is the sum of the top-level entries of the ``-X importtime``
+    report, i.e. everything ``statement`` imported beyond interpreter startup.
+    """
+    probe = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(result.stdout.split())
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented; only top-level entries add up to the total
+        if not name.startswith("  ") and name.strip().split(".")[0] == "src":
+            total += int(cumulative)
+    return total, loaded
+
+
+def report(label, micros):
+    print(f"\n[benchmark] import {label}: {micros / 1e3:.1f} ms")
+
+
+@pytest.mark.benchmark
+class TestImportTimeBenchmark:
+    def test_headless_core_skips_gui_libraries(self):
+        micros, loaded = import_profile("import src.core.system")
+        report("src.core.system", micros)
+        assert not [name for name in loaded if name.split(".")[0] in GUI_MODULES]
+
+    def test_web_interface_loads_pages_on_demand(self):
+        micros, loaded = import_profile("import src.interfaces.web_interface")
+        report("src.interfaces.web_interface", micros)
+        assert not [name for name in loaded if name.startswith("src.interfaces.pages")]
+        assert "PIL" not in loaded
+
+        micros, loaded = import_profile(
+            "from src.interfaces.page_registry import PAGE_CLASSES\nPAGE_CLASSES['login']"
+        )
+        report("registry + login page", micros)
+        assert "src.interfaces.pages.thumbnail_view_page" not in loaded
+
+    def test_all_pages(self):
+        micros, loaded = import_profile(
+            "from src.interfaces.page_registry import PAGE_CLASSES\n"
+            "[PAGE_CLASSES[name] for name in PAGE_CLASSES]"
+        )
+        report("registry + every page", micros)
+        assert "PIL" in loaded
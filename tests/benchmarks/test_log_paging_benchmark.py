@@ -0,0 +1,67 @@
+"""
+Microbenchmark: event log refresh, paging and filters over a large log table.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.configuration.log_manager import LogManager
+from src.configuration.storage_manager import StorageManager
+from src.core.handlers.log_handler import LogHandler
+
+ROWS = 200_000
+
+
+@pytest.fixture(scope="module")
+def handler(tmp_path_factory):
+    StorageManager._instance = None
+    storage = StorageManager.get_instance(str(tmp_path_factory.mktemp("logs") / "bench.db"))
+    storage.connect()
+    start = datetime(2026, 1, 1)
+    storage.connection.executemany(
+        "INSERT INTO logs (timestamp, event_type, description, severity) VALUES (?, ?, ?, ?)",
+        (
+            (
+                (start + timedelta(seconds=30 * i)).isoformat(),
+                "INTRUSION" if i % 100 == 0 else ("ARM" if i % 2 else "DISARM"),
+                f"event {i}",
+                "INFO",
+            )
+            for i in range(ROWS)
+        ),
+    )
+    storage.connection.commit()
+    yield LogHandler(LogManager(storage))
+    storage.disconnect()
+    StorageManager._instance = None
+
+
+@pytest.mark.benchmark
+class TestLogPagingBenchmark:
+    def test_refresh_with_nothing_new(self, handler, bench):
+        latest = handler.get_intrusion_log(limit=1)["data"][0]["log_id"]
+        full = bench("refresh: reload newest 100", lambda: handler.get_intrusion_log(), repeat=20)
+        cursor = bench(
+            "refresh: after_id cursor", lambda: handler.get_intrusion_log(after_id=latest), repeat=20
+        )
+        print(f"[benchmark] refresh speedup: {full / cursor:.1f}x")
+        assert handler.get_intrusion_log(after_id=latest)["data"] == []
+
+    def test_page_deep_into_history(self, handler, bench):
+        bench("page before_id=150 (oldest rows)", lambda: handler.get_intrusion_log(before_id=150), repeat=20)
+
+    def test_sql_filters(self, handler, bench):
+        rare = bench(
+            "filter event_type=INTRUSION",
+            lambda: handler.get_intrusion_log(event_type="INTRUSION"),
+            repeat=20,
+        )
+        day = bench(
+            "filter one day",
+            lambda: handler.get_intrusion_log(since="2026-02-10", until="2026-02-10"),
+            repeat=20,
+        )
+        print(f"[benchmark] filtered pages: {rare * 1e3:.2f} ms / {day * 1e3:.2f} ms")
+        result = handler.get_intrusion_log(event_type="INTRUSION", limit=1000)
+        assert len(result["data"]) == 1000 and result["has_more"] is True
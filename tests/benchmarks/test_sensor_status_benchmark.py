@@ -0,0 +1,69 @@
+"""
+Microbenchmark: sensor status collection over a 10k sensor house.
+"""
+
+import pytest
+
+from src.core.services.sensor_service import SensorService
+from src.devices.sensors.sensor_controller import SensorController
+
+SENSOR_COUNT = 10_000
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = SensorService(SensorController())
+    entries = [
+        {
+            "id": f"S{i}",
+            "type": "MOTION" if i % 4 == 0 else "WINDOW",
+            "location": f"Room {i}",
+            "armed": i % 2 == 0,
+        }
+        for i in range(SENSOR_COUNT)
+    ]
+    service.initialize_defaults(entries, {})
+    return service
+
+
+@pytest.mark.benchmark
+class TestSensorStatusBenchmark:
+    def test_collect_statuses(self, service, bench):
+        bench("collect_statuses x10k", service.collect_statuses)
+
+        assert len(service.collect_statuses()) == SENSOR_COUNT
+
+    def test_direct_lookup_vs_controller_indirection(self, service, bench):
+        registry = service._registry
+        controller = service._controller
+        ids = service.sensor_ids
+
+        def via_controller():
+            for sensor_id in ids:
+                controller.getSensor(registry.lookup.get(sensor_id))
+
+        def direct():
+            for sensor_id in ids:
+                registry.get_sensor(sensor_id)
+
+        bench("lookup via controller id x10k", via_controller)
+        bench("direct lookup x10k", direct)
+
+        assert all(registry.get_sensor(sid) is not None for sid in ids)
+
+    def test_sensor_ids_snapshot(self, service, bench):
+        bench("sensor_ids x1000", lambda: [service.sensor_ids for _ in range(1000)])
+
+        assert service.sensor_ids is service.sensor_ids
+
+    def test_collect_statuses_after_single_change(self, service, bench):
+        sensor = service.get_sensor("S1")
+
+        def toggle_and_collect():
+            sensor.disarm() if sensor.isArmed() else sensor.arm()
+            return service.collect_statuses()
+
+        bench("collect_statuses x10k, one dirty", toggle_and_collect)
+
+    def test_devices_payload(self, service, bench):
+        bench("devices_payload x10k", lambda: service.get_devices_payload([], {}))
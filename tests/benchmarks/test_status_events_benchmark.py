@@ -0,0 +1,46 @@
+"""
+Microbenchmark: control panel LED refresh, polled get_status vs pushed status events.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.headless import build_system
+from src.interfaces.control_panel.control_panel import SafeHomeControlPanel
+from src.interfaces.control_panel.handlers import DisplayHandler
+
+
+def _panel(sensors):
+    system = build_system()
+    for i in range(sensors):
+        system.sensor_service.add_sensor(
+            {"id": f"B{i}", "type": "WINDOW", "location": f"Room {i}", "armed": False}
+        )
+    system.handle_request("control_panel", "turn_on")
+    cp = object.__new__(SafeHomeControlPanel)
+    cp._system = system
+    cp._state = SafeHomeControlPanel.STATE_LOGGED_IN
+    cp.after = Mock()
+    for setter in ("set_armed_led", "set_display_away", "set_display_stay"):
+        setattr(cp, setter, Mock())
+    cp._display = DisplayHandler(cp)
+    return cp
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("sensors", [10, 5_000])
+class TestStatusEventsBenchmark:
+    def test_led_refresh(self, sensors, bench):
+        cp = _panel(sensors)
+        display = cp._display
+
+        def polled():
+            res = cp.send_request("get_status")
+            display.update_leds_from_status(res["data"])
+
+        before = bench(f"LEDs via get_status, {sensors} sensors", polled, repeat=20)
+        after = bench(f"LEDs via pushed status, {sensors} sensors", cp._update_leds, repeat=20)
+        print(f"[benchmark] LED refresh speedup at {sensors} sensors: {before / after:.0f}x")
+        assert cp._display._subscribed
+        cp._display.unsubscribe_status()
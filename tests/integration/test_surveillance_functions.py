@@ -151,6 +151,43 @@ class TestIT022ViewThumbnailShots:
         # All unprotected cameras should be returned
         assert len(result["data"]) >= 1
 
+    def test_get_single_camera_thumbnail(self, system_web_logged_in):
+        """Normal: Thumbnail is rendered at the requested size."""
+        result = system_web_logged_in.handle_request(
+            "web", "get_camera_thumbnail", camera_id="C1", size=(120, 90)
+        )
+        assert result["success"] is True
+        assert result["thumbnail"].size == (120, 90)
+
+    def test_get_all_thumbnails_in_one_call(self, system_web_logged_in):
+        """Normal: Bulk call returns thumbnails for viewable cameras only."""
+        system_web_logged_in.handle_request(
+            "web", "set_camera_password", camera_id="C2", password="cam123"
+        )
+        system_web_logged_in.handle_request("web", "disable_camera", camera_id="C3")
+        result = system_web_logged_in.handle_request("web", "get_camera_thumbnails")
+        assert result["success"] is True
+        data = result["data"]
+        assert data["C1"]["thumbnail"].size == (200, 150)
+        assert data["C2"]["locked"] is True and data["C2"]["thumbnail"] is None
+        assert data["C3"]["thumbnail"] is None
+
+    def test_thumbnail_invalid_camera(self, system_web_logged_in):
+        """Exception: Unknown camera has no thumbnail."""
+        result = system_web_logged_in.handle_request(
+            "web", "get_camera_thumbnail", camera_id="C99"
+        )
+        assert result["success"] is False
+
+    @pytest.mark.parametrize("size", ["big", (1, 2, 3), {"w": 1}, ("a", "b")])
+    def test_thumbnail_bad_size_uses_default(self, system_web_logged_in, size):
+        """Exception: A malformed size falls back to the default thumbnail size."""
+        result = system_web_logged_in.handle_request(
+            "web", "get_camera_thumbnail", camera_id="C1", size=size
+        )
+        assert result["success"] is True
+        assert result["thumbnail"].size == (200, 150)
+
 
 class TestIT023EnableCamera:
     """IT-023: Enable camera."""
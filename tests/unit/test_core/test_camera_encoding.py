@@ -0,0 +1,148 @@
+"""
+Unit tests for JPEG/MJPEG camera output.
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from src.core.services.camera.camera_encoding import (
+    MJPEG_CONTENT_TYPE,
+    FrameEncoder,
+    mjpeg_part,
+    mjpeg_stream,
+)
+
+
+@pytest.fixture
+def frame():
+    return Image.new("RGB", (32, 32), "blue")
+
+
+class CountingEncoder(FrameEncoder):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.encodes = 0
+
+    def _to_jpeg(self, frame, quality):
+        self.encodes += 1
+        return super()._to_jpeg(frame, quality)
+
+
+class FakeSubscription:
+    interval = 0.1
+
+    def __init__(self, frames):
+        self._frames = list(frames)
+        self.active = True
+        self.closed = False
+
+    def poll(self):
+        return self._frames.pop(0) if self._frames else None
+
+    def close(self):
+        self.active = False
+        self.closed = True
+
+
+class TestFrameEncoder:
+    def test_same_frame_encoded_once_across_viewers(self, frame):
+        encoder = CountingEncoder()
+        first = encoder.encode(1, frame)
+        assert all(encoder.encode(1, frame) is first for _ in range(5))
+        assert encoder.encodes == 1
+        assert Image.open(io.BytesIO(first)).format == "JPEG"
+
+    def test_new_frame_or_quality_reencodes(self, frame):
+        encoder = CountingEncoder()
+        encoder.encode(1, frame, quality=80)
+        encoder.encode(1, frame, quality=40)
+        encoder.encode(1, frame.copy(), quality=80)
+        assert encoder.encodes == 3
+
+    def test_cache_is_bounded_least_recently_used_first(self, frame):
+        encoder = CountingEncoder(max_entries=2)
+        encoder.encode(1, frame)
+        encoder.encode(2, frame)
+        encoder.encode(1, frame)  # camera 1 is now the most recent
+        encoder.encode(3, frame)  # evicts camera 2
+        assert encoder.encodes == 3
+
+        encoder.encode(1, frame)
+        assert encoder.encodes == 3
+        encoder.encode(2, frame)
+        assert encoder.encodes == 4
+        assert len(encoder._cache) == 2
+
+    def test_quality_is_clamped(self):
+        assert FrameEncoder.normalize_quality(None) == FrameEncoder.DEFAULT_QUALITY
+        assert FrameEncoder.normalize_quality(500) == 95
+        assert FrameEncoder.normalize_quality(0) == 1
+
+
+class TestMjpegStream:
+    def test_part_framing(self):
+        part = mjpeg_part(b"JPEGDATA")
+        assert part == (
+            b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: 8\r\n\r\nJPEGDATA\r\n"
+        )
+        assert MJPEG_CONTENT_TYPE.endswith("boundary=frame")
+
+    def test_stream_yields_only_new_frames_and_closes(self, frame):
+        other = frame.copy()
+        subscription = FakeSubscription([frame, None, None, other])
+        sleeps = []
+        stream = mjpeg_stream(subscription, lambda f: b"A" if f is frame else b"B",
+                              max_frames=2, sleep=sleeps.append)
+        parts = list(stream)
+        assert [part[-3:-2] for part in parts] == [b"A", b"B"]
+        assert sleeps == [0.1, 0.1]
+        assert subscription.closed is True
+
+    def test_closing_generator_unsubscribes(self, frame):
+        subscription = FakeSubscription([frame, frame])
+        stream = mjpeg_stream(subscription, lambda f: b"X", sleep=lambda _s: None)
+        next(stream)
+        stream.close()
+        assert subscription.closed is True
+
+
+def test_system_jpeg_and_mjpeg_commands(tmp_path, monkeypatch):
+    from src.configuration.storage_manager import StorageManager
+    from src.core.system import System
+    from src.virtual_devices import camera_clock
+
+    # Freeze camera clocks so both requests see the same rendered frame
+    monkeypatch.setattr(camera_clock, "_clock", camera_clock.VirtualClock())
+    StorageManager._instance = None
+    system = System(str(tmp_path / "encoded.db"))
+    first = system.handle_request("web", "get_camera_jpeg", camera_id="C1", quality=60)
+    assert first["success"] is True and first["content_type"] == "image/jpeg"
+    again = system.handle_request("web", "get_camera_jpeg", camera_id="C1", quality=60)
+    assert again["jpeg"] is first["jpeg"]
+
+    result = system.handle_request("web", "stream_camera_mjpeg", camera_id="C1", max_frames=1)
+    assert result["content_type"] == MJPEG_CONTENT_TYPE
+    (part,) = list(result["stream"])
+    assert part.startswith(b"--frame\r\nContent-Type: image/jpeg")
+    assert system.handle_request("web", "stream_camera_mjpeg", camera_id="C42")["success"] is False
+
+
+def test_unstarted_mjpeg_stream_holds_no_subscription(tmp_path):
+    from src.configuration.storage_manager import StorageManager
+    from src.core.system import System
+
+    StorageManager._instance = None
+    system = System(str(tmp_path / "stream.db"))
+    hub = system.camera_service._frames
+
+    result = system.handle_request("web", "stream_camera_mjpeg", camera_id="C1")
+    assert hub._subscriptions == []
+    del result
+
+    stream = system.handle_request("web", "stream_camera_mjpeg", camera_id="C1")["stream"]
+    next(stream)
+    assert len(hub._subscriptions) == 1
+    stream.close()
+    assert hub._subscriptions == []
@@ -0,0 +1,125 @@
+"""
+Unit tests for camera frame-differencing motion detection.
+"""
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.core.services.camera.camera_motion import (
+    MotionDetector,
+    MotionMonitor,
+    MotionRegion,
+)
+
+
+def _frame(box=None, size=(64, 48)):
+    image = Image.new("RGB", size, "black")
+    if box is not None:
+        ImageDraw.Draw(image).rectangle(box, fill="white")
+    return image
+
+
+class FakeController:
+    def __init__(self):
+        self.frames = {1: _frame()}
+
+    def iter_views(self, size=None):
+        return iter(list(self.frames.items()))
+
+
+class TestMotionDetector:
+    def test_first_frame_is_only_a_baseline(self):
+        detector = MotionDetector()
+        assert detector.process(1, _frame((0, 0, 20, 20))) == []
+
+    def test_changed_area_reports_motion(self):
+        detector = MotionDetector()
+        detector.process(1, _frame())
+        assert detector.process(1, _frame((0, 0, 20, 20))) == ["full"]
+
+    def test_same_frame_object_is_not_diffed(self):
+        detector = MotionDetector()
+        frame = _frame()
+        detector.process(1, _frame((0, 0, 20, 20)))
+        detector.process(1, frame)
+        assert detector.process(1, frame) == []
+
+    def test_small_change_stays_below_area_threshold(self):
+        detector = MotionDetector()
+        detector.process(1, _frame())
+        assert detector.process(1, _frame((0, 0, 2, 2))) == []
+
+    def test_regions_have_their_own_thresholds(self):
+        detector = MotionDetector()
+        detector.set_regions(
+            1,
+            [
+                MotionRegion("left", (0.0, 0.0, 0.5, 1.0)),
+                MotionRegion("right", (0.5, 0.0, 1.0, 1.0), area_threshold=0.5),
+            ],
+        )
+        detector.process(1, _frame())
+        # Fills the left half and a quarter of the right half
+        assert detector.process(1, _frame((0, 0, 40, 47))) == ["left"]
+
+    def test_frames_are_downscaled_before_diffing(self):
+        detector = MotionDetector(size=(32, 24))
+        detector.process(1, _frame(size=(500, 500)))
+        assert detector.process(1, _frame((0, 0, 250, 250), size=(500, 500))) == ["full"]
+
+    def test_reset_drops_baseline(self):
+        detector = MotionDetector()
+        detector.process(1, _frame())
+        detector.reset(1)
+        assert detector.process(1, _frame((0, 0, 30, 30))) == []
+
+
+class TestMotionMonitor:
+    def test_sample_queues_events_until_polled(self):
+        controller = FakeController()
+        monitor = MotionMonitor(controller, MotionDetector(), clock=lambda: 5.0)
+        assert monitor.sample() == []
+        controller.frames[1] = _frame((0, 0, 30, 30))
+        monitor.sample()
+        assert monitor.poll() == {"camera_id": 1, "regions": ["full"], "time": 5.0}
+        assert monitor.poll() is None
+
+
+@pytest.fixture
+def system(tmp_path):
+    from src.configuration.storage_manager import StorageManager
+    from src.core.system import System
+
+    StorageManager._instance = None
+    return System(str(tmp_path / "motion.db"))
+
+
+def test_camera_motion_raises_alarm_through_sensor_polling(system):
+    service = system.camera_service
+    assert system.handle_request("web", "start_motion_detection", fps=0.1)["success"]
+    assert system.handle_request("web", "arm_system", mode="AWAY")["success"]
+    service._motion.sample()  # baseline frames
+    assert system.handle_request("web", "poll_sensors")["intrusion_detected"] is False
+
+    # Swap camera 1's source image: the next sample sees the whole view change
+    cameras = system.camera_controller
+    cameras.get_camera_by_id(1)._device.load_source(
+        cameras.get_camera_by_id(3)._device.source_path
+    )
+    service._motion.sample()
+
+    result = system.handle_request("web", "poll_sensors")
+    assert result["intrusion_detected"] is True
+    assert result["sensor_id"] == "C1"
+    assert result["alarm"]["zone"] == "Front Zone"
+    assert result["alarm"]["sensor"].startswith("C1 (Camera motion")
+    system.handle_request("web", "stop_motion_detection")
+
+
+def test_ptz_moves_do_not_count_as_motion(system):
+    service = system.camera_service
+    service.start_motion_detection(fps=0.1)
+    service.poll_motion(sample=True)
+    system.handle_request("web", "camera_pan", camera_id="C1", direction="right")
+    assert service.poll_motion(sample=True)["intrusion_detected"] is False
+    service.stop_motion_detection()
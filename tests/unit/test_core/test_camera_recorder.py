@@ -0,0 +1,203 @@
+"""
+Unit tests for alarm-triggered camera recording.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.core.services.camera.camera_recorder import CameraRecorder, FrameRingBuffer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeController:
+    """Serves one frame object per camera until ``change`` swaps it."""
+
+    def __init__(self, camera_ids):
+        self.frames = {cid: object() for cid in camera_ids}
+
+    def change(self, camera_id):
+        self.frames[camera_id] = object()
+
+    def iter_views(self):
+        return iter(list(self.frames.items()))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def controller():
+    return FakeController([1, 2])
+
+
+@pytest.fixture
+def recorder(controller, clock, tmp_path):
+    frame_ids = {}
+
+    def encode(camera_id, frame):
+        # Distinct bytes per frame so clips can be checked frame by frame
+        number = frame_ids.setdefault(id(frame), len(frame_ids))
+        return f"cam{camera_id}-frame{number}".encode()
+
+    return CameraRecorder(
+        controller,
+        encode,
+        {1: 10, 2: 20},
+        tmp_path,
+        seconds=3,
+        fps=1,
+        post_roll=2,
+        clock=clock,
+    )
+
+
+class TestFrameRingBuffer:
+    def test_drops_frames_older_than_window(self):
+        buffer = FrameRingBuffer(byte_budget=1000, seconds=2)
+        for ts in range(5):
+            buffer.append(float(ts), b"x")
+        assert [ts for ts, _ in buffer.snapshot()] == [2.0, 3.0, 4.0]
+
+    def test_drops_oldest_frames_over_byte_budget(self):
+        buffer = FrameRingBuffer(byte_budget=10, seconds=100)
+        for ts in range(4):
+            buffer.append(float(ts), b"abcd")
+        assert len(buffer) == 2
+        assert buffer.size == 8
+
+
+class TestCameraRecorder:
+    def test_unchanged_views_are_buffered_once(self, recorder, controller, clock):
+        for _ in range(3):
+            recorder.capture()
+            clock.now += 1
+        controller.change(1)
+        recorder.capture()
+        buffers = recorder.status()["buffers"]
+        assert buffers["C1"]["frames"] == 2
+        assert buffers["C2"]["frames"] == 1
+
+    def test_alarm_records_pre_and_post_roll_for_zone_cameras(
+        self, recorder, controller, clock, tmp_path
+    ):
+        recorder.capture()
+        clock.now += 1
+        controller.change(1)
+        recorder.capture()
+
+        assert recorder.on_alarm({"zone_id": 10, "sensor_id": "S1"}) == [1]
+        for _ in range(3):
+            clock.now += 1
+            controller.change(1)
+            recorder.capture()
+        recorder.drain()
+
+        assert recorder.status()["active_clips"] == 0
+        assert len(recorder.written) == 1
+        segment = recorder.written[0]
+        assert segment.parent == tmp_path / "camera1"
+        index = json.loads(segment.with_suffix(".json").read_text())
+        assert index["reason"]["sensor_id"] == "S1"
+        assert index["frames"] == [1000.0, 1001.0, 1002.0, 1003.0]
+        assert segment.read_bytes().count(b"--frame\r\n") == 4
+
+    def test_alarm_without_matching_cameras_records_nothing(self, recorder):
+        recorder.capture()
+        assert recorder.on_alarm({"zone_id": 99}) == []
+        assert recorder.on_alarm({"zone_id": None}) == []
+        recorder.stop()
+        assert recorder.written == []
+
+    def test_stop_flushes_clips_still_in_post_roll(self, recorder):
+        recorder.capture()
+        recorder.on_alarm({"zone_id": 20})
+        recorder.stop()
+        assert [path.parent.name for path in recorder.written] == ["camera2"]
+
+    def test_alarm_after_stop_starts_no_clip(self, recorder):
+        recorder.capture()
+        recorder.stop()
+        assert recorder.on_alarm({"zone_id": 20}) == []
+        assert recorder.status()["active_clips"] == 0
+
+    def test_post_roll_is_capped_by_byte_budget(self, controller, clock, tmp_path):
+        recorder = CameraRecorder(
+            controller, lambda cid, frame: b"x" * 10, {1: 10}, tmp_path,
+            post_roll=100, byte_budget=25, clock=clock,
+        )
+        recorder.capture()
+        recorder.on_alarm({"zone_id": 10})
+        for _ in range(5):
+            clock.now += 1
+            controller.change(1)
+            recorder.capture()
+        recorder.drain()
+
+        assert recorder.status()["active_clips"] == 0
+        index = json.loads(recorder.written[0].with_suffix(".json").read_text())
+        assert index["frames"] == [1000.0, 1001.0, 1002.0]  # pre-roll + 20 bytes
+
+    def test_stop_waits_for_the_sample_in_progress(self, recorder, controller, clock):
+        sampling, release = threading.Event(), threading.Event()
+        iter_views = controller.iter_views
+
+        def slow_iter_views():
+            sampling.set()
+            release.wait(2)
+            return iter_views()
+
+        recorder.capture()
+        recorder.on_alarm({"zone_id": 10})
+        recorder.fps = 50
+        controller.iter_views = slow_iter_views
+        recorder.start()
+        assert sampling.wait(2)
+
+        controller.change(1)  # picked up by the sample already under way
+        stopper = threading.Thread(target=recorder.stop)
+        stopper.start()
+        deadline = time.monotonic() + 2
+        while not recorder._stop.is_set() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        stopper.join(5)
+
+        assert len(recorder.written) == 1
+        assert recorder.written[0].read_bytes().count(b"--frame\r\n") == 2
+
+
+def test_alarm_trigger_saves_clip_through_system(tmp_path):
+    from src.configuration.storage_manager import StorageManager
+    from src.core.system import System
+
+    StorageManager._instance = None
+    system = System(str(tmp_path / "recorder.db"))
+    output = tmp_path / "clips"
+    started = system.handle_request(
+        "web", "start_camera_recording", output_dir=str(output), fps=20
+    )
+    assert started["success"] is True
+    assert system.handle_request("web", "start_camera_recording")["success"] is False
+
+    # S1 belongs to the Front Zone, which camera C1 watches
+    system.handle_request("web", "trigger_alarm", sensor_id="S1")
+    status = system.handle_request("web", "get_recording_status")["status"]
+    assert status["recording"] is True
+    assert status["active_clips"] == 1
+
+    stopped = system.handle_request("web", "stop_camera_recording")
+    assert stopped["success"] is True
+    assert [p.parent.name for p in output.glob("*/*.mjpeg")] == ["camera1"]
+    assert system.handle_request("web", "get_recording_status")["status"] == {"recording": False}
@@ -0,0 +1,146 @@
+"""
+Unit tests for camera frame subscriptions (CameraFrameHub).
+"""
+
+import threading
+
+import pytest
+
+from src.core.services.camera.camera_stream import CameraFrameHub
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FrameController:
+    """Returns the same frame object until ``change`` is called, like DeviceCamera."""
+
+    def __init__(self):
+        self.frames = {1: object(), 2: object()}
+        self.renders = 0
+
+    def display_single_view(self, camera_id):
+        self.renders += 1
+        return self.frames.get(camera_id)
+
+    def change(self, camera_id):
+        self.frames[camera_id] = object()
+
+
+@pytest.fixture
+def controller():
+    return FrameController()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def hub(controller, clock):
+    hub = CameraFrameHub(controller, clock=clock)
+    hub._ensure_thread = lambda: None  # drive dispatch with pump()
+    yield hub
+    hub.close()
+
+
+class TestPolledSubscriptions:
+    def test_poll_returns_frame_only_when_view_changes(self, hub, controller):
+        sub = hub.subscribe(1)
+        first = sub.poll()
+        assert first is controller.frames[1]
+        assert sub.poll() is None
+        controller.change(1)
+        assert sub.poll() is controller.frames[1]
+
+    def test_reset_redelivers_current_frame(self, hub, controller):
+        sub = hub.subscribe(1)
+        frame = sub.poll()
+        sub.reset()
+        assert sub.poll() is frame
+
+    def test_closed_subscription_gets_nothing(self, hub):
+        sub = hub.subscribe(1)
+        sub.close()
+        assert sub.poll() is None
+        assert 1 not in hub._feeds
+
+
+class TestPushedSubscriptions:
+    def test_subscribers_share_one_render(self, hub, controller):
+        received = []
+        for _ in range(3):
+            hub.subscribe(1, fps=10, callback=lambda cam, frame: received.append(frame))
+        controller.renders = 0
+        hub.pump()
+        assert controller.renders == 1
+        assert received == [controller.frames[1]] * 3
+
+    def test_target_fps_throttles_delivery(self, hub, controller, clock):
+        received = []
+        hub.subscribe(1, fps=5, callback=lambda cam, frame: received.append(frame))
+        hub.pump()
+        controller.change(1)
+        clock.now = 0.1
+        assert hub.pump() == pytest.approx(0.1)
+        assert len(received) == 1
+        clock.now = 0.2
+        hub.pump()
+        assert received[-1] is controller.frames[1] and len(received) == 2
+
+    def test_unchanged_view_is_not_redelivered(self, hub, clock):
+        received = []
+        hub.subscribe(1, fps=10, callback=lambda cam, frame: received.append(cam))
+        for step in range(5):
+            clock.now = step * 0.1
+            hub.pump()
+        assert received == [1]
+
+    def test_notify_makes_subscribers_due(self, hub, controller, clock):
+        received = []
+        hub.subscribe(1, fps=1, callback=lambda cam, frame: received.append(frame))
+        hub.pump()
+        controller.change(1)
+        clock.now = 0.01
+        hub.notify(1)
+        hub.pump()
+        assert received[-1] is controller.frames[1]
+
+
+def test_dispatcher_thread_pushes_frames(controller):
+    delivered = threading.Event()
+    hub = CameraFrameHub(controller)
+    try:
+        hub.subscribe(2, fps=30, callback=lambda cam, frame: delivered.set())
+        assert delivered.wait(2)
+    finally:
+        hub.close()
+
+
+def test_camera_service_subscription_commands(tmp_path, monkeypatch):
+    from src.configuration.storage_manager import StorageManager
+    from src.core.system import System
+    from src.virtual_devices import camera_clock
+
+    # Freeze camera clocks so only the zoom changes the view
+    monkeypatch.setattr(camera_clock, "_clock", camera_clock.VirtualClock())
+    StorageManager._instance = None
+    system = System(str(tmp_path / "stream.db"))
+    result = system.handle_request("web", "subscribe_camera_frames", camera_id="C1", fps=5)
+    assert result["success"] is True
+    subscription = result["subscription"]
+    first = subscription.poll()
+    assert first is not None
+    assert subscription.poll() is None
+    system.handle_request("web", "camera_zoom", camera_id="C1", direction="in")
+    assert subscription.poll() is not first
+    assert system.handle_request(
+        "web", "unsubscribe_camera_frames", subscription=subscription
+    )["success"] is True
+    assert system.handle_request("web", "subscribe_camera_frames", camera_id="C99")["success"] is False
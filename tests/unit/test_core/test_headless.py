@@ -0,0 +1,65 @@
+"""
+Unit tests for the headless System entry point and the GUI-free core packages.
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core import headless
+
+ROOT = Path(__file__).resolve().parents[3]
+HEADLESS_PACKAGES = ("src/core", "src/devices", "src/controllers")
+
+
+def _imported_modules(path):
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+
+
+class TestHeadlessPackages:
+    @pytest.mark.parametrize("package", HEADLESS_PACKAGES)
+    def test_no_tk_imports(self, package):
+        offenders = [
+            f"{path.relative_to(ROOT)}: {module}"
+            for path in sorted((ROOT / package).rglob("*.py"))
+            for module in _imported_modules(path)
+            if module.split(".")[0] in ("tkinter", "_tkinter") or module == "PIL.ImageTk"
+        ]
+        assert offenders == []
+
+
+class TestHeadlessEntryPoint:
+    def test_parse_command_reads_json_values(self):
+        assert headless.parse_command("arm_system mode=AWAY") == ("arm_system", {"mode": "AWAY"})
+        assert headless.parse_command("camera_zoom camera_id=1 direction='in'") == (
+            "camera_zoom",
+            {"camera_id": 1, "direction": "in"},
+        )
+        with pytest.raises(ValueError):
+            headless.parse_command("arm_system AWAY")
+
+    def test_run_sends_commands_in_order(self):
+        system = headless.build_system()
+        results = headless.run(system, ["turn_on", "arm_system mode=AWAY", "get_status"])
+        assert [r["command"] for r in results] == ["turn_on", "arm_system", "get_status"]
+        assert results[-1]["result"]["data"]["armed"] is True
+
+    def test_check_passes_in_a_fresh_interpreter(self):
+        """What CI runs: boot System, send commands, fail if Tk was imported."""
+        result = subprocess.run(
+            [sys.executable, "-m", "src.core", "--check", "--command", "turn_on",
+             "--command", "get_sensors"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert '"tk_modules": []' in result.stdout
@@ -0,0 +1,114 @@
+"""
+Unit tests for cursor-based log paging and SQL-side log filters.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.configuration.storage_manager import StorageManager
+from src.core.system import System
+
+
+@pytest.fixture
+def system(tmp_path):
+    StorageManager._instance = None
+    sys_inst = System(str(tmp_path / "logs.db"))
+    storage = sys_inst._storage
+    storage.execute_update("DELETE FROM logs")
+    start = datetime(2026, 3, 1, 8, 0, 0)
+    for i in range(250):
+        storage.save_log(
+            {
+                "timestamp": start + timedelta(hours=i),
+                "event_type": "INTRUSION" if i % 5 == 0 else "ARM",
+                "description": f"event {i}",
+                "severity": "INFO",
+            }
+        )
+    yield sys_inst
+    storage.disconnect()
+
+
+def _details(result):
+    return [row["detail"] for row in result["data"]]
+
+
+class TestLogPaging:
+    def test_first_page_is_newest_first_with_more_flag(self, system):
+        result = system.handle_request("web", "get_intrusion_log")
+        assert result["success"] is True
+        assert len(result["data"]) == 100
+        assert _details(result)[:2] == ["event 249", "event 248"]
+        assert result["has_more"] is True
+        ids = [row["log_id"] for row in result["data"]]
+        assert ids == sorted(ids, reverse=True)
+
+    def test_before_id_pages_back_until_exhausted(self, system):
+        seen = []
+        result = system.handle_request("web", "get_intrusion_log", limit=100)
+        seen += _details(result)
+        while result["has_more"]:
+            result = system.handle_request(
+                "web", "get_intrusion_log", before_id=result["data"][-1]["log_id"]
+            )
+            seen += _details(result)
+        assert seen == [f"event {i}" for i in range(249, -1, -1)]
+
+    def test_after_id_returns_only_new_rows(self, system):
+        first = system.handle_request("web", "get_intrusion_log", limit=10)
+        latest = first["data"][0]["log_id"]
+        nothing = system.handle_request("web", "get_intrusion_log", after_id=latest)
+        assert nothing["data"] == [] and nothing["has_more"] is False
+
+        for i in range(3):
+            system._storage.save_log({"event_type": "PANIC", "description": f"new {i}"})
+        newer = system.handle_request("web", "get_intrusion_log", after_id=latest)
+        assert _details(newer) == ["new 2", "new 1", "new 0"]
+
+    def test_after_id_catches_up_in_order_when_many_are_new(self, system):
+        oldest = system.handle_request("web", "get_intrusion_log", before_id=3)
+        cursor = oldest["data"][0]["log_id"]
+        newer = system.handle_request("web", "get_intrusion_log", after_id=cursor, limit=5)
+        # The five rows right after the cursor, shown newest first
+        assert [row["log_id"] for row in newer["data"]] == list(range(cursor + 5, cursor, -1))
+        assert newer["has_more"] is True
+
+    def test_event_type_filter(self, system):
+        result = system.handle_request("web", "get_intrusion_log", event_type="INTRUSION")
+        assert len(result["data"]) == 50
+        assert {row["event"] for row in result["data"]} == {"INTRUSION"}
+        assert result["has_more"] is False
+
+    def test_date_filter_covers_whole_days(self, system):
+        result = system.handle_request(
+            "web", "get_intrusion_log", since="2026-03-02", until="2026-03-02"
+        )
+        stamps = [row["timestamp"] for row in result["data"]]
+        assert len(stamps) == 24
+        assert all(stamp.startswith("2026-03-02") for stamp in stamps)
+
+    def test_invalid_date_is_rejected(self, system):
+        result = system.handle_request("web", "get_intrusion_log", since="yesterday")
+        assert result["success"] is False
+        assert "Invalid date" in result["message"]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"limit": "many"}, {"limit": None}, {"after_id": "x"}, {"before_id": [1]}]
+    )
+    def test_malformed_numbers_are_rejected(self, system, kwargs):
+        result = system.handle_request("web", "get_intrusion_log", **kwargs)
+        assert result["success"] is False
+        assert "whole numbers" in result["message"]
+
+    def test_event_types_listed_from_storage(self, system):
+        result = system.handle_request("web", "get_log_event_types")
+        assert result == {"success": True, "data": ["ARM", "INTRUSION"]}
+
+    def test_filters_use_indexes(self, system):
+        plan = system._storage.execute_query(
+            "EXPLAIN QUERY PLAN SELECT log_id FROM logs "
+            "WHERE event_type IN (?) AND log_id < ? ORDER BY log_id DESC LIMIT 10",
+            ("ARM", 100),
+        )
+        assert any("idx_logs_event_type" in row["detail"] for row in plan)
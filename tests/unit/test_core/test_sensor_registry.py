@@ -66,6 +66,9 @@ class StubSensorController:
     def getSensor(self, internal_id):
         return self._sensors.get(internal_id)
 
+    def removeSensor(self, internal_id):
+        return self._sensors.pop(internal_id, None) is not None
+
 
 class TestSensorRegistry:
     def test_initialize_sets_metadata_and_arms(self):
@@ -116,3 +119,46 @@ class TestSensorRegistry:
 
         assert registry.get_sensor("missing") is None
 
+    def test_get_sensor_resolves_object_directly(self):
+        controller = StubSensorController()
+        registry = SensorRegistry(controller)
+        registry.initialize([{"id": "front", "type": "WINDOW"}], {})
+
+        assert registry.get_sensor("front") is controller.getSensor(1)
+        assert registry.sensors["front"] is controller.getSensor(1)
+
+    def test_ids_cached_until_add_or_remove(self):
+        controller = StubSensorController()
+        registry = SensorRegistry(controller)
+        registry.initialize(
+            [{"id": "a", "type": "WINDOW"}, {"id": "b", "type": "MOTION"}], {}
+        )
+
+        ids = registry.ids
+        assert ids == ("a", "b")
+        assert registry.ids is ids  # cached snapshot reused
+
+        registry.add_sensor({"id": "c", "type": "WINDOW"})
+        assert registry.ids == ("a", "b", "c")
+
+        assert registry.remove_sensor("a") is True
+        assert registry.ids == ("b", "c")
+        assert "a" not in registry.lookup and "a" not in registry.metadata
+        assert controller.getSensor(1) is None
+        assert len(registry.instances) == 2
+
+    def test_remove_unknown_sensor_returns_false(self):
+        registry = SensorRegistry(StubSensorController())
+
+        assert registry.remove_sensor("missing") is False
+
+    def test_add_existing_id_replaces_previous_sensor(self):
+        controller = StubSensorController()
+        registry = SensorRegistry(controller)
+        registry.add_sensor({"id": "a", "type": "WINDOW"})
+        replacement = registry.add_sensor({"id": "a", "type": "MOTION"})
+
+        assert registry.get_sensor("a") is replacement
+        assert registry.ids == ("a",)
+        assert registry.instances == [replacement]
+        assert controller.getSensor(1) is None
@@ -2,9 +2,10 @@
 Unit tests for SensorStateService ensuring coverage of aggregation logic.
 """
 
-from types import SimpleNamespace
-
+from src.core.services.sensor.sensor_registry import SensorRegistry
 from src.core.services.sensor.sensor_state import SensorStateService
+from src.devices.sensors.sensor_controller import SensorController
+from src.virtual_devices.device_windoor_sensor import DeviceWinDoorSensor
 
 
 class DummySensor:
@@ -24,10 +25,15 @@ class FakeRegistry:
     def __init__(self, sensors):
         self._sensors = sensors
         self.lookup = {sid: idx for idx, sid in enumerate(sorted(sensors))}
+        self.ids = tuple(sensors)
+        self.volatile = set(sensors)  # stubs cannot report changes
 
     def get_sensor(self, sensor_id):
         return self._sensors.get(sensor_id)
 
+    def take_dirty(self):
+        return set()
+
 
 class TestSensorStateService:
     def _service(self):
@@ -71,3 +77,108 @@ class TestSensorStateService:
         assert payload["camX"]["enabled"] is False
 
 
+class CountingSensorRegistry(SensorRegistry):
+    """Real registry that counts get_status calls per sensor."""
+
+    def __init__(self):
+        super().__init__(SensorController())
+        self.status_calls = {}
+
+    def add_sensor(self, entry, coords=(0, 0)):
+        sensor = super().add_sensor(entry, coords)
+        original = sensor.get_status
+        sensor_id = entry["id"]
+
+        def counted():
+            self.status_calls[sensor_id] = self.status_calls.get(sensor_id, 0) + 1
+            return original()
+
+        sensor.get_status = counted
+        return sensor
+
+
+class TestIncrementalStatusCache:
+    def _service(self):
+        registry = CountingSensorRegistry()
+        registry.initialize(
+            [
+                {"id": "S2", "type": "WINDOW", "location": "Hall"},
+                {"id": "M1", "type": "MOTION", "location": "DR"},
+                {"id": "S1", "type": "DOOR", "location": "Front"},
+            ],
+            {},
+        )
+        return registry, SensorStateService(registry)
+
+    def test_statuses_sorted_and_reused_when_clean(self):
+        registry, service = self._service()
+
+        first = service.collect_statuses()
+        assert [s["id"] for s in first] == ["M1", "S1", "S2"]
+
+        registry.status_calls.clear()
+        second = service.collect_statuses()
+        assert registry.status_calls == {}
+        assert second == first
+
+    def test_only_dirty_sensor_is_refreshed(self):
+        registry, service = self._service()
+        service.collect_statuses()
+        registry.status_calls.clear()
+
+        registry.get_sensor("S1").arm()
+        statuses = {s["id"]: s for s in service.collect_statuses()}
+        devices = service.devices_payload([], {})
+
+        assert registry.status_calls == {"S1": 1}
+        assert statuses["S1"]["armed"] is True
+        assert devices["S1"]["armed"] is True
+        assert devices["S2"]["armed"] is False
+
+    def test_add_and_remove_resort_cache(self):
+        registry, service = self._service()
+        service.collect_statuses()
+
+        registry.add_sensor({"id": "A0", "type": "WINDOW"})
+        registry.remove_sensor("S2")
+
+        assert [s["id"] for s in service.collect_statuses()] == ["A0", "M1", "S1"]
+        assert "S2" not in service.devices_payload([], {})
+
+    def test_device_changes_refresh_only_their_sensor(self):
+        registry, service = self._service()
+        device = DeviceWinDoorSensor()
+        try:
+            device.arm()
+            registry.get_sensor("S2").setDevice(device)
+            service.collect_statuses()
+            registry.status_calls.clear()
+
+            assert {s["id"]: s for s in service.collect_statuses()}["S2"]["is_open"] is False
+            assert registry.status_calls == {}
+
+            device.intrude()
+            statuses = {s["id"]: s for s in service.collect_statuses()}
+
+            assert statuses["S2"]["is_open"] is True
+            assert registry.status_calls == {"S2": 1}
+            assert registry.volatile == set()
+        finally:
+            DeviceWinDoorSensor.deregister(device.sensor_id)
+
+    def test_assigning_hardware_marks_sensor_dirty(self):
+        registry, service = self._service()
+        service.collect_statuses()
+        sensor = registry.get_sensor("S2")
+        device = DeviceWinDoorSensor()
+        try:
+            device.arm()
+            device.intrude()
+            sensor.hardware = device
+
+            assert {s["id"]: s for s in service.collect_statuses()}["S2"]["is_open"] is True
+            sensor.hardware = None
+            device.release()
+            assert registry.take_dirty() == {"S2"}  # only the detach, not the old device
+        finally:
+            DeviceWinDoorSensor.deregister(device.sensor_id)
@@ -0,0 +1,67 @@
+"""
+Unit tests for pushed mode/alarm status events (subscribe_status_events).
+"""
+
+import pytest
+
+from src.configuration.storage_manager import StorageManager
+from src.core.system import System
+
+
+@pytest.fixture
+def system(tmp_path):
+    StorageManager._instance = None
+    sys_inst = System(str(tmp_path / "events.db"))
+    sys_inst.handle_request("control_panel", "turn_on")
+    yield sys_inst
+    sys_inst._storage.disconnect()
+
+
+@pytest.fixture
+def events(system):
+    received = []
+    result = system.handle_request("control_panel", "subscribe_status_events", callback=received.append)
+    assert result["success"] is True
+    received.append(("initial", result["data"]))
+    return received
+
+
+class TestStatusEvents:
+    def test_subscribe_returns_current_snapshot(self, events):
+        assert events == [
+            ("initial", {"state": "READY", "mode": "DISARMED", "armed": False, "alarm_active": False})
+        ]
+
+    def test_arm_and_disarm_are_pushed(self, system, events):
+        system.handle_request("control_panel", "arm_system", mode="AWAY")
+        system.handle_request("control_panel", "disarm_system")
+        assert [(e["mode"], e["armed"]) for e in events[1:]] == [("AWAY", True), ("DISARMED", False)]
+
+    def test_panic_and_clear_are_pushed(self, system, events):
+        system.handle_request("control_panel", "panic")
+        system.handle_request("control_panel", "clear_alarm")
+        assert [(e["state"], e["alarm_active"]) for e in events[1:]] == [
+            ("ALARM", True),
+            ("READY", False),
+        ]
+
+    def test_events_do_not_collect_device_status(self, system, events, monkeypatch):
+        def fail(*_args, **_kwargs):
+            raise AssertionError("device summaries collected")
+
+        monkeypatch.setattr(system.sensor_service, "collect_statuses", fail)
+        monkeypatch.setattr(system.camera_service, "camera_info", fail)
+        system.handle_request("control_panel", "arm_system", mode="HOME")
+        assert events[-1]["mode"] == "HOME"
+
+    def test_unsubscribe_stops_events(self, system, events):
+        callback = events.append
+        assert system.handle_request("control_panel", "unsubscribe_status_events", callback=callback)[
+            "success"
+        ]
+        system.handle_request("control_panel", "arm_system", mode="AWAY")
+        assert len(events) == 1
+
+    def test_callback_is_required(self, system):
+        result = system.handle_request("control_panel", "subscribe_status_events")
+        assert result == {"success": False, "message": "callback required"}
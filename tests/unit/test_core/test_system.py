@@ -480,6 +480,62 @@ class TestSystem:
             away_mode_sensors
         )
 
+    def test_state_commands_run_one_at_a_time(self, system):
+        """Mode/alarm/login requests from the Tk thread and dispatcher workers never overlap"""
+        import threading
+        import time
+
+        active, overlaps = [0], []
+
+        def slow(**_):
+            active[0] += 1
+            overlaps.append(active[0])
+            time.sleep(0.01)
+            active[0] -= 1
+            return {"success": True}
+
+        system._command_map["arm_system"] = slow
+        threads = [
+            threading.Thread(target=system.handle_request, args=("web", "arm_system"))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        system.handle_request("control_panel", "arm_system")
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == [1] * 5
+
+    def test_camera_and_log_commands_do_not_wait_for_state_commands(self, system):
+        """A slow state command does not hold up camera views or log queries"""
+        import threading
+
+        entered, release = threading.Event(), threading.Event()
+        released = []
+
+        def blocking(**_):
+            entered.set()
+            released.append(release.wait(2))  # False if it timed out
+            return {"success": True}
+
+        system._command_map["login_control_panel"] = blocking
+        worker = threading.Thread(
+            target=system.handle_request, args=("control_panel", "login_control_panel")
+        )
+        worker.start()
+        try:
+            assert entered.wait(5)
+            view = system.handle_request("web", "get_camera_view", camera_id=1)
+            logs = system.handle_request("web", "get_intrusion_log")
+        finally:
+            release.set()
+            worker.join()
+
+        assert released == [True]
+        assert view["success"] is True
+        assert logs["success"] is True
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
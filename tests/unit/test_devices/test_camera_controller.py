@@ -784,3 +784,131 @@ class TestCameraControllerIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestParallelRendering:
+    """Concurrent frame rendering across cameras."""
+
+    @staticmethod
+    def _camera(camera_id, render):
+        cam = Mock(spec=SafeHomeCamera)
+        cam.get_id = Mock(return_value=camera_id)
+        cam.is_enabled = Mock(return_value=True)
+        cam.display_view = Mock(side_effect=render)
+        cam.display_thumbnail = Mock(side_effect=lambda size: (camera_id, size))
+        return cam
+
+    def test_views_render_concurrently_without_controller_lock(self, camera_controller):
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+        held = []
+
+        def render():
+            # The controller stays usable while frames render
+            acquired = camera_controller._lock.acquire(timeout=1)
+            if acquired:
+                camera_controller._lock.release()
+            held.append(not acquired)
+            # Every render must be in flight at once for the barrier to pass
+            barrier.wait()
+            return "frame"
+
+        camera_controller.camera_list = [self._camera(i, render) for i in (1, 2, 3)]
+        views = camera_controller.display_thumbnail_view()
+        assert views == [(1, "frame"), (2, "frame"), (3, "frame")]
+        assert held == [False, False, False]
+
+    def test_iter_views_yields_in_completion_order(self, camera_controller):
+        import threading
+
+        slow_started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            slow_started.set()
+            release.wait(5)
+            return "slow"
+
+        def fast():
+            slow_started.wait(5)
+            return "fast"
+
+        camera_controller.camera_list = [self._camera(1, slow), self._camera(2, fast)]
+        results = camera_controller.iter_views()
+        assert next(results) == (2, "fast")
+        release.set()
+        assert next(results) == (1, "slow")
+
+    def test_iter_views_limits_cameras_and_renders_thumbnails(self, camera_controller):
+        cams = [self._camera(i, lambda: "frame") for i in (1, 2, 3)]
+        cams[2].is_enabled = Mock(return_value=False)
+        camera_controller.camera_list = cams
+        results = dict(camera_controller.iter_views([2, 3, 99], (40, 30)))
+        assert results == {2: (2, (40, 30))}
+
+    def test_failed_render_yields_none(self, camera_controller):
+        def broken():
+            raise RuntimeError("sensor glitch")
+
+        camera_controller.camera_list = [
+            self._camera(1, broken),
+            self._camera(2, lambda: "frame"),
+        ]
+        assert camera_controller.display_thumbnail_view() == [(1, None), (2, "frame")]
+
+
+class TestLockFreeQueries:
+    """Status queries never wait on cameras that are rendering."""
+
+    def test_registry_is_copy_on_write(self, camera_controller):
+        camera_controller.add_camera(10, 10)
+        before_list = camera_controller.camera_list
+        before_index = camera_controller._cameras
+        camera_id = camera_controller.add_camera(20, 20)
+        assert len(before_list) == 1 and len(before_index) == 1
+        camera_controller.delete_camera(camera_id)
+        assert camera_id not in camera_controller._cameras
+        assert len(camera_controller.camera_list) == 1
+
+    def test_info_is_served_while_a_camera_is_busy(self, camera_controller):
+        import threading
+
+        camera_id = camera_controller.add_camera(100, 200)
+        camera = camera_controller.get_camera_by_id(camera_id)
+        camera.enable()
+        result = []
+
+        # Hold both the controller and the camera lock as a slow mutation would
+        with camera_controller._lock, camera._lock:
+            worker = threading.Thread(
+                target=lambda: result.append(camera_controller.get_all_camera_info())
+            )
+            worker.start()
+            worker.join(timeout=2)
+            assert not worker.is_alive()
+
+        assert result[0] == [
+            {
+                "id": camera_id,
+                "location": [100, 200],
+                "enabled": True,
+                "pan": 0,
+                "zoom": 2,
+                "has_password": False,
+            }
+        ]
+
+    def test_snapshots_are_immutable_and_republished_on_change(self, camera_controller):
+        import dataclasses
+
+        camera = camera_controller.get_camera_by_id(camera_controller.add_camera(5, 5))
+        camera.enable()
+        before = camera.info()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            before.zoom = 5
+        camera.zoom_in()
+        camera.set_password("1234")
+        (after,) = camera_controller.get_camera_snapshots()
+        assert (before.zoom, before.has_password) == (2, False)
+        assert (after.zoom, after.has_password) == (3, True)
@@ -0,0 +1,172 @@
+"""
+test_device_sensor_tester.py
+Unit tests for the virtual sensor tester registries and status rows
+"""
+
+import pytest
+
+from src.devices.custom_window_door_sensor import CustomWinDoorSensor
+from src.virtual_devices.device_motion_detector import DeviceMotionDetector
+from src.virtual_devices.device_sensor_tester import DeviceSensorTester
+from src.virtual_devices.device_windoor_sensor import DeviceWinDoorSensor
+from src.virtual_devices.sensor_status_list import SensorStatusList
+
+
+@pytest.fixture(autouse=True)
+def clean_tester_state(monkeypatch):
+    """Isolate the class-level lists/registries shared by all virtual sensors."""
+    for attr in (
+        "head_WinDoorSensor",
+        "head_windoor_sensor",
+        "head_MotionDetector",
+        "head_motion_detector",
+        "safeHomeSensorTest",
+        "safehome_sensor_test",
+        "gui_factory",
+    ):
+        monkeypatch.setattr(DeviceSensorTester, attr, None)
+    monkeypatch.setattr(DeviceSensorTester, "newIdSequence_WinDoorSensor", 0)
+    monkeypatch.setattr(DeviceSensorTester, "newIdSequence_MotionDetector", 0)
+    monkeypatch.setattr(DeviceSensorTester, "windoor_sensors", {})
+    monkeypatch.setattr(DeviceSensorTester, "motion_detectors", {})
+
+
+def _walk(head):
+    ids = []
+    while head is not None:
+        ids.append(head.sensor_id)
+        head = head.next
+    return ids
+
+
+class TestDeviceSensorTesterRegistry:
+    def test_find_uses_id_registry_per_kind(self):
+        door = DeviceWinDoorSensor()
+        motion = DeviceMotionDetector()
+
+        assert DeviceWinDoorSensor.find(1) is door
+        assert DeviceMotionDetector.find(1) is motion
+        assert DeviceWinDoorSensor.find(2) is None
+        assert _walk(DeviceSensorTester.head_WinDoorSensor) == [1]
+
+    def test_bulk_intrude_and_release(self):
+        sensors = [DeviceWinDoorSensor() for _ in range(3)]
+
+        missing = DeviceWinDoorSensor.intrude_many([1, 3, 9])
+        assert missing == [9]
+        assert [s.opened for s in sensors] == [True, False, True]
+
+        assert DeviceWinDoorSensor.release_many({1, 3}) == []
+        assert not any(s.opened for s in sensors)
+
+    def test_deregister_unlinks_head_middle_and_tail(self):
+        for _ in range(4):
+            DeviceMotionDetector()
+        assert _walk(DeviceSensorTester.head_MotionDetector) == [4, 3, 2, 1]
+
+        assert DeviceMotionDetector.deregister(3) is True  # middle
+        assert DeviceMotionDetector.deregister(4) is True  # head
+        assert DeviceMotionDetector.deregister(1) is True  # tail
+        assert DeviceMotionDetector.deregister(1) is False
+
+        head = DeviceSensorTester.head_MotionDetector
+        assert _walk(head) == [2]
+        assert DeviceSensorTester.head_motion_detector is head
+        assert head.next_sensor is None and head.prev is None
+        assert list(DeviceSensorTester.motion_detectors) == [2]
+
+    def test_deregister_all(self):
+        DeviceWinDoorSensor()
+        DeviceWinDoorSensor()
+
+        DeviceWinDoorSensor.deregister_all()
+
+        assert DeviceSensorTester.head_WinDoorSensor is None
+        assert DeviceSensorTester.windoor_sensors == {}
+
+    def test_renumbered_sensor_is_rekeyed(self):
+        custom = CustomWinDoorSensor("Front", sensor_id=42)
+
+        assert DeviceWinDoorSensor.find(42) is custom
+        assert DeviceWinDoorSensor.find(1) is None
+
+
+class TestSensorChangeNotifications:
+    @pytest.fixture
+    def events(self, monkeypatch):
+        monkeypatch.setattr(DeviceSensorTester, "_change_listeners", [])
+        received = []
+        DeviceSensorTester.subscribe(lambda sensor, structural: received.append((sensor.sensor_id, structural)))
+        return received
+
+    def test_state_and_membership_changes_are_published(self, events):
+        door = DeviceWinDoorSensor()
+        door.arm()
+        door.intrude()
+        DeviceWinDoorSensor.deregister(1)
+
+        assert events == [(1, True), (1, False), (1, False), (1, True)]
+
+
+class TestSensorStatusList:
+    def _model(self):
+        return SensorStatusList(
+            lambda: DeviceSensorTester.head_WinDoorSensor,
+            lambda s: f"{s.sensor_id}:{'open' if s.opened else 'closed'}",
+        )
+
+    def test_first_sync_rebuilds_in_list_order(self):
+        DeviceWinDoorSensor()
+        DeviceWinDoorSensor()
+        model = self._model()
+
+        assert model.sync() == (True, [0, 1])
+        assert model.rows == ["2:closed", "1:closed"]
+
+    def test_only_changed_rows_are_reported(self):
+        first = DeviceWinDoorSensor()
+        second = DeviceWinDoorSensor()
+        model = self._model()
+        model.sync()
+
+        assert model.sync() == (False, [])
+
+        first.intrude()
+        model.mark_dirty(first)
+        model.mark_dirty(second)  # dirty but rendered text is unchanged
+        assert model.sync() == (False, [1])
+        assert model.rows == ["2:closed", "1:open"]
+
+    def test_stale_model_rebuilds(self):
+        DeviceWinDoorSensor()
+        model = self._model()
+        model.sync()
+
+        DeviceWinDoorSensor.deregister(1)
+        model.mark_stale()
+
+        assert model.sync() == (True, [])
+        assert model.rows == []
+
+
+class TestSensorTesterWindow:
+    def test_headless_show_is_a_no_op(self):
+        DeviceSensorTester.showSensorTester()
+        assert DeviceSensorTester.safeHomeSensorTest is None
+
+    def test_installed_factory_opens_the_window_once(self):
+        opened = []
+        DeviceSensorTester.gui_factory = lambda: opened.append("gui") or "gui"
+        DeviceSensorTester.showSensorTester()
+        DeviceSensorTester.showSensorTester()
+        assert opened == ["gui"]
+        assert DeviceSensorTester.safehome_sensor_test == "gui"
+
+    def test_failing_factory_is_reported(self, capsys):
+        def no_display():
+            raise RuntimeError("no display name")
+
+        DeviceSensorTester.gui_factory = no_display
+        DeviceSensorTester.showSensorTester()
+        assert DeviceSensorTester.safeHomeSensorTest is None
+        assert "sensor tester unavailable: no display name" in capsys.readouterr().out
@@ -86,6 +86,16 @@ def test_display_view_returns_frame_when_enabled(camera: SafeHomeCamera) -> None
     assert camera.display_view() == "frame-5" if camera.get_id() == 5 else "frame-1"
 
 
+def test_display_thumbnail_requires_enabled(camera: SafeHomeCamera) -> None:
+    with pytest.raises(CameraDisabledError):
+        camera.display_thumbnail((200, 150))
+
+
+def test_display_thumbnail_falls_back_to_view(camera: SafeHomeCamera) -> None:
+    camera.enable()
+    assert camera.display_thumbnail((200, 150)) == "frame-1"
+
+
 def test_zoom_increases_level_when_enabled(camera: SafeHomeCamera) -> None:
     camera.enable()
     assert camera.zoom_level == 2
@@ -203,22 +213,15 @@ def test_cleanup_and_repr(camera: SafeHomeCamera, monkeypatch) -> None:
     assert f"id={camera.get_id()}" in description
 
 
-def test_temporary_asset_directory(monkeypatch, camera: SafeHomeCamera) -> None:
-    calls: list[Path] = []
-
-    def fake_chdir(path: Path) -> None:
-        calls.append(Path(path))
+def test_initialize_device_leaves_cwd_alone(monkeypatch, camera: SafeHomeCamera) -> None:
+    def fail_chdir(path) -> None:
+        raise AssertionError("camera setup must not change the working directory")
 
-    monkeypatch.setattr(camera_base.os, "chdir", fake_chdir)
-    original = Path("/tmp/original")
-    monkeypatch.setattr(
-        camera_base.Path,
-        "cwd",
-        classmethod(lambda cls: original),
-    )
-    with camera._temporary_asset_directory():
-        assert calls[-1] == camera._asset_dir
-    assert calls[-1] == original
+    monkeypatch.setattr("os.chdir", fail_chdir)
+    camera._device.asset_dir = None
+    camera._initialize_device(3)
+    assert camera._device.current_id == 3
+    assert camera._device.asset_dir == camera._asset_dir
 
 
 def test_initialize_device_invokes_set_id(camera: SafeHomeCamera, monkeypatch) -> None:
@@ -0,0 +1,207 @@
+"""
+test_virtual_device_camera.py
+Unit tests for frame caching in the virtual DeviceCamera
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.virtual_devices import camera_clock, device_errors
+from src.virtual_devices.camera_clock import VirtualClock
+from src.virtual_devices.device_camera import DeviceCamera
+
+ASSET_DIR = Path(__file__).resolve().parents[3] / "src" / "resources" / "images"
+
+
+@pytest.fixture
+def clock():
+    return VirtualClock()
+
+
+@pytest.fixture
+def camera(clock):
+    """Virtual camera 1 on a virtual clock, so ``time`` only moves on demand."""
+    cam = DeviceCamera(clock=clock)
+    cam.set_id(1)
+    return cam
+
+
+class TestSharedClock:
+    def test_time_follows_clock(self, camera, clock):
+        assert camera.time == 0
+        clock.advance(0.5)
+        assert camera.time == 0
+        assert camera.next_tick_in() == pytest.approx(0.5)
+        clock.advance(0.5)
+        assert camera.time == 1
+        clock.advance(DeviceCamera.TIME_WRAP)
+        assert camera.time == 1
+
+    def test_time_setter_and_tick_shift_counter(self, camera, clock):
+        camera.time = 42
+        clock.advance(2)
+        assert camera.time == 44
+        camera._tick()
+        assert camera.time == 45
+
+    def test_cameras_created_apart_tick_together(self, clock):
+        first = DeviceCamera(clock=clock)
+        clock.advance(0.4)
+        second = DeviceCamera(clock=clock)
+        clock.advance(0.6)
+        assert (first.time, second.time) == (1, 1)
+
+    def test_cameras_do_not_start_threads(self, clock):
+        import threading
+
+        before = threading.active_count()
+        cameras = [DeviceCamera(clock=clock) for _ in range(16)]
+        assert threading.active_count() == before
+        assert len(cameras) == 16
+
+    def test_set_clock_installs_default(self, clock):
+        previous = camera_clock.set_clock(clock)
+        try:
+            assert DeviceCamera()._clock is clock
+        finally:
+            camera_clock.set_clock(previous)
+
+
+class TestRenderedFrameCache:
+    def test_repeated_views_share_one_frame(self, camera):
+        first = camera.get_view()
+        assert camera.get_view() is first
+        assert first.size == (DeviceCamera.RETURN_SIZE, DeviceCamera.RETURN_SIZE)
+
+    def test_tick_redraws_overlay_without_new_crop(self, camera, monkeypatch):
+        first = camera.get_view()
+        calls = []
+        original = DeviceCamera._render_crop
+        monkeypatch.setattr(
+            DeviceCamera,
+            "_render_crop",
+            lambda self, *key: calls.append(key) or original(self, *key),
+        )
+        camera._tick()
+        second = camera.get_view()
+        assert second is not first
+        assert calls == []
+        # Only the overlay strip at the top differs
+        assert first.crop((0, 40, 500, 500)).tobytes() == second.crop((0, 40, 500, 500)).tobytes()
+        assert first.crop((0, 0, 500, 20)).tobytes() != second.crop((0, 0, 500, 20)).tobytes()
+
+    def test_returning_to_cached_position_reuses_crop(self, camera, monkeypatch):
+        camera.get_view()
+        camera.pan_right()
+        camera.get_view()
+        calls = []
+        original = DeviceCamera._render_crop
+        monkeypatch.setattr(
+            DeviceCamera,
+            "_render_crop",
+            lambda self, *key: calls.append(key) or original(self, *key),
+        )
+        camera.pan_left()
+        camera.get_view()
+        assert calls == []
+
+    def test_cached_frame_matches_uncached_render(self, camera):
+        camera.zoom_in()
+        camera.set_tilt(-2)
+        cached = camera.get_view()
+        expected = camera._render_crop(camera.pan, camera.tilt, camera.zoom)
+        camera._draw_overlay(expected, camera._overlay_text())
+        assert cached.tobytes() == expected.tobytes()
+
+    def test_crop_cache_is_bounded(self, camera, monkeypatch):
+        monkeypatch.setattr(DeviceCamera, "CROP_CACHE_SIZE", 3)
+        for _ in range(5):
+            camera.pan_right()
+            camera.get_view()
+        assert len(camera._crops) == 3
+        assert list(camera._crops)[-1] == (5, 0, 2, (500, 500))
+
+    def test_set_id_invalidates_cache(self, camera):
+        first = camera.get_view()
+        camera.set_id(2)
+        assert not camera._crops
+        second = camera.get_view()
+        assert second is not first
+        assert second.tobytes() != first.tobytes()
+
+
+class TestSharedImageAssets:
+    def test_cameras_share_decoded_source(self, clock):
+        first, second = DeviceCamera(clock=clock), DeviceCamera(clock=clock)
+        first.set_id(2)
+        second.set_id(2)
+        first.get_view()
+        second.get_view()
+        assert first.imgSource is second.imgSource
+        assert first._pyramid is second._pyramid
+        assert first.source_path == (ASSET_DIR / "camera2.jpg").resolve()
+
+    def test_source_decoded_lazily_and_cwd_untouched(self, camera, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        camera.set_id(3)
+        assert camera.imgSource is None
+        camera.get_view()
+        assert camera.imgSource is not None
+        assert camera.centerWidth == camera.imgSource.width // 2
+
+    def test_missing_image_renders_black(self, camera, capsys):
+        camera.set_id(99)
+        assert "camera99.jpg file open error" in capsys.readouterr().out
+        assert camera.get_view().getpixel((250, 250)) == (0, 0, 0)
+
+    def test_missing_image_goes_to_installed_reporter(self, camera, capsys):
+        reported = []
+        previous = device_errors.set_reporter(lambda title, message: reported.append((title, message)))
+        try:
+            camera.set_id(98)
+        finally:
+            device_errors.set_reporter(previous)
+        assert reported == [("File Error", "camera98.jpg file open error")]
+        assert capsys.readouterr().out == ""
+
+    def test_undecodable_image_goes_to_installed_reporter(self, camera, tmp_path):
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not a jpeg")
+        camera.source_path = broken
+        camera._source_pending = True
+        reported = []
+        previous = device_errors.set_reporter(lambda title, message: reported.append((title, message)))
+        try:
+            camera.get_view()
+        finally:
+            device_errors.set_reporter(previous)
+        assert [title for title, _ in reported] == ["File Error"]
+        assert "broken.jpg could not be decoded" in reported[0][1]
+        assert camera.imgSource is None
+
+
+class TestThumbnailRendering:
+    def test_thumbnail_rendered_at_requested_size(self, camera):
+        thumbnail = camera.get_thumbnail((200, 150))
+        assert thumbnail.size == (200, 150)
+        assert camera.get_thumbnail([200, 150]) is thumbnail
+
+    def test_thumbnail_ignores_clock_ticks(self, camera):
+        thumbnail = camera.get_thumbnail((64, 48))
+        camera._tick()
+        assert camera.get_thumbnail((64, 48)) is thumbnail
+        camera.zoom_in()
+        assert camera.get_thumbnail((64, 48)) is not thumbnail
+
+    def test_small_thumbnails_use_downscaled_source(self, camera):
+        camera.get_thumbnail((40, 30))
+        scale, level = camera._pyramid_level(320, (40, 30))
+        assert scale < 1.0 and level.width < camera.imgSource.width
+        assert camera._pyramid_level(320, (500, 500)) == (1.0, camera.imgSource)
+
+    def test_thumbnail_close_to_downscaled_view(self, camera):
+        thumbnail = camera.get_thumbnail((50, 50))
+        reference = camera._render_crop(camera.pan, camera.tilt, camera.zoom).resize((50, 50))
+        diff = sum(abs(a - b) for a, b in zip(thumbnail.tobytes(), reference.tobytes()))
+        assert diff / len(reference.tobytes()) < 12
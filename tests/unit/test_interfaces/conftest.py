@@ -1,6 +1,7 @@
 """Pytest fixtures for interface tests - uses real System class"""
 import os
 import sys
+import time
 
 import pytest
 
@@ -12,6 +13,29 @@ from src.configuration.storage_manager import StorageManager
 from src.core.system import System
 
 
+class FakeWidget:
+    """Collects ``after`` callbacks so the test plays the Tk event loop."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def run_pending(self, timeout=2.0):
+        """Run scheduled polls until nothing is rescheduled."""
+        deadline = time.monotonic() + timeout
+        while self.scheduled and time.monotonic() < deadline:
+            func = self.scheduled.pop(0)
+            time.sleep(0.001)
+            func()
+
+
+@pytest.fixture
+def widget():
+    return FakeWidget()
+
+
 @pytest.fixture
 def system(tmp_path):
     """Create a fresh System with an isolated database for each test."""
@@ -15,11 +15,11 @@ class PanelStub:
         self.not_ready_states = []
         self.restored_states = []
 
-    def send_request(self, action):
+    def send_request_async(self, action, callback=None):
         self.sent_requests.append(action)
-        if callable(self.next_response):
-            return self.next_response()
-        return self.next_response
+        response = self.next_response() if callable(self.next_response) else self.next_response
+        if callback is not None:
+            callback(response)
 
     def after(self, delay, callback):
         self.after_calls.append((delay, callback))
@@ -94,6 +94,16 @@ def test_poll_noop_when_panel_off():
     assert panel.after_calls == []
 
 
+def test_status_arriving_after_panel_turned_off_is_ignored():
+    handler, panel = _make_handler()
+    panel.is_off = True
+
+    handler._on_alarm_status({"success": True, "data": {"alarm_active": True}})
+
+    assert handler.is_active is False
+    assert panel.after_calls == []
+
+
 def test_poll_clears_alarm_when_condition_resolves():
     handler, panel = _make_handler()
     handler._alarm_active = True
@@ -0,0 +1,154 @@
+"""
+Unit tests for off-main-thread request dispatch (AsyncDispatcher).
+"""
+import threading
+import time
+from unittest.mock import Mock
+
+from src.interfaces.async_dispatcher import AsyncDispatcher
+
+
+class TestAsyncDispatcher:
+    def test_request_runs_on_worker_and_result_returns_on_caller_thread(self, widget):
+        handled_on, delivered_on = [], []
+
+        def handle(command, **kwargs):
+            handled_on.append(threading.current_thread())
+            return {"success": True, "command": command, **kwargs}
+
+        dispatcher = AsyncDispatcher(handle, widget)
+        future = dispatcher.submit(
+            "get_status",
+            lambda result: delivered_on.append((threading.current_thread(), result)),
+            verbose=True,
+        )
+        assert dispatcher.pending == 1
+        widget.run_pending()
+
+        assert future.result(timeout=0) == {"success": True, "command": "get_status", "verbose": True}
+        assert handled_on[0] is not threading.current_thread()
+        assert delivered_on == [(threading.current_thread(), future.result())]
+        assert dispatcher.pending == 0
+        assert widget.scheduled == []  # polling stops once idle
+        dispatcher.shutdown()
+
+    def test_slow_request_does_not_block_submit(self, widget):
+        release = threading.Event()
+        dispatcher = AsyncDispatcher(lambda command: release.wait(2) and {"success": True}, widget)
+        start = time.monotonic()
+        future = dispatcher.submit("save_settings")
+        assert time.monotonic() - start < 0.5
+        assert dispatcher.drain() == 0 and not future.done()
+        release.set()
+        widget.run_pending()
+        assert future.result(timeout=0) == {"success": True}
+        dispatcher.shutdown()
+
+    def test_results_keep_submission_order(self, widget):
+        order = []
+        dispatcher = AsyncDispatcher(lambda command, n: {"n": n}, widget)
+        for n in range(20):
+            dispatcher.submit("step", lambda result: order.append(result["n"]), n=n)
+        widget.run_pending()
+        assert order == list(range(20))
+        dispatcher.shutdown()
+
+    def test_handler_errors_become_failed_results(self, widget):
+        def handle(command):
+            raise RuntimeError("database is locked")
+
+        dispatcher = AsyncDispatcher(handle, widget)
+        future = dispatcher.submit("arm_system")
+        widget.run_pending()
+        assert future.result(timeout=0) == {
+            "success": False,
+            "message": "Request failed: database is locked",
+        }
+        dispatcher.shutdown()
+
+    def test_failing_callback_does_not_stop_delivery(self, widget, capsys):
+        seen = []
+        dispatcher = AsyncDispatcher(lambda command: {"success": True}, widget)
+        dispatcher.submit("a", lambda result: 1 / 0)
+        dispatcher.submit("b", seen.append)
+        widget.run_pending()
+        assert seen == [{"success": True}]
+        assert "Callback failed" in capsys.readouterr().out
+        dispatcher.shutdown()
+
+    def test_closed_dispatcher_answers_immediately(self, widget):
+        dispatcher = AsyncDispatcher(lambda command: {"success": True}, widget)
+        dispatcher.shutdown()
+        future = dispatcher.submit("get_status")
+        assert future.result(timeout=0)["success"] is False
+        assert widget.scheduled == []
+
+    def test_posted_calls_wake_the_tk_thread_once_per_batch(self, widget):
+        ran_on = []
+        dispatcher = AsyncDispatcher(lambda command: {"success": True}, widget)
+        assert widget.scheduled == []  # nothing polls while idle
+
+        def post_twice():
+            for _ in range(2):
+                dispatcher.post(lambda: ran_on.append(threading.current_thread()))
+
+        worker = threading.Thread(target=post_twice)
+        worker.start()
+        worker.join()
+        assert ran_on == []
+        assert len(widget.scheduled) == 1
+
+        widget.run_pending()
+        assert ran_on == [threading.current_thread()] * 2
+        assert widget.scheduled == []
+
+        dispatcher.post(lambda: ran_on.append("again"))
+        widget.run_pending()
+        assert ran_on[-1] == "again"
+        dispatcher.shutdown()
+
+    def test_post_without_a_running_tk_keeps_the_call_queued(self, widget):
+        ran = []
+        widget.after = Mock(side_effect=RuntimeError("main thread is not in main loop"))
+        dispatcher = AsyncDispatcher(lambda command: {"success": True}, widget)
+        dispatcher.post(lambda: ran.append(1))
+        dispatcher.post(lambda: ran.append(2))
+        assert widget.after.call_count == 2  # each post retries the wake-up
+        dispatcher.drain()
+        assert ran == [1, 2]
+        dispatcher.shutdown()
+
+
+class TestInterfaceAsyncRequests:
+    def test_web_interface_send_message_async_reaches_system(self, web_interface, widget):
+        web_interface._dispatcher = AsyncDispatcher(web_interface.send_message, widget)
+        results = []
+        web_interface.send_message_async("arm_system", results.append, mode="AWAY")
+        status = web_interface.send_message_async("get_status")
+        widget.run_pending()
+        assert results[0]["success"] is True
+        assert status.result(timeout=0)["data"]["armed"] is True
+        web_interface._dispatcher.shutdown()
+
+    def test_page_delegates_to_web_interface(self):
+        from unittest.mock import Mock
+
+        from src.interfaces.components.page import Page
+
+        class DummyPage(Page):
+            def _build_ui(self):
+                pass
+
+        web = Mock()
+        page = DummyPage(Mock(), web)
+        callback = Mock()
+        page.send_message_async("get_status", callback, verbose=True)
+        web.send_message_async.assert_called_once_with("get_status", callback, verbose=True)
+
+    def test_control_panel_send_request_async(self, control_panel_ready, widget):
+        cp = control_panel_ready
+        cp._dispatcher = AsyncDispatcher(cp.send_request, widget)
+        future = cp.send_request_async("get_status")
+        widget.run_pending()
+        assert future.result(timeout=0)["success"] is True
+        cp._dispatcher.shutdown()
@@ -79,3 +79,343 @@ class TestFloorPlan:
         floor_plan.set_armed('S1', False)
         assert floor_plan._states.get('S1') == False
 
+
+
+class FakeCanvas:
+    """Records canvas calls; item ids are handed out like Tk does."""
+
+    def __init__(self):
+        self.created = 0
+        self.deleted = []
+        self.configured = []
+
+    def _create(self, *args, **kwargs):
+        self.created += 1
+        return self.created
+
+    create_oval = create_text = create_rectangle = create_image = _create
+
+    def tag_bind(self, *args, **kwargs):
+        pass
+
+    def delete(self, item):
+        self.deleted.append(item)
+
+    def itemconfigure(self, item, **options):
+        self.configured.append((item, options))
+
+    def tag_lower(self, *args):
+        pass
+
+    def configure(self, **options):
+        pass
+
+    def xview_moveto(self, fraction):
+        pass
+
+    yview_moveto = xview_moveto
+
+
+class TestFloorPlanIncrementalUpdates:
+    """Refreshing restyles existing items instead of redrawing the plan."""
+
+    @pytest.fixture
+    def drawn_plan(self):
+        from src.interfaces.components.floor_plan import FloorPlan
+
+        plan = FloorPlan(Mock(), width=400, height=300)
+        plan._canvas = FakeCanvas()
+        plan._draw()
+        return plan
+
+    def test_state_change_only_reconfigures_changed_icons(self, drawn_plan):
+        canvas = drawn_plan._canvas
+        created = canvas.created
+        drawn_plan.set_states({"S1": True, "S2": False})
+        drawn_plan.refresh()
+        assert canvas.created == created
+        assert canvas.deleted == ["all"]
+        assert [options["outline"] for _, options in canvas.configured] == ["#27ae60"]
+
+    def test_batched_states_repaint_once(self, drawn_plan):
+        calls = []
+        layer = drawn_plan._device_layer
+        original = layer.update
+        layer.update = lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs)
+        drawn_plan.set_states({sensor: True for sensor in drawn_plan.get_sensors()})
+        assert len(calls) == 1
+        assert len(drawn_plan._canvas.configured) == len(drawn_plan.get_sensors())
+
+    def test_selection_restyles_icon(self, drawn_plan):
+        drawn_plan.set_selected(["M1"])
+        drawn_plan.clear_selection()
+        outlines = [options["outline"] for _, options in drawn_plan._canvas.configured]
+        assert outlines == ["#f39c12", "#333"]
+
+    def test_background_is_decoded_once_per_process(self, drawn_plan):
+        from src.interfaces.components.rendering.image_loader import find_floorplan_image
+        from src.resources.image_cache import get_image_cache
+
+        assert find_floorplan_image() in get_image_cache()
+        drawn_plan.redraw()
+        assert drawn_plan._canvas.deleted == ["all", "all"]
+
+
+class TestFloorPlanSpatialQueries:
+    """Selection, picking and culling go through the device index."""
+
+    @pytest.fixture
+    def plan(self):
+        from src.interfaces.components.floor_plan import FloorPlan
+
+        devices = {
+            f"S{i}": ((i % 10) / 10 + 0.05, (i // 10) / 10 + 0.05, "sensor")
+            for i in range(100)
+        }
+        devices["C1"] = (0.05, 0.05, "camera")
+        plan = FloorPlan(Mock(), width=400, height=300, devices=devices)
+        plan._canvas = FakeCanvas()
+        plan._select_mode = True
+        return plan
+
+    def test_box_selection_picks_only_sensors_inside(self, plan):
+        plan._draw()
+        plan._select_sensors_in_box(0, 0, 100, 45)
+        assert sorted(plan.get_selected()) == ["S0", "S1"]
+
+    def test_device_at_hits_nearest_icon(self, plan):
+        plan._draw()
+        x, y, _ = plan._device_positions["S55"]
+        assert plan.device_at(x + 3, y - 2) == "S55"
+        assert plan.device_at(x + 30, y + 18) is None
+
+    def test_viewport_culls_offscreen_devices(self, plan):
+        plan.set_viewport((0, 0, 130, 80))
+        plan._draw()
+        layer = plan._device_layer
+        assert sorted(layer.visible) == ["C1", "S0", "S1", "S10", "S11"]
+        assert len(plan._device_positions) == 101
+
+        created = plan._canvas.created
+        plan.set_viewport((0, 0, 100, 45))
+        assert sorted(layer.visible) == ["C1", "S0", "S1"]
+        assert "d_S11" in plan._canvas.deleted
+        plan.set_viewport(None)
+        assert len(layer.visible) == 101
+        assert plan._canvas.created == created + 2 * 98
+
+
+class TestFloorPlanCatalog:
+    """Device positions are derived from the system defaults."""
+
+    def test_default_catalog_places_every_configured_device(self):
+        from src.core.system_defaults import CAMERAS, SENSORS
+        from src.interfaces.components.floor_plan_catalog import default_device_catalog
+
+        catalog = default_device_catalog()
+        assert set(catalog) == {s["id"] for s in SENSORS} | {c["id"] for c in CAMERAS}
+        assert catalog["S1"][2] == "sensor"
+        assert catalog["S2_blue"][2] == "door_sensor"
+        assert catalog["M2"][2] == "motion"
+        # floorplan.png pixels and camera 0-1000 units both map to fractions
+        assert catalog["S6"][:2] == pytest.approx((0.950, 0.691), abs=0.002)
+        assert catalog["C2"][:2] == pytest.approx((0.438, 0.609))
+
+    def test_floors_group_devices_by_floor_entry(self):
+        from src.interfaces.components.floor_plan_catalog import floors_from_config
+
+        floors = floors_from_config(
+            [
+                {"id": "S1", "type": "WINDOW"},
+                {"id": "S2", "type": "DOOR", "floor": "2F"},
+                {"id": "S3", "type": "WINDOW"},
+            ],
+            [{"id": "C1", "x": 500, "y": 250, "floor": "2F"}],
+            {"S1": (0, 0), "S2": (607, 373)},
+        )
+        assert [floor.name for floor in floors] == ["1F", "2F"]
+        assert floors[0].devices == {"S1": (0.0, 0.0, "sensor")}
+        assert floors[1].devices == {
+            "S2": (1.0, 1.0, "door_sensor"),
+            "C1": (0.5, 0.25, "camera"),
+        }
+
+
+class TestFloorPlanZoomAndFloors:
+    """Floors, pan/zoom and level-of-detail rendering."""
+
+    @pytest.fixture
+    def floors(self):
+        from src.interfaces.components.floor_plan_catalog import FloorSpec
+
+        dense = {
+            f"S{i}": ((i % 50) / 50 + 0.01, (i // 50) / 20 + 0.01, "sensor")
+            for i in range(1000)
+        }
+        return [
+            FloorSpec("1F", {"S1": (0.5, 0.5, "sensor"), "C1": (0.1, 0.1, "camera")}),
+            FloorSpec("Warehouse", dense, size=(4000, 2000)),
+        ]
+
+    @pytest.fixture
+    def plan(self, floors):
+        from src.interfaces.components.floor_plan import FloorPlan
+
+        plan = FloorPlan(Mock(), width=400, height=300, floors=floors)
+        plan._canvas = FakeCanvas()
+        plan._draw()
+        return plan
+
+    def test_set_floor_switches_devices(self, plan):
+        assert plan.floors == ["1F", "Warehouse"]
+        assert sorted(plan.get_devices()) == ["C1", "S1"]
+        assert plan.set_floor("Warehouse") is True
+        assert plan.floor == "Warehouse"
+        assert len(plan.get_sensors()) == 1000
+        assert plan.set_floor("Basement") is False
+        assert plan.floor == "Warehouse"
+
+    def test_zoom_scales_positions_around_anchor(self, plan):
+        x, y, _ = plan._device_positions["S1"]
+        plan.set_zoom(2.0, 0, 0)
+        assert plan.zoom == 2.0
+        assert plan._device_positions["S1"][:2] == pytest.approx((2 * x, 2 * y), abs=1)
+        plan.set_zoom(100)
+        assert plan.zoom == plan.MAX_ZOOM
+
+    def test_labels_are_dropped_when_zoomed_out(self, plan):
+        created = plan._canvas.created
+        plan.set_zoom(0.5)
+        # Room outline fallback draws 7 items, each icon one oval without label
+        assert plan._canvas.created - created == 7 + 2
+
+    def test_zoomed_out_dense_floor_draws_clusters(self, plan):
+        plan.set_floor("Warehouse")
+        layer = plan._device_layer
+        assert plan.zoom == pytest.approx(607 / 4000)  # fitted to the view
+        assert layer.visible == ()
+        assert sum(len(members) for members in layer.clusters.values()) == 1000
+        assert len(layer.clusters) < 100
+
+        plan.set_states({"S0": True})
+        plan.set_selected(["S1"])
+        outlines = [options["outline"] for _, options in plan._canvas.configured]
+        assert outlines == ["#f39c12"]
+
+    def test_zooming_into_a_cluster_shows_icons_in_view(self, plan):
+        plan.set_floor("Warehouse")
+        (cell, members), *_ = plan._device_layer.clusters.items()
+        x, y, _ = plan._device_layer.index.position(members[0])
+        plan._zoom_to_cluster(x, y)
+        plan.set_zoom(1.0)
+        layer = plan._device_layer
+        assert layer.clusters == {}
+        assert 0 < len(layer.visible) <= layer.MAX_ICONS
+        assert all(
+            plan.view[0] <= layer.index.position(d)[0] <= plan.view[2] for d in layer.visible
+        )
+
+    def test_pan_moves_viewport_and_clamps_to_plan(self, plan):
+        plan.set_floor("Warehouse")
+        plan.set_zoom(2.0, 0, 0)
+        plan.pan(500, 200)
+        assert plan.view[:2] == (500, 200)
+        plan.pan(-10000, 100000)
+        width, height = plan._view_size
+        assert plan.view == (0, 4000 - height, width, 4000)
+
+
+class TestTilePyramid:
+    """Backgrounds are cut into tiles lazily and only visible tiles are drawn."""
+
+    @pytest.fixture
+    def pyramid(self, tmp_path):
+        from PIL import Image
+
+        from src.interfaces.components.floor_plan_tiles import TilePyramid
+
+        path = tmp_path / "plan.png"
+        Image.new("RGB", (1000, 600), "white").save(path)
+        return TilePyramid((1000, 600), image=path, max_tiles=4)
+
+    def test_levels_halve_resolution_until_one_tile(self, pyramid):
+        assert pyramid.levels == 3
+        assert pyramid.level_for(2.0) == 0
+        assert pyramid.level_for(0.5) == 1
+        assert pyramid.level_for(0.3) == 1
+        assert pyramid.level_for(0.01) == 2
+
+    def test_tiles_in_covers_only_the_view(self, pyramid):
+        keys = [key for key, _ in pyramid.tiles_in((0, 0, 300, 200), 1.0)]
+        assert keys == [(0, 0, 0), (0, 1, 0)]
+        (key, box), = pyramid.tiles_in((0, 0, 400, 400), 0.25)
+        assert key == (2, 0, 0) and box == (0, 0, 1000, 600)
+        assert pyramid.tiles_in((5000, 0, 6000, 100), 1.0) == []
+
+    def test_tiles_are_loaded_once_and_evicted_lru(self, pyramid):
+        assert pyramid.tile((0, 3, 2)).size == (232, 88)
+        assert pyramid.tile((1, 0, 0)).size == (256, 256)
+        pyramid.tile((0, 3, 2))
+        assert pyramid.loads == 2
+        for col in range(4):
+            pyramid.tile((0, col, 0))
+        assert len(pyramid) == 4
+        pyramid.tile((0, 3, 2))
+        assert pyramid.loads == 7
+
+    def test_missing_pre_cut_tile_is_none(self, tmp_path):
+        from src.interfaces.components.floor_plan_tiles import TilePyramid
+
+        pyramid = TilePyramid((512, 512), template=str(tmp_path / "{level}" / "{col}_{row}.png"))
+        assert pyramid.tile((0, 0, 0)) is None
+
+    def test_background_layer_swaps_tiles_as_view_pans(self, pyramid, monkeypatch):
+        from src.interfaces.components import floor_plan_tiles
+
+        monkeypatch.setattr(floor_plan_tiles.ImageTk, "PhotoImage", lambda image: image)
+        canvas = FakeCanvas()
+        layer = floor_plan_tiles.BackgroundLayer(pyramid, pyramid.size)
+        layer.render(canvas, 1.0, (0, 0, 300, 200))
+        assert layer.visible == ((0, 0, 0), (0, 1, 0))
+        layer.set_viewport(canvas, (600, 300, 900, 500))
+        assert layer.visible == ((0, 2, 1), (0, 3, 1))
+        assert canvas.deleted == [1, 2]
+
+
+@pytest.fixture
+def grid():
+    from src.interfaces.components.floor_plan_spatial import SpatialGrid
+
+    return SpatialGrid.build(
+        {
+            "S1": (10, 10, "sensor"),
+            "M1": (70, 20, "motion"),
+            "C1": (200, 150, "camera"),
+            "S2": (-30, 400, "sensor"),
+        },
+        cell_size=50,
+    )
+
+
+class TestSpatialGrid:
+    def test_query_rect_includes_edges_and_any_corner_order(self, grid):
+        assert sorted(grid.query_rect(200, 150, 10, 10)) == ["C1", "M1", "S1"]
+        assert grid.query_rect(11, 11, 69, 19) == []
+
+    def test_query_rect_filters_types(self, grid):
+        assert sorted(grid.query_rect(-100, -100, 500, 500, types=("sensor",))) == ["S1", "S2"]
+
+    def test_large_area_walks_occupied_cells(self, grid):
+        assert sorted(grid.query_rect(-1e6, -1e6, 1e6, 1e6)) == ["C1", "M1", "S1", "S2"]
+
+    def test_nearest_respects_radius(self, grid):
+        assert grid.nearest(12, 14, radius=12) == "S1"
+        assert grid.nearest(40, 15, radius=12) is None
+        assert grid.nearest(60, 18, radius=40) == "M1"
+
+    def test_insert_moves_and_remove_drops(self, grid):
+        grid.insert("S1", 205, 150, "sensor")
+        assert grid.query_rect(0, 0, 20, 20) == []
+        assert sorted(grid.query_rect(190, 140, 210, 160)) == ["C1", "S1"]
+        grid.remove("C1")
+        assert "C1" not in grid and len(grid) == 3
@@ -144,12 +144,13 @@ class TestSafeHomeControlPanelNoSystem:
 from unittest.mock import Mock, MagicMock
 
 @pytest.fixture
-def cp_unit_isolated():
+def cp_unit_isolated(widget):
     """
     Fixture for a ControlPanel instance, isolated from the System and Tkinter.
     It uses object.__new__ to bypass __init__ and manually sets attributes,
     attaching a mocked system and mocking out UI methods.
     """
+    from src.interfaces.async_dispatcher import AsyncDispatcher
     from src.interfaces.control_panel.control_panel import SafeHomeControlPanel
     from src.interfaces.control_panel.handlers import (
         PasswordHandler, SecurityActions, StateTransitions,
@@ -184,15 +185,17 @@ def cp_unit_isolated():
     cp._alarm = AlarmHandler(cp)
     cp._transitions = StateTransitions(cp)
     cp._security = SecurityActions(cp)
+    cp._dispatcher = AsyncDispatcher(cp.send_request, widget)
 
-    return cp, mock_system
+    yield cp, mock_system
+    cp._dispatcher.shutdown()
 
 class TestSafeHomeControlPanelUnit:
     """
     Unit tests for SafeHomeControlPanel focusing on specific method logic
     as described in the adapted test cases from 미팅로그.pdf.
     """
-    def test_tc_shcp_01_do_system_order(self, cp_unit_isolated):
+    def test_tc_shcp_01_do_system_order(self, cp_unit_isolated, widget):
         """TC-SHCP-01: Verify button press sends correct command to system."""
         cp, mock_system = cp_unit_isolated
         # Set state to logged in to allow arming
@@ -200,10 +203,11 @@ class TestSafeHomeControlPanelUnit:
         
         # Press the 'AWAY' button
         cp.button7()
+        widget.run_pending()
         
         # Verify that the system was called correctly.
         # We use assert_any_call because the method also calls _update_leds,
-        # which triggers a second call to handle_request ('get_status').
+        # which subscribes to status events on first use.
         mock_system.handle_request.assert_any_call(
             'control_panel', 'arm_system', mode='AWAY'
         )
@@ -220,7 +224,7 @@ class TestSafeHomeControlPanelUnit:
         # Password buffer is now in password handler
         assert cp._password._pw_buffer == "123"
 
-    def test_tc_shcp_03_lock_mechanism(self, cp_unit_isolated):
+    def test_tc_shcp_03_lock_mechanism(self, cp_unit_isolated, widget):
         """TC-SHCP-03: Verify system locks after 3 failed login attempts."""
         cp, mock_system = cp_unit_isolated
 
@@ -239,12 +243,32 @@ class TestSafeHomeControlPanelUnit:
         for i in range(3):
             cp._password._pw_buffer = f"123{i}"
             cp._transitions.try_login()
+            widget.run_pending()
             if i < 2:
                 assert cp._state == cp.STATE_IDLE
 
         # After 3rd failure, state should be LOCKED
         assert cp._state == cp.STATE_LOCKED
 
+    def test_keypad_login_runs_off_the_tk_thread(self, cp_unit_isolated, widget):
+        """Login is sent through the dispatcher; the result is applied on the Tk thread."""
+        import threading
+
+        cp, mock_system = cp_unit_isolated
+        handled_on = {}
+        mock_system.handle_request.side_effect = lambda source, command, **kw: (
+            handled_on.setdefault(command, threading.current_thread())
+            and {"success": True, "access_level": "MASTER"}
+        )
+
+        cp._password._pw_buffer = "1234"
+        cp._transitions.try_login()
+        assert cp._state == cp.STATE_IDLE
+
+        widget.run_pending()
+        assert cp._state == cp.STATE_LOGGED_IN
+        assert handled_on["login_control_panel"] is not threading.current_thread()
+
     # TC-SHCP-04 (matchNewPasswords) is not implemented because the functionality
     # does not exist in the current implementation of SafeHomeControlPanel.
     # The panel accepts a new password and sends it directly to the system
@@ -300,4 +324,83 @@ class TestSafeHomeControlPanelUnit:
 
         assert cp._password._pw_buffer == ""
         assert cp._password.access_level is None
-        assert cp._password.get_remaining_attempts() == 3
\ No newline at end of file
+        assert cp._password.get_remaining_attempts() == 3
+
+
+@pytest.fixture
+def cp_with_leds(system, widget):
+    """Logged-in panel on a real System, with LED and indicator setters recorded."""
+    from src.interfaces.control_panel.control_panel import SafeHomeControlPanel
+    from src.interfaces.control_panel.handlers import (
+        PasswordHandler, SecurityActions, DisplayHandler, SystemHandler
+    )
+
+    cp = object.__new__(SafeHomeControlPanel)
+    cp._system = system
+    cp._state = SafeHomeControlPanel.STATE_LOGGED_IN
+    cp.leds = {}
+    cp.after = widget.after
+    cp.set_display_short_message1 = Mock()
+    cp.set_display_short_message2 = Mock()
+    cp.set_armed_led = lambda on: cp.leds.__setitem__("armed", on)
+    cp.set_display_away = lambda on: cp.leds.__setitem__("away", on)
+    cp.set_display_stay = lambda on: cp.leds.__setitem__("stay", on)
+    cp._display = DisplayHandler(cp)
+    cp._password = PasswordHandler(cp)
+    cp._system_ctrl = SystemHandler(cp)
+    cp._security = SecurityActions(cp)
+    system.handle_request("control_panel", "turn_on")
+    cp._display.subscribe_status()
+
+    commands = []
+    handle = system.handle_request
+    system.handle_request = lambda source, command, **kw: commands.append(command) or handle(
+        source, command, **kw
+    )
+    cp.commands = commands
+    yield cp
+    cp._display.unsubscribe_status()
+
+
+class TestControlPanelStatusEvents:
+    """LEDs follow pushed mode/alarm events instead of polling get_status."""
+
+    def test_arm_and_disarm_update_leds_without_get_status(self, cp_with_leds, widget):
+        cp = cp_with_leds
+        cp._security.arm("AWAY")
+        widget.run_pending()
+        assert cp.leds == {"armed": True, "away": True, "stay": False}
+
+        cp._system.handle_request("control_panel", "disarm_system")
+        cp._update_leds()
+        assert cp.leds == {"armed": False, "away": False, "stay": False}
+        assert "get_status" not in cp.commands
+        assert cp.commands == ["arm_system", "disarm_system"]
+
+    def test_changes_from_other_interfaces_are_pushed(self, cp_with_leds):
+        cp = cp_with_leds
+        cp._system.handle_request("web", "arm_system", mode="HOME")
+        assert cp.leds == {"armed": True, "away": False, "stay": True}
+        cp._system.handle_request("web", "disarm_system")
+        assert cp.leds == {"armed": False, "away": False, "stay": False}
+
+    def test_events_from_worker_threads_are_applied_on_the_tk_thread(self, cp_with_leds, widget):
+        import threading
+
+        cp = cp_with_leds
+        worker = threading.Thread(
+            target=cp._system.handle_request, args=("web", "arm_system"), kwargs={"mode": "AWAY"}
+        )
+        worker.start()
+        worker.join()
+        assert cp.leds.get("away") is False  # nothing touched Tk from the worker
+        widget.run_pending()
+        assert cp.leds["away"] is True
+        assert widget.scheduled == []  # no polling left behind
+
+    def test_panel_that_is_off_keeps_leds_dark(self, cp_with_leds):
+        cp = cp_with_leds
+        cp._state = cp.STATE_OFF
+        cp.leds.clear()
+        cp._system.handle_request("web", "arm_system", mode="AWAY")
+        assert cp.leds == {}
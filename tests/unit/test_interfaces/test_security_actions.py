@@ -10,9 +10,9 @@ class DummySystemCtrl:
         self.arm_calls = []
         self.panic_called = False
 
-    def arm(self, mode):
+    def arm(self, mode, callback):
         self.arm_calls.append(mode)
-        return self.next_response
+        callback(self.next_response)
 
     def panic(self):
         self.panic_called = True
@@ -23,10 +23,10 @@ class DummyPassword:
         self.responses = responses
         self.calls = 0
 
-    def verify_master_code(self):
+    def verify_master_code(self, callback):
         resp = self.responses[self.calls]
         self.calls += 1
-        return resp
+        callback(resp)
 
 
 class DummyDisplay:
@@ -69,7 +69,7 @@ class DummyPanel:
     def exit_panic_verification(self):
         self.exit_panic_called += 1
 
-    def send_request(self, action):
+    def send_request_async(self, action, callback=None):
         self.clear_requests.append(action)
 
     def show_panic_lock(self, message, seconds):
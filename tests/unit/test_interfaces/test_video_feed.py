@@ -0,0 +1,132 @@
+"""Tests for the single camera view's VideoFeedManager pacing and PhotoImage reuse"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+from src.interfaces.pages.single_camera_view.video_feed import VideoFeedManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def page():
+    page = Mock()
+    page._cam_id = 1
+    page._is_visible = True
+    page._lock_manager.is_locked_silent.return_value = False
+    page._video.winfo_viewable.return_value = True
+    page._video.image = None
+    page._frame.after.return_value = "job"
+    return page
+
+
+@pytest.fixture
+def subscription():
+    sub = Mock()
+    sub.poll.return_value = None
+    return sub
+
+
+@pytest.fixture
+def feed(page, subscription):
+    page.send_to_system.return_value = {"success": True, "subscription": subscription}
+    manager = VideoFeedManager(page)
+    manager._clock = FakeClock()
+    return manager
+
+
+def scheduled_delay(page):
+    return page._frame.after.call_args[0][0]
+
+
+class TestVideoFeedPacing:
+    def test_idle_rate_is_fps(self, feed, page):
+        feed.start()
+        assert scheduled_delay(page) == 1000 // VideoFeedManager.FPS
+
+    def test_unchanged_frame_leaves_label_alone(self, feed, page, subscription):
+        feed.start()
+        subscription.poll.assert_called_once()
+        page._video.config.assert_not_called()
+
+    def test_hidden_window_backs_off_without_polling(self, feed, page, subscription):
+        page._video.winfo_viewable.return_value = False
+        feed.start()
+        subscription.poll.assert_not_called()
+        assert scheduled_delay(page) == VideoFeedManager.HIDDEN_INTERVAL_MS
+
+    def test_boost_raises_rate_then_expires(self, feed, page):
+        feed.start()
+        page._frame.after.reset_mock()
+
+        feed.boost()
+        page._frame.after_cancel.assert_called_once_with("job")
+        assert scheduled_delay(page) == 1000 // VideoFeedManager.ACTIVE_FPS
+
+        feed._clock.now += VideoFeedManager.ACTIVE_SECONDS + 0.1
+        assert feed.next_delay() == 1000 // VideoFeedManager.FPS
+
+    def test_active_fps_is_configurable(self, page):
+        manager = VideoFeedManager(page, active_fps=50)
+        manager.boost()
+        assert manager.next_delay() == 20
+
+    def test_boost_while_stopped_does_not_start_loop(self, feed, page):
+        feed.boost()
+        page._frame.after.assert_not_called()
+
+
+class TestVideoFeedPhotoReuse:
+    @pytest.fixture
+    def photo_image(self):
+        with patch(
+            "src.interfaces.pages.single_camera_view.video_feed.ImageTk.PhotoImage"
+        ) as factory:
+            factory.side_effect = lambda img: Mock(
+                width=Mock(return_value=img.size[0]),
+                height=Mock(return_value=img.size[1]),
+            )
+            yield factory
+
+    def test_frames_are_pasted_into_one_photo(self, feed, page, subscription, photo_image):
+        first, second = Image.new("RGB", (40, 30)), Image.new("RGB", (40, 30))
+        subscription.poll.return_value = first
+        feed.start()
+        photo = page._video.image
+
+        subscription.poll.return_value = second
+        feed._update()
+
+        photo_image.assert_called_once_with(first)
+        photo.paste.assert_called_once_with(second)
+        assert page._video.config.call_count == 1
+        assert page._video.image is photo
+
+    def test_resized_frame_allocates_new_photo(self, feed, page, subscription, photo_image):
+        subscription.poll.return_value = Image.new("RGB", (40, 30))
+        feed.start()
+        subscription.poll.return_value = Image.new("RGB", (80, 60))
+        feed._update()
+
+        assert photo_image.call_count == 2
+        assert page._video.image.width() == 80
+
+    def test_photo_reattached_after_blank(self, feed, page, subscription, photo_image):
+        subscription.poll.return_value = Image.new("RGB", (40, 30))
+        feed.start()
+        photo = page._video.image
+        page._video.image = None  # blank_video / lock screen cleared the label
+
+        feed._update()
+
+        photo.paste.assert_called_once()
+        page._video.config.assert_called_with(image=photo, text="")
+        assert page._video.image is photo
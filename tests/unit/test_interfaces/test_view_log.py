@@ -0,0 +1,196 @@
+"""
+Unit tests for the incrementally loaded event log view (LogTable, ViewLogPage).
+"""
+from collections import deque
+from unittest.mock import Mock
+
+import pytest
+
+from src.interfaces.pages.view_log.log_table import LogTable
+from src.interfaces.pages.view_log.view_log_page import ViewLogPage
+
+
+class FakeTree:
+    """Keeps Treeview rows in a list and counts inserts."""
+
+    def __init__(self):
+        self.rows = []
+        self.inserts = 0
+
+    def insert(self, parent, index, values, tags=()):
+        self.inserts += 1
+        item = f"I{self.inserts}"
+        self.rows.insert(len(self.rows) if index == "end" else index, (item, values))
+        return item
+
+    def get_children(self):
+        return tuple(item for item, _ in self.rows)
+
+    def delete(self, *items):
+        self.rows = [row for row in self.rows if row[0] not in items]
+
+    def details(self):
+        return [values[2] for _, values in self.rows]
+
+
+class FakeField:
+    def __init__(self, value=""):
+        self.value = value
+        self.options = {}
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+
+def make_table(page=None):
+    table = object.__new__(LogTable)
+    table._page = page or Mock()
+    table._tree = FakeTree()
+    table._scrollbar = Mock()
+    table._latest_id = table._oldest_id = None
+    table._has_more = table._has_newer = False
+    table._items = deque()
+    return table
+
+
+def rows(*ids):
+    return [{"log_id": i, "timestamp": "-", "event": "ARM", "detail": f"event {i}"} for i in ids]
+
+
+class TestLogTable:
+    def test_prepend_and_append_keep_newest_first(self):
+        table = make_table()
+        table.load(rows(5, 4, 3), has_more=True)
+        table.prepend(rows(7, 6))
+        table.append(rows(2, 1))
+        assert table._tree.details() == [f"event {i}" for i in (7, 6, 5, 4, 3, 2, 1)]
+        assert (table.latest_id, table.oldest_id, table.row_count) == (7, 1, 7)
+        assert table.has_more is False
+
+    def test_scrolling_near_the_end_asks_for_older_rows(self):
+        page = Mock()
+        table = make_table(page)
+        table.load(rows(3, 2), has_more=True)
+        table._on_scroll("0.0", "0.5")
+        page.load_older.assert_not_called()
+        table._on_scroll("0.4", "0.95")
+        page.load_older.assert_called_once_with()
+        table._scrollbar.set.assert_called_with("0.4", "0.95")
+
+    def test_appending_past_max_rows_drops_the_newest(self, monkeypatch):
+        monkeypatch.setattr(LogTable, "MAX_ROWS", 4)
+        page = Mock()
+        table = make_table(page)
+        table.load(rows(6, 5, 4), has_more=True)
+        table.append(rows(3, 2), has_more=True)
+        assert table._tree.details() == [f"event {i}" for i in (5, 4, 3, 2)]
+        assert (table.latest_id, table.oldest_id, table.row_count) == (5, 2, 4)
+        assert table.has_newer is True
+
+        table._on_scroll("0.05", "0.5")
+        page.load_newer.assert_called_once_with()
+
+    def test_prepending_past_max_rows_drops_the_oldest(self, monkeypatch):
+        monkeypatch.setattr(LogTable, "MAX_ROWS", 4)
+        table = make_table()
+        table.load(rows(4, 3, 2), has_more=False)
+        table.prepend(rows(6, 5))
+        assert table._tree.details() == [f"event {i}" for i in (6, 5, 4, 3)]
+        assert (table.latest_id, table.oldest_id, table.row_count) == (6, 3, 4)
+        assert (table.has_more, table.has_newer) == (True, False)
+
+    def test_clear_resets_cursors(self):
+        table = make_table()
+        table.load(rows(2, 1), has_more=True)
+        table.clear()
+        assert table._tree.rows == []
+        assert (table.latest_id, table.oldest_id, table.has_more) == (None, None, False)
+
+
+@pytest.fixture
+def page(system):
+    page = object.__new__(ViewLogPage)
+    page._loading, page._generation = False, 0
+    page._event, page._since, page._until = FakeField(ViewLogPage.ALL_EVENTS), FakeField(), FakeField()
+    page._status = FakeField()
+    page._table = make_table(page)
+    page.requests = []
+
+    def send(command, callback, **kwargs):
+        page.requests.append(kwargs)
+        callback(system.handle_request("web", command, **kwargs))
+
+    page.send_message_async = send
+    storage = system._storage
+    storage.execute_update("DELETE FROM logs")
+    for i in range(150):
+        storage.save_log({"event_type": "PANIC" if i % 3 == 0 else "ARM", "description": f"event {i}"})
+    return page
+
+
+class TestViewLogPage:
+    def test_refresh_inserts_only_new_entries(self, page, system):
+        page._load()
+        tree = page._table._tree
+        assert tree.inserts == 100
+        assert page._status.options["text"] == "Showing 100 entries (scroll for older)"
+
+        page._load()
+        assert tree.inserts == 100  # nothing new, nothing inserted
+        system._storage.save_log({"event_type": "INTRUSION", "description": "new"})
+        page._load()
+        assert tree.inserts == 101
+        assert tree.details()[0] == "new"
+
+    def test_scrolling_loads_older_pages_once(self, page):
+        page._load()
+        cursor = page._table.oldest_id
+        page.load_older()
+        page.load_older()
+        assert page._table.row_count == 150
+        assert page._table._tree.details()[-1] == "event 0"
+        assert page.requests == [{}, {"before_id": cursor}]
+
+    def test_scrolling_back_up_reloads_dropped_rows(self, page, monkeypatch):
+        monkeypatch.setattr(LogTable, "MAX_ROWS", 120)
+        page._load()
+        page.load_older()
+        table = page._table
+        assert table.row_count == 120
+        assert table._tree.details()[0] == "event 119"
+        assert table.has_newer is True
+
+        page.load_newer()
+        assert table._tree.details()[0] == "event 149"
+        assert table.row_count == 120
+        assert (table.has_newer, table.has_more) == (False, True)
+
+    def test_filters_reload_through_the_system(self, page):
+        page._load()
+        page._event.set("PANIC")
+        page._apply_filters()
+        assert page.requests[-1] == {"event_type": "PANIC"}
+        assert page._table.row_count == 50
+        assert set(values[1] for _, values in page._table._tree.rows) == {"PANIC"}
+
+    def test_invalid_date_reports_error(self, page):
+        page._since.set("not-a-date")
+        page._apply_filters()
+        assert "Invalid date" in page._status.options["text"]
+        assert page._loading is False
+
+    def test_stale_answers_after_reset_are_ignored(self, page):
+        pending = []
+        page.send_message_async = lambda command, callback, **kw: pending.append(callback)
+        page._load()
+        page._clear()
+        pending[0]({"success": True, "data": rows(9), "has_more": False})
+        assert page._table.row_count == 0
@@ -35,7 +35,27 @@ class TestWebInterface:
         assert 'login' in PAGE_CLASSES
         assert 'security' in PAGE_CLASSES
         assert 'surveillance' in PAGE_CLASSES
-    
+
+    def test_page_registry_imports_pages_on_first_use(self):
+        """Pages are registered by import string and resolved when requested"""
+        from src.interfaces.page_registry import PAGE_MODULES, get_page_class, get_all_page_names
+        from src.interfaces.pages.view_log_page import ViewLogPage
+
+        assert get_all_page_names() == list(PAGE_MODULES)
+        assert get_page_class('view_log') is ViewLogPage
+        assert get_page_class('no_such_page') is None
+
+    def test_package_exports_resolve_lazily(self):
+        """Package-level names still import, just on first access"""
+        import src.interfaces as interfaces
+        from src.interfaces import pages
+        from src.interfaces.components.page import Page
+
+        assert interfaces.WebInterface.__name__ == 'WebInterface'
+        assert issubclass(pages.SecurityPage, Page)
+        with pytest.raises(AttributeError):
+            pages.NoSuchPage
+
     def test_send_message_no_system(self):
         """Test error handling when System is not connected"""
         from src.interfaces.web_interface import WebInterface
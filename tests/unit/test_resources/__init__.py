@@ -0,0 +1,2 @@
+# resources tests package
+
@@ -0,0 +1,83 @@
+"""
+Unit tests for the process-wide image asset cache.
+"""
+
+import threading
+
+import pytest
+from PIL import Image
+
+from src.resources.image_cache import ImageAssetCache
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "camera1.jpg"
+    Image.new("RGB", (64, 48), "red").save(path)
+    return path
+
+
+@pytest.fixture
+def counting_cache(monkeypatch):
+    cache = ImageAssetCache()
+    calls = []
+    original = ImageAssetCache._decode
+
+    def decode(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(cache, "_decode", decode)
+    return cache, calls
+
+
+class TestImageAssetCache:
+    def test_load_decodes_once_per_absolute_path(self, counting_cache, image_path, monkeypatch):
+        cache, calls = counting_cache
+        first = cache.load(image_path)
+        monkeypatch.chdir(image_path.parent)
+        assert cache.load("camera1.jpg") is first
+        assert len(calls) == 1
+        assert first.size == (64, 48) and first.mode == "RGB"
+
+    def test_concurrent_loads_share_one_decode(self, counting_cache, image_path):
+        cache, calls = counting_cache
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.load(image_path)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert all(image is results[0] for image in results)
+
+    def test_prefetch_runs_in_background(self, counting_cache, image_path):
+        cache, calls = counting_cache
+        cache.prefetch([image_path, image_path])
+        assert image_path in cache
+        cache.load(image_path)
+        assert len(calls) == 1
+
+    def test_missing_file_is_not_cached(self, tmp_path):
+        cache = ImageAssetCache()
+        missing = tmp_path / "camera9.jpg"
+        with pytest.raises(FileNotFoundError):
+            cache.load(missing)
+        assert missing not in cache
+        Image.new("RGB", (8, 8)).save(missing)
+        assert cache.load(missing).size == (8, 8)
+
+    def test_derive_builds_once_and_evict_drops_it(self, image_path):
+        cache = ImageAssetCache()
+        builds = []
+        build = lambda image: builds.append(image) or image.size
+        assert cache.derive(image_path, "size", build) == (64, 48)
+        assert cache.derive(image_path, "size", build) == (64, 48)
+        assert len(builds) == 1
+        cache.evict(image_path)
+        assert image_path not in cache
+        cache.derive(image_path, "size", build)
+        assert len(builds) == 2
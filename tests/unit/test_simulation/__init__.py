@@ -0,0 +1,2 @@
+# simulation tests package
+
@@ -0,0 +1,137 @@
+"""
+Unit tests for the headless sensor load generator and scenario replay.
+"""
+
+import pytest
+
+from src.configuration.storage_manager import StorageManager
+from src.core.system import System
+from src.simulation import Scenario, ScenarioEvent, SensorLoadGenerator
+from src.simulation.load_generator import summarize_latencies
+
+
+@pytest.fixture
+def system(tmp_path):
+    StorageManager._instance = None  # type: ignore[attr-defined]
+    system = System(str(tmp_path / "load_safehome.db"))
+    yield system
+    system._storage.disconnect()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestScenario:
+    def test_randomized_is_deterministic_for_seed(self):
+        first = Scenario.randomized(5, 3, 40, rate=10, seed=11)
+        second = Scenario.randomized(5, 3, 40, rate=10, seed=11)
+
+        assert first.events == second.events
+        assert first.events[1].at == pytest.approx(0.1)
+
+    def test_randomized_respects_max_open(self):
+        scenario = Scenario.randomized(3, 0, 200, seed=2, max_open=10)
+        opened = set()
+        for event in scenario.events:
+            if event.action == "intrude":
+                assert event.sensor_id not in opened
+                opened.add(event.sensor_id)
+            else:
+                opened.remove(event.sensor_id)
+            assert len(opened) <= 3
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        scenario = Scenario.scripted(
+            1, 1, [("LW1", "intrude"), ("LW1", "release"), ("LM1", "intrude")], rate=2
+        )
+        path = tmp_path / "scenario.json"
+        scenario.save(str(path))
+
+        loaded = Scenario.load(str(path))
+
+        assert loaded == scenario
+        assert loaded.events[2] == ScenarioEvent(1.0, "LM1", "intrude")
+
+    def test_unknown_action_rejected(self):
+        with pytest.raises(ValueError):
+            ScenarioEvent(0.0, "LW1", "explode")
+
+
+class TestSensorLoadGenerator:
+    def test_populate_adds_armed_sensors_through_controller(self, system):
+        generator = SensorLoadGenerator(system)
+        before = len(system.sensor_controller.getAllSensors())
+
+        created = generator.populate(Scenario(4, 2))
+
+        assert created == ["LW1", "LW2", "LW3", "LW4", "LM1", "LM2"]
+        assert len(system.sensor_controller.getAllSensors()) == before + 6
+        assert all(system.sensor_service.get_sensor(sid).isArmed() for sid in created)
+
+        generator.teardown()
+        assert len(system.sensor_controller.getAllSensors()) == before
+        assert not system.sensor_service.has_sensor("LW1")
+
+    def test_run_reports_alarm_per_trigger(self, system):
+        scenario = Scenario.scripted(
+            2,
+            1,
+            [
+                ("LW1", "intrude"),
+                ("LW1", "release"),
+                ("LM1", "intrude"),
+                ("LM1", "release"),
+            ],
+        )
+
+        report = SensorLoadGenerator(system).run(scenario, realtime=False)
+
+        assert report.events == 4
+        assert report.alarms == 2
+        assert report.alarm_sequence == ["LW1", "LM1"]
+        assert report.latency_ms["count"] == 2
+        assert report.masked_triggers == 0
+        # arm + 4 polls + 2 clears
+        assert report.requests == 7
+
+    def test_realtime_run_paces_events(self, system):
+        clock = FakeClock()
+        scenario = Scenario.scripted(1, 0, [("LW1", "intrude"), ("LW1", "release")], rate=4)
+
+        SensorLoadGenerator(system, clock=clock, sleep=clock.sleep).run(scenario)
+
+        assert clock.slept == [pytest.approx(0.25)]
+
+    def test_replay_produces_same_alarm_sequence(self, system, tmp_path):
+        scenario = Scenario.randomized(20, 5, 60, seed=5)
+        path = tmp_path / "recorded.json"
+        scenario.save(str(path))
+
+        first = SensorLoadGenerator(system).run(scenario, realtime=False)
+        StorageManager._instance = None  # type: ignore[attr-defined]
+        replay_system = System(str(tmp_path / "replay.db"))
+        replay = SensorLoadGenerator(replay_system).run(Scenario.load(str(path)), realtime=False)
+        replay_system._storage.disconnect()
+
+        assert replay.alarm_sequence == first.alarm_sequence
+        assert replay.events == first.events == 60
+
+
+def test_summarize_latencies():
+    summary = summarize_latencies([0.001, 0.002, 0.003, 0.004])
+
+    assert summary["count"] == 4
+    assert summary["mean"] == pytest.approx(2.5)
+    assert summary["p50"] == pytest.approx(2.0)
+    assert summary["max"] == pytest.approx(4.0)
+    assert summarize_latencies([]) == {"count": 0}